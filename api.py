@@ -1,39 +1,160 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Header, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
 from pydantic import BaseModel
+import asyncio
 import json
 import os
 import datetime
-import random
-import string
-import unicodedata
 import re
-import hashlib
 import redis
+import redis.asyncio
 from typing import Optional, Dict, List
 from dotenv import load_dotenv
 
 # Charger les variables d'environnement
 load_dotenv()
-from list import choose_random_word, DICTIONARIES
-from hangman_art import draw_progress_bar
-
-app = FastAPI(title="Pendu Terminal API", version="1.0.0")
-
-# Redis connection
+from list import choose_random_word_record, get_word_record, letters_from_mask, DICTIONARIES
+from hangman_art import draw_progress_bar, frame_id, parse_frame_id, FRAMES
+from engine import (
+    HangmanGame, DIFFICULTY_LEVELS, PLAYING, WON, LOST, display_masked_word
+)
+from storage import (
+    STATS_INDEX_KEY, DIFFICULTY_NAMES, MIGRATION_LOCK_KEY,
+    HISTORY_KINDS, player_stats_key, history_key, append_history,
+    LEADERBOARDS, WINRATE_MIN_GAMES, UPDATE_RECORDS_SCRIPT, UPDATE_WIN_SCORES_SCRIPT,
+    rollups_key, rollup_field, language_stats_from_rollups,
+    decode_player_stats, account_key, migrate_json_to_redis
+)
+from sessions import create_game_store
+from stats_queue import StatsWriteBehind
+from metrics import Registry, Counter, Gauge, Histogram, RequestTimer
+from profiler import SamplingProfiler, ProfilerMiddleware
+from static_assets import StaticAssets, BROTLI_AVAILABLE, IMMUTABLE_CACHE, REVALIDATE_CACHE, etag_matches
+from auth import (
+    SESSION_SECRET_FROM_ENV, hash_password, verify_password, create_session_token, verify_session_token,
+    verify_admin_token
+)
+
+@asynccontextmanager
+async def lifespan(app):
+    if not SESSION_SECRET_FROM_ENV:
+        print("⚠️ SESSION_SECRET non défini : secret aléatoire propre à ce worker. Avec plusieurs "
+              "workers, les jetons émis par l'un seront refusés par les autres et tous les joueurs "
+              "seront déconnectés au redémarrage. Définissez SESSION_SECRET en production.")
+    if MIGRATE_ON_STARTUP:
+        await migrate_on_startup()
+    if not BROTLI_AVAILABLE:
+        print("⚠️ Module brotli absent : fichiers statiques compressés en gzip uniquement (pip install brotli)")
+    static_assets.load()  # Fichiers statiques lus et compressés une fois par worker
+    sweeper = asyncio.create_task(sweep_games_periodically())
+    stats_writer.start()
+    yield
+    sweeper.cancel()
+    # Écrire les fins de partie encore en file avant l'arrêt du worker
+    await stats_writer.close()
+
+app = FastAPI(title="Pendu Terminal API", version="1.0.0", lifespan=lifespan)
+
+# Métriques au format Prometheus (/metrics), propres à chaque worker
+metrics = Registry()
+REQUEST_LATENCY = metrics.register(Histogram(
+    "pendu_http_request_duration_seconds", "Durée des requêtes HTTP", ("method", "route", "status")
+))
+REDIS_LATENCY = metrics.register(Histogram(
+    "pendu_redis_operation_duration_seconds", "Durée des opérations Redis (sérialisation comprise)", ("operation",)
+))
+GAMES_STARTED = metrics.register(Counter(
+    "pendu_games_started_total", "Parties commencées", ("difficulty", "language")
+))
+GAMES_FINISHED = metrics.register(Counter(
+    "pendu_games_finished_total", "Parties terminées (un mot en mode infini)", ("difficulty", "language", "result")
+))
+metrics.register(Gauge(
+    "pendu_games_stored", "Parties en mémoire (stockage memory uniquement)", lambda: game_store.stats().get("games")
+))
+metrics.register(Gauge(
+    "pendu_stats_queue_depth", "Fins de partie en attente d'écriture", lambda: stats_writer.stats()["queue_depth"]
+))
+app.add_middleware(RequestTimer, histogram=REQUEST_LATENCY)
+
+# Profileur par échantillonnage, inactif tant qu'un administrateur ne le démarre pas
+profiler = SamplingProfiler()
+app.add_middleware(ProfilerMiddleware, profiler=profiler)
+
+# Redis connection (client asynchrone, pool borné : les requêtes attendent une connexion libre)
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
-redis_client = redis.from_url(REDIS_URL, decode_responses=True)
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+redis_pool = redis.asyncio.BlockingConnectionPool.from_url(
+    REDIS_URL, max_connections=REDIS_MAX_CONNECTIONS, timeout=5, decode_responses=True
+)
+redis_client = redis.asyncio.Redis(connection_pool=redis_pool)
+# Scripts des fins de partie, exécutés dans la transaction de write_stats_batch
+update_records = redis_client.register_script(UPDATE_RECORDS_SCRIPT)
+update_win_scores = redis_client.register_script(UPDATE_WIN_SCORES_SCRIPT)
+
+# Migration au démarrage (désactivable si `python migrate.py` est lancé au déploiement)
+MIGRATE_ON_STARTUP = os.getenv("MIGRATE_ON_STARTUP", "1") != "0"
+MIGRATION_LOCK_TTL = int(os.getenv("MIGRATION_LOCK_TTL", "300"))
+
+async def migrate_on_startup():
+    """Vérifie Redis et migre les anciennes données, un seul worker à la fois.
+
+    Le premier worker qui prend le verrou Redis fait la migration (client synchrone
+    dans un thread) ; les autres attendent qu'il la termine au lieu de la rejouer.
+    """
+    try:
+        await redis_client.ping()
+        print("✅ Connexion Redis établie")
+    except Exception as e:
+        print(f"❌ Erreur de connexion Redis: {e}")
+        print("L'application ne pourra pas fonctionner sans Redis")
+        return
 
-# Serve static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
+    worker_id = f"{os.getpid()}:{datetime.datetime.now().timestamp()}"
+    if not await redis_client.set(MIGRATION_LOCK_KEY, worker_id, nx=True, ex=MIGRATION_LOCK_TTL):
+        # Un autre worker migre : attendre la libération du verrou
+        while await redis_client.exists(MIGRATION_LOCK_KEY):
+            await asyncio.sleep(0.2)
+        return
+
+    try:
+        def migrate():
+            with redis.from_url(REDIS_URL, decode_responses=True) as client:
+                migrate_json_to_redis(client)
+        await asyncio.to_thread(migrate)
+    finally:
+        if await redis_client.get(MIGRATION_LOCK_KEY) == worker_id:
+            await redis_client.delete(MIGRATION_LOCK_KEY)
+
+# Serve static files (en mémoire, URL avec empreinte, ETag et variantes compressées)
+static_assets = StaticAssets("static")
+
+def asset_response(request: Request, asset, cache_control):
+    """Réponse pour un fichier statique : 304 si l'ETag correspond, sinon la meilleure variante compressée"""
+    encoding = asset.choose_encoding(request.headers.get("accept-encoding"))
+    headers = {"ETag": asset.etag(encoding), "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(asset.variants[encoding], media_type=asset.media_type, headers=headers)
+
+@app.api_route("/static/{filename}", methods=["GET", "HEAD"], include_in_schema=False)
+async def get_static_file(filename: str, request: Request):
+    asset, hashed = static_assets.get(filename)
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return asset_response(request, asset, IMMUTABLE_CACHE if hashed else REVALIDATE_CACHE)
 
 # Game models
 class GameStart(BaseModel):
     player_name: str
-    password: str
+    password: Optional[str] = None
+    token: Optional[str] = None  # Jeton de session reçu à la connexion (évite le mot de passe)
     difficulty: str
     language: str = "fr"  # Langue par défaut : français
+    infinite: bool = False  # Mode infini : les mots s'enchaînent dans la même partie
 
 class PlayerLogin(BaseModel):
     player_name: str
@@ -43,6 +164,26 @@ class GameGuess(BaseModel):
     game_id: str
     guess: str
     hint_requested: bool = False
+    timeout: bool = False  # Temps écoulé côté client : coûte une vie
+    token: Optional[str] = None
+    compact: bool = False  # Réponse réduite au delta (voir game_delta)
+    art_id: bool = False  # progress_art_id (image à récupérer via /api/art) au lieu du dessin
+
+class GuessStep(BaseModel):
+    guess: str = ""
+    hint_requested: bool = False
+    timeout: bool = False
+
+class GameGuessSequence(BaseModel):
+    game_id: str
+    guesses: List[GuessStep]
+
+class GameGuessBatch(BaseModel):
+    games: List[GameGuessSequence]
+    token: Optional[str] = None
+    steps: bool = False  # Retourner aussi l'état après chaque proposition
+    compact: bool = False  # États intermédiaires sous forme de deltas
+    art_id: bool = False
 
 class GameResponse(BaseModel):
     game_id: str
@@ -53,168 +194,96 @@ class GameResponse(BaseModel):
     max_lives: int
     message: str
     progress_art: Optional[str] = None
+    progress_art_id: Optional[str] = None  # Avec art_id : identifiant de l'image (voir /api/art)
     hints_used: int = 0
     game_time: Optional[float] = None
     secret_word: Optional[str] = None  # Le vrai mot pour les fins de partie
+    words_found: Optional[int] = None  # Mode infini : mots trouvés dans la session
+    next_word_display: Optional[str] = None  # Mode infini : mot suivant, déjà enchaîné
+
+# Game storage: "memory" (un seul worker) ou "redis" (partagé entre workers uvicorn --workers N)
+GAME_STORE = os.getenv("GAME_STORE", "memory")
+GAME_TTL = int(os.getenv("GAME_TTL", "3600"))  # Inactivité max d'une partie en cours (secondes)
+FINISHED_GAME_TTL = int(os.getenv("FINISHED_GAME_TTL", "300"))  # Conservation d'une partie terminée
+MAX_GAMES = int(os.getenv("MAX_GAMES", "10000"))  # Plafond LRU du stockage mémoire
+GAME_SWEEP_INTERVAL = int(os.getenv("GAME_SWEEP_INTERVAL", "60"))
+game_store = create_game_store(
+    GAME_STORE, redis_client, ttl=GAME_TTL, finished_ttl=FINISHED_GAME_TTL, max_games=MAX_GAMES
+)
+if GAME_STORE == "redis":
+    game_store.get = REDIS_LATENCY.time("game_get")(game_store.get)
+    game_store.save = REDIS_LATENCY.time("game_save")(game_store.save)
+
+async def sweep_games_periodically():
+    """Tâche de fond : supprime régulièrement les parties expirées"""
+    while True:
+        await asyncio.sleep(GAME_SWEEP_INTERVAL)
+        try:
+            await game_store.sweep()
+        except Exception as e:
+            print(f"Erreur lors du nettoyage des parties: {e}")
 
-# In-memory game storage
-games = {}
-
-# Redis keys
-STATS_KEY = "pendu:stats"
-PLAYERS_KEY = "pendu:players"
-
-def load_stats():
-    """Charge les statistiques depuis Redis"""
-    try:
-        data = redis_client.get(STATS_KEY)
-        if data:
-            return json.loads(data)
-        return {}
-    except Exception as e:
-        print(f"Erreur lors du chargement des stats depuis Redis: {e}")
-        return {}
-
-def save_stats(stats):
-    """Sauvegarde les statistiques dans Redis"""
-    try:
-        redis_client.set(STATS_KEY, json.dumps(stats, ensure_ascii=False))
-    except Exception as e:
-        print(f"Erreur lors de la sauvegarde des stats dans Redis: {e}")
-
-def load_players():
-    """Charge les données des joueurs depuis Redis"""
+@REDIS_LATENCY.time("load_player_stats")
+async def load_player_stats(player_name):
+    """Charge les statistiques d'un seul joueur depuis Redis (sans l'historique)"""
     try:
-        data = redis_client.get(PLAYERS_KEY)
-        if data:
-            return json.loads(data)
-        return {}
+        mapping = await redis_client.hgetall(player_stats_key(player_name))
     except Exception as e:
-        print(f"Erreur lors du chargement des joueurs depuis Redis: {e}")
-        return {}
-
-def save_players(players):
-    """Sauvegarde les données des joueurs dans Redis"""
+        print(f"Erreur lors du chargement des stats de {player_name} depuis Redis: {e}")
+        return None
+
+    if not mapping:
+        return None
+    return decode_player_stats(mapping)
+
+@REDIS_LATENCY.time("load_history")
+async def load_history(player_name, kind="games", offset=0, limit=20):
+    """Page d'historique d'un joueur, de la plus récente à la plus ancienne"""
+    key = history_key(player_name, kind)
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.llen(key)
+    pipe.lrange(key, -(offset + limit), -(offset + 1))
+    total, entries = await pipe.execute()
+    return total, [json.loads(entry) for entry in reversed(entries)]
+
+@REDIS_LATENCY.time("load_account")
+async def load_account(player_name):
+    """Compte d'un joueur (password_hash, created_at, last_login) ou None"""
     try:
-        redis_client.set(PLAYERS_KEY, json.dumps(players, ensure_ascii=False))
+        account = await redis_client.hgetall(account_key(player_name))
     except Exception as e:
-        print(f"Erreur lors de la sauvegarde des joueurs dans Redis: {e}")
-
-def migrate_json_to_redis():
-    """Migre les données JSON existantes vers Redis si elles existent"""
-    # Migrer les stats
-    stats_file = "stats.json"
-    if os.path.exists(stats_file):
-        try:
-            with open(stats_file, "r", encoding="utf-8") as f:
-                stats_data = json.load(f)
-
-            # Vérifier si les données n'existent pas déjà dans Redis
-            if not redis_client.exists(STATS_KEY):
-                save_stats(stats_data)
-                print(f"✅ Migration des stats: {len(stats_data)} joueurs migrés vers Redis")
-            else:
-                print("⚠️ Stats déjà présentes dans Redis, migration ignorée")
-
-        except Exception as e:
-            print(f"❌ Erreur lors de la migration des stats: {e}")
-
-    # Migrer les joueurs
-    players_file = "players.json"
-    if os.path.exists(players_file):
-        try:
-            with open(players_file, "r", encoding="utf-8") as f:
-                players_data = json.load(f)
-
-            # Vérifier si les données n'existent pas déjà dans Redis
-            if not redis_client.exists(PLAYERS_KEY):
-                save_players(players_data)
-                print(f"✅ Migration des joueurs: {len(players_data)} comptes migrés vers Redis")
-            else:
-                print("⚠️ Joueurs déjà présents dans Redis, migration ignorée")
-
-        except Exception as e:
-            print(f"❌ Erreur lors de la migration des joueurs: {e}")
+        print(f"Erreur lors du chargement du compte de {player_name} depuis Redis: {e}")
+        return None
+    return account or None
 
-# Migration automatique au démarrage
-try:
-    # Test de connexion Redis
-    redis_client.ping()
-    print("✅ Connexion Redis établie")
-
-    # Migration des données JSON existantes
-    migrate_json_to_redis()
-
-except Exception as e:
-    print(f"❌ Erreur de connexion Redis: {e}")
-    print("L'application ne pourra pas fonctionner sans Redis")
-
-def hash_password(password: str) -> str:
-    """Hash le mot de passe avec SHA-256"""
-    return hashlib.sha256(password.encode()).hexdigest()
-
-def verify_player(player_name: str, password: str) -> bool:
+async def verify_player(player_name: str, password: str) -> bool:
     """Vérifie les identifiants d'un joueur"""
-    players = load_players()
-    if player_name not in players:
+    account = await load_account(player_name)
+    if account is None:
         return False
-    return players[player_name]["password_hash"] == hash_password(password)
-
-def register_player(player_name: str, password: str) -> bool:
-    """Enregistre un nouveau joueur"""
-    players = load_players()
-    if player_name in players:
+    valid, _ = await asyncio.to_thread(verify_password, password, account["password_hash"])
+    return valid
+
+async def authenticate_player(player_name: str, password: Optional[str] = None, token: Optional[str] = None) -> bool:
+    """Vérifie le jeton de session (sans accès Redis) ou, à défaut, le mot de passe"""
+    if token:
+        return verify_session_token(token) == player_name
+    if password:
+        return await verify_player(player_name, password)
+    return False
+
+@REDIS_LATENCY.time("register_player")
+async def register_player(player_name: str, password: str) -> bool:
+    """Crée le compte d'un joueur, sauf s'il existe déjà (HSETNX : une seule requête concurrente gagne)"""
+    password_hash = await asyncio.to_thread(hash_password, password)
+    key = account_key(player_name)
+    if not await redis_client.hsetnx(key, "password_hash", password_hash):
         return False
 
-    players[player_name] = {
-        "password_hash": hash_password(password),
-        "created_at": datetime.datetime.now().isoformat(),
-        "last_login": datetime.datetime.now().isoformat()
-    }
-    save_players(players)
+    now = datetime.datetime.now().isoformat()
+    await redis_client.hset(key, mapping={"created_at": now, "last_login": now})
     return True
 
-def normalize_character(character):
-    return unicodedata.normalize("NFD", character).encode("ascii", "ignore").decode("ascii")
-
-def normalize_word(word):
-    return "".join(normalize_character(c) for c in word)
-
-def display_masked_word(word, found_letters):
-    displayed_word = ""
-    normalized_word = normalize_word(word.lower())
-
-    for i, character in enumerate(word):
-        if character.lower() in string.ascii_lowercase:
-            if normalized_word[i] in found_letters:
-                displayed_word += character
-            else:
-                displayed_word += "_"
-        else:
-            displayed_word += character
-
-    return displayed_word
-
-def word_is_complete(word, found_letters):
-    normalized_word = normalize_word(word.lower())
-    for character in normalized_word:
-        if character in string.ascii_lowercase and character not in found_letters:
-            return False
-    return True
-
-def get_hint(secret_word, found_letters):
-    normalized_word = normalize_word(secret_word.lower())
-    unfound_letters = []
-
-    for i, char in enumerate(normalized_word):
-        if char in string.ascii_lowercase and char not in found_letters:
-            unfound_letters.append((char, secret_word[i]))
-
-    if unfound_letters:
-        normalized_hint, original_hint = random.choice(unfound_letters)
-        return normalized_hint, original_hint
-    return None, None
-
 def validate_player_name(name: str) -> bool:
     """Valide le nom du joueur côté serveur"""
     if not name or len(name.strip()) < 2 or len(name.strip()) > 20:
@@ -241,158 +310,92 @@ def validate_player_name(name: str) -> bool:
 
     return True
 
-def update_player_stats(player_name, won, word_length, wrong_letters_count, game_time, difficulty, hints_used=0, secret_word="", infinite_stats=None, is_infinite_mode=False, language="fr"):
-    stats = load_stats()
-
-    if player_name not in stats:
-        stats[player_name] = {
-            "games_played": 0,
-            "games_won": 0,
-            "total_words_found": 0,
-            "total_wrong_letters": 0,
-            "total_time": 0,
-            "best_time": None,
-            "longest_word": 0,
-            "difficulty_stats": {"easy": 0, "middle": 0, "hard": 0},
-            "last_played": None,
-            "current_streak": 0,
-            "best_streak": 0,
-            "difficulty_streaks": {"easy": 0, "middle": 0, "hard": 0},
-            "best_difficulty_streaks": {"easy": 0, "middle": 0, "hard": 0},
-            "achievements": [],
-            "hints_used": 0,
-            "words_history": {"won": [], "lost": []},
-            "total_hints": 0,
-            "infinite_mode_stats": {
-                "games_played": 0,
-                "best_words_found": 0,
-                "total_words_found": 0,
-                "average_words_found": 0.0,
-                "max_lives_reached": 0,
-                "total_lives_gained": 0,
-                "best_session_time": None,
-                "total_session_time": 0
-            },
-            "game_history": []
-        }
+def record_args(records):
+    """Arguments de UPDATE_RECORDS_SCRIPT pour une liste de (champ, mode, valeur)"""
+    return [arg for field, mode, value in records
+            for arg in (field, mode, value if mode in ("max_field", "ratio") else json.dumps(value))]
 
-    player_stats = stats[player_name]
-
-    # Initialize new fields for existing players
-    if "current_streak" not in player_stats:
-        player_stats.update({
-            "current_streak": 0,
-            "best_streak": 0,
-            "difficulty_streaks": {"easy": 0, "middle": 0, "hard": 0},
-            "best_difficulty_streaks": {"easy": 0, "middle": 0, "hard": 0},
-            "achievements": [],
-            "hints_used": 0,
-            "words_history": {"won": [], "lost": []},
-            "total_hints": 0
-        })
-
-    # Initialize game_history for existing players
-    if "game_history" not in player_stats:
-        player_stats["game_history"] = []
-
-    # Initialize infinite mode stats for existing players
-    if "infinite_mode_stats" not in player_stats:
-        player_stats["infinite_mode_stats"] = {
-            "games_played": 0,
-            "best_words_found": 0,
-            "total_words_found": 0,
-            "average_words_found": 0.0,
-            "max_lives_reached": 0,
-            "total_lives_gained": 0,
-            "best_session_time": None,
-            "total_session_time": 0
-        }
+async def add_stats_writes(pipe, now, player_name, won, word_length, wrong_letters_count, game_time, difficulty,
+                           hints_used=0, secret_word="", infinite_stats=None, is_infinite_mode=False, language="fr"):
+    """Ajoute au pipeline les écritures d'une fin de partie.
+
+    Les compteurs sont incrémentés avec HINCRBY/HINCRBYFLOAT et l'historique est
+    ajouté en fin de liste : le coût ne dépend ni du nombre de joueurs ni de la
+    taille de l'historique. Les records (meilleur temps, séries...) sont comparés par
+    UPDATE_RECORDS_SCRIPT aux valeurs courantes, dans la même transaction.
+    """
+    key = player_stats_key(player_name)
+    rollup_key = rollups_key(player_name)
+    records = []
+
+    pipe.sadd(STATS_INDEX_KEY, player_name)
 
     # Ne pas polluer les stats normales avec le mode infini (sauf pour les stats individuelles du mode infini)
     if not is_infinite_mode:
-        player_stats["games_played"] += 1
-        player_stats["total_wrong_letters"] += wrong_letters_count
-        player_stats["total_time"] += game_time
-    player_stats["total_hints"] += hints_used
-    player_stats["last_played"] = datetime.datetime.now().isoformat()
-    player_stats["last_game_perfect"] = (wrong_letters_count == 0 and won)
-
-    difficulty_names = ["easy", "middle", "hard"]
+        pipe.hincrby(key, "games_played", 1)
+        pipe.hincrby(key, "total_wrong_letters", wrong_letters_count)
+        pipe.hincrbyfloat(key, "total_time", game_time)
+    pipe.hincrby(key, "total_hints", hints_used)
+    pipe.hset(key, mapping={
+        "last_played": json.dumps(now),
+        "last_game_perfect": json.dumps(wrong_letters_count == 0 and won)
+    })
 
     # Ne pas polluer les stats normales avec le mode infini
     if not is_infinite_mode:
-        if 0 <= difficulty < len(difficulty_names):
-            player_stats["difficulty_stats"][difficulty_names[difficulty]] += 1
+        if 0 <= difficulty < len(DIFFICULTY_NAMES):
+            pipe.hincrby(key, f"difficulty_stats.{DIFFICULTY_NAMES[difficulty]}", 1)
+
+        word_entry = {
+            "word": secret_word,
+            "date": now,
+            "difficulty": DIFFICULTY_NAMES[difficulty],
+            "time": game_time,
+            "hints_used": hints_used
+        }
 
         if won:
-            player_stats["games_won"] += 1
-            player_stats["total_words_found"] += 1
-            player_stats["longest_word"] = max(player_stats["longest_word"], word_length)
-
-            # Update streaks
-            player_stats["current_streak"] += 1
-            player_stats["best_streak"] = max(player_stats["best_streak"], player_stats["current_streak"])
+            pipe.hincrby(key, "games_won", 1)
+            pipe.hincrby(key, "total_words_found", 1)
+            pipe.hincrby(key, "current_streak", 1)
+            records += [
+                ("best_streak", "max_field", "current_streak"),
+                ("longest_word", "max", word_length),
+                ("best_time", "min", game_time)
+            ]
 
             if secret_word:
-                player_stats["words_history"]["won"].append({
-                    "word": secret_word,
-                    "date": datetime.datetime.now().isoformat(),
-                    "difficulty": difficulty_names[difficulty],
-                    "time": game_time,
-                    "hints_used": hints_used
-                })
-
-            if player_stats["best_time"] is None or game_time < player_stats["best_time"]:
-                player_stats["best_time"] = game_time
+                append_history(pipe, player_name, "won", word_entry)
         else:
             # Reset streaks on loss
-            player_stats["current_streak"] = 0
-            for diff in difficulty_names:
-                player_stats["difficulty_streaks"][diff] = 0
+            updates = {"current_streak": 0}
+            for diff in DIFFICULTY_NAMES:
+                updates[f"difficulty_streaks.{diff}"] = 0
+            pipe.hset(key, mapping={field: json.dumps(value) for field, value in updates.items()})
 
             if secret_word:
-                player_stats["words_history"]["lost"].append({
-                    "word": secret_word,
-                    "date": datetime.datetime.now().isoformat(),
-                    "difficulty": difficulty_names[difficulty],
-                    "time": game_time,
-                    "hints_used": hints_used
-                })
+                append_history(pipe, player_name, "lost", word_entry)
 
     # Traitement des statistiques du mode infini
-    if infinite_stats:
-        infinite_mode_stats = player_stats["infinite_mode_stats"]
-
-        # Si c'est la fin d'une session infinie (défaite)
-        if not won and infinite_stats.get("is_end_of_session", False):
-            infinite_mode_stats["games_played"] += 1
-            words_found = infinite_stats.get("words_found", 0)
-            lives_gained = infinite_stats.get("lives_gained", 0)
-            max_lives = infinite_stats.get("max_lives", 0)
-            session_time = infinite_stats.get("session_time", 0)
-
-            # Meilleur nombre de mots trouvés
-            infinite_mode_stats["best_words_found"] = max(infinite_mode_stats["best_words_found"], words_found)
-
-            # Total de mots trouvés
-            infinite_mode_stats["total_words_found"] += words_found
-
-            # Calcul de la moyenne
-            if infinite_mode_stats["games_played"] > 0:
-                infinite_mode_stats["average_words_found"] = infinite_mode_stats["total_words_found"] / infinite_mode_stats["games_played"]
-
-            # Maximum de vies atteint
-            infinite_mode_stats["max_lives_reached"] = max(infinite_mode_stats["max_lives_reached"], max_lives)
-
-            # Total de vies gagnées
-            infinite_mode_stats["total_lives_gained"] += lives_gained
-
-            # Meilleur temps de session
-            if infinite_mode_stats["best_session_time"] is None or session_time > infinite_mode_stats["best_session_time"]:
-                infinite_mode_stats["best_session_time"] = session_time
+    # Si c'est la fin d'une session infinie (défaite)
+    if infinite_stats and not won and infinite_stats.get("is_end_of_session", False):
+        words_found = infinite_stats.get("words_found", 0)
+
+        pipe.hincrby(key, "infinite_mode_stats.games_played", 1)
+        pipe.hincrby(key, "infinite_mode_stats.total_words_found", words_found)
+        pipe.hincrby(key, "infinite_mode_stats.total_lives_gained", infinite_stats.get("lives_gained", 0))
+        pipe.hincrbyfloat(key, "infinite_mode_stats.total_session_time", infinite_stats.get("session_time", 0))
+        records += [
+            # Meilleur nombre de mots trouvés, moyenne, maximum de vies atteint, meilleur temps de session
+            ("infinite_mode_stats.best_words_found", "max", words_found),
+            ("infinite_mode_stats.average_words_found", "ratio",
+             "infinite_mode_stats.total_words_found,infinite_mode_stats.games_played"),
+            ("infinite_mode_stats.max_lives_reached", "max", infinite_stats.get("max_lives", 0)),
+            ("infinite_mode_stats.best_session_time", "max", infinite_stats.get("session_time", 0))
+        ]
 
-            # Temps total de session
-            infinite_mode_stats["total_session_time"] += session_time
+    if records:
+        await update_records(keys=[key], args=record_args(records), client=pipe)
 
     # Enregistrer cette partie dans l'historique
     if not is_infinite_mode:  # Ne pas enregistrer les mots individuels du mode infini
@@ -405,12 +408,72 @@ def update_player_stats(player_name, won, word_length, wrong_letters_count, game
             "hints_used": hints_used,
             "language": language,
             "secret_word": secret_word,
-            "date": datetime.datetime.now().isoformat()
+            "date": now
         }
-        player_stats["game_history"].append(game_record)
+        append_history(pipe, player_name, "games", game_record)
+
+        # Agrégats par langue et difficulté (lus par /api/stats/{player}?language=)
+        pipe.hincrby(rollup_key, rollup_field(language, difficulty, "games"), 1)
+        pipe.hincrby(rollup_key, rollup_field(language, difficulty, "wins"), 1 if won else 0)
+        pipe.hincrby(rollup_key, rollup_field(language, difficulty, "wrong"), wrong_letters_count)
+        pipe.hincrbyfloat(rollup_key, rollup_field(language, difficulty, "time"), game_time)
+        pipe.hincrby(rollup_key, rollup_field(language, difficulty, "hints"), hints_used)
 
-    save_stats(stats)
-    return player_stats
+        records = [(rollup_field(language, difficulty, "longest_word"), "max", word_length)]
+        if won:
+            records.append((rollup_field(language, difficulty, "best_time"), "min", game_time))
+        await update_records(keys=[rollup_key], args=record_args(records), client=pipe)
+
+async def add_leaderboard_writes(pipe, player_name, won=False, game_time=0, is_infinite_mode=False, **_):
+    """Ajoute au pipeline la mise à jour des classements après les compteurs d'une fin de partie"""
+    if is_infinite_mode:
+        return
+    await update_win_scores(keys=[player_stats_key(player_name), LEADERBOARDS["wins"][0], LEADERBOARDS["winrate"][0]],
+                            args=[player_name, WINRATE_MIN_GAMES], client=pipe)
+    if won:
+        pipe.zadd(LEADERBOARDS["speed"][0], {player_name: game_time}, lt=True)  # Ne garde que le meilleur temps
+
+@REDIS_LATENCY.time("write_stats_batch")
+async def write_stats_batch(events):
+    """Écrit un lot de fins de partie, dans l'ordre, en une transaction (écritures, records et
+    classements) : un lot est écrit entièrement ou pas du tout, et un joueur peut y figurer
+    plusieurs fois. Retourne les stats de chaque joueur.
+    """
+    now = datetime.datetime.now().isoformat()
+    pipe = redis_client.pipeline()
+    for event in events:
+        await add_stats_writes(pipe, now, **event)
+        await add_leaderboard_writes(pipe, **event)
+    player_names = list(dict.fromkeys(event["player_name"] for event in events))
+    for player_name in player_names:
+        pipe.hgetall(player_stats_key(player_name))
+    results = await pipe.execute()
+    return {
+        player_name: decode_player_stats(mapping)
+        for player_name, mapping in zip(player_names, results[-len(player_names):])
+    }
+
+async def write_stats_events(events):
+    """Écrit des fins de partie dans l'ordre, en une transaction ; la liste est vidée une fois
+    les fins de partie écrites (après une erreur, elle contient encore tout le lot à réécrire).
+    """
+    if events:
+        await write_stats_batch(events)
+        del events[:]
+
+async def update_player_stats(player_name, **event):
+    """Met à jour tout de suite les stats d'un joueur et les retourne (sans passer par la file)"""
+    all_stats = await write_stats_batch([{"player_name": player_name, **event}])
+    return all_stats[player_name]
+
+# Écriture différée des fins de partie : file en mémoire vidée par lots en tâche de fond
+STATS_FLUSH_INTERVAL_MS = int(os.getenv("STATS_FLUSH_INTERVAL_MS", "50"))
+STATS_FLUSH_BATCH = int(os.getenv("STATS_FLUSH_BATCH", "100"))
+STATS_QUEUE_MAX = int(os.getenv("STATS_QUEUE_MAX", "10000"))
+stats_writer = StatsWriteBehind(
+    write_stats_events, batch_size=STATS_FLUSH_BATCH,
+    interval=STATS_FLUSH_INTERVAL_MS / 1000, maxsize=STATS_QUEUE_MAX
+)
 
 @app.get("/api/languages")
 async def get_languages():
@@ -422,10 +485,83 @@ async def get_languages():
         ]
     }
 
+@app.get("/api/art")
+async def get_art_frames():
+    """Images de la barre de progression pour les difficultés standard, indexées par identifiant"""
+    return JSONResponse({"frames": FRAMES}, headers={"Cache-Control": "public, max-age=86400"})
+
+@app.get("/api/art/{art_id}")
+async def get_art_frame(art_id: str):
+    """Une image de la barre de progression (identifiant reçu dans progress_art_id)"""
+    frame = parse_frame_id(art_id)
+    if frame is None:
+        raise HTTPException(status_code=404, detail="Image inconnue")
+    return JSONResponse(
+        {"id": art_id, "art": draw_progress_bar(*frame)},
+        headers={"Cache-Control": "public, max-age=86400"}
+    )
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics():
+    """Métriques du worker au format texte Prometheus"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+class ProfilerStart(BaseModel):
+    duration: float = 30.0  # Fenêtre de profilage (secondes)
+    fraction: float = 1.0  # Part des requêtes suivies
+    interval_ms: float = 5.0  # Période d'échantillonnage
+
+def require_admin(token):
+    if not verify_admin_token(token):
+        raise HTTPException(status_code=403, detail="Accès réservé à l'administration")
+
+@app.post("/api/admin/profiler/start")
+async def start_profiler(options: ProfilerStart, x_admin_token: Optional[str] = Header(None)):
+    """Démarre une fenêtre de profilage sur ce worker (résultats précédents effacés)"""
+    require_admin(x_admin_token)
+    if not 0 < options.duration <= 3600 or not 0 < options.fraction <= 1 or not 1 <= options.interval_ms <= 1000:
+        raise HTTPException(status_code=400, detail="Paramètres de profilage invalides")
+    profiler.start(options.duration, options.fraction, options.interval_ms / 1000)
+    return profiler.stats()
+
+@app.post("/api/admin/profiler/stop")
+async def stop_profiler(x_admin_token: Optional[str] = Header(None)):
+    require_admin(x_admin_token)
+    profiler.stop()
+    return profiler.stats()
+
+@app.get("/api/admin/profiler")
+async def get_profiler(x_admin_token: Optional[str] = Header(None)):
+    """État du profileur et fonctions les plus échantillonnées"""
+    require_admin(x_admin_token)
+    return profiler.stats()
+
+@app.get("/api/admin/profiler/folded")
+async def download_profile(x_admin_token: Optional[str] = Header(None)):
+    """Piles agrégées au format folded (flamegraph.pl, speedscope)"""
+    require_admin(x_admin_token)
+    return PlainTextResponse(profiler.folded(), headers={
+        "Content-Disposition": f'attachment; filename="pendu-{os.getpid()}.folded"'
+    })
+
+@app.get("/api/server/games")
+async def get_games_occupancy():
+    """Occupation du stockage des parties (nombre de parties, expirations, évictions)"""
+    return game_store.stats()
+
+@app.get("/api/server/stats-queue")
+async def get_stats_queue():
+    """File d'écriture des stats : profondeur, nombre de lots et durée des écritures"""
+    return stats_writer.stats()
+
+@app.get("/api/server/static")
+async def get_static_stats():
+    """Fichiers statiques servis : URL avec empreinte, ETag et taille de chaque variante"""
+    return static_assets.stats()
+
 @app.get("/", response_class=HTMLResponse)
-async def read_root():
-    with open("static/index.html", "r", encoding="utf-8") as f:
-        return f.read()
+async def read_root(request: Request):
+    return asset_response(request, static_assets.get_index(), REVALIDATE_CACHE)
 
 @app.post("/api/player/login")
 async def login_player(login_data: PlayerLogin):
@@ -443,32 +579,46 @@ async def login_player(login_data: PlayerLogin):
             detail="Le mot de passe doit contenir au moins 3 caractères."
         )
 
-    players = load_players()
-    stats = load_stats()
-
-    # Si le joueur n'existe pas dans players mais existe dans stats (ancien compte)
-    if login_data.player_name not in players and login_data.player_name in stats:
-        if register_player(login_data.player_name, login_data.password):
-            return {"status": "migrated", "message": f"Compte migré pour {login_data.player_name} ! Vos stats sont préservées."}
-        else:
-            raise HTTPException(status_code=500, detail="Erreur lors de la migration du compte")
-
-    # Si le joueur n'existe nulle part, on le crée
-    if login_data.player_name not in players:
-        if register_player(login_data.player_name, login_data.password):
-            return {"status": "registered", "message": f"Nouveau compte créé pour {login_data.player_name} !"}
-        else:
+    account = await load_account(login_data.player_name)
+
+    # Si le joueur n'a pas de compte, on le crée (en gardant ses stats s'il en a déjà)
+    if account is None:
+        has_stats = await redis_client.exists(player_stats_key(login_data.player_name))
+        if await register_player(login_data.player_name, login_data.password):
+            if has_stats:
+                return {
+                    "status": "migrated",
+                    "message": f"Compte migré pour {login_data.player_name} ! Vos stats sont préservées.",
+                    "token": create_session_token(login_data.player_name)
+                }
+            return {
+                "status": "registered",
+                "message": f"Nouveau compte créé pour {login_data.player_name} !",
+                "token": create_session_token(login_data.player_name)
+            }
+
+        # Compte créé entre-temps par une autre requête : on vérifie le mot de passe
+        account = await load_account(login_data.player_name)
+        if account is None:
             raise HTTPException(status_code=500, detail="Erreur lors de la création du compte")
 
     # Si le joueur existe, on vérifie le mot de passe
-    if verify_player(login_data.player_name, login_data.password):
-        # Mettre à jour la dernière connexion
-        players[login_data.player_name]["last_login"] = datetime.datetime.now().isoformat()
-        save_players(players)
-        return {"status": "logged_in", "message": f"Bon retour {login_data.player_name} !"}
-    else:
+    valid, needs_rehash = await asyncio.to_thread(verify_password, login_data.password, account["password_hash"])
+    if not valid:
         raise HTTPException(status_code=401, detail="Mot de passe incorrect")
 
+    # Mettre à jour la dernière connexion (et rehash transparent des anciens hashes :
+    # SHA-256 non salé ou moins d'itérations), sans toucher aux autres comptes
+    updates = {"last_login": datetime.datetime.now().isoformat()}
+    if needs_rehash:
+        updates["password_hash"] = await asyncio.to_thread(hash_password, login_data.password)
+    await redis_client.hset(account_key(login_data.player_name), mapping=updates)
+    return {
+        "status": "logged_in",
+        "message": f"Bon retour {login_data.player_name} !",
+        "token": create_session_token(login_data.player_name)
+    }
+
 @app.post("/api/game/start")
 async def start_game(game_data: GameStart):
     # Validation du nom du joueur
@@ -479,447 +629,462 @@ async def start_game(game_data: GameStart):
         )
 
     # Vérification de l'authentification
-    if not verify_player(game_data.player_name, game_data.password):
+    if not await authenticate_player(game_data.player_name, game_data.password, game_data.token):
         raise HTTPException(status_code=401, detail="Authentification requise")
 
-    difficulty_map = {"easy": 0, "middle": 1, "hard": 2}
-    max_errors_map = {"easy": 10, "middle": 6, "hard": 3}
+    return await create_game(game_data.player_name, game_data.difficulty, game_data.language, game_data.infinite)
 
-    if game_data.difficulty not in difficulty_map:
+# Sauvegarde d'une nouvelle partie refusée (identifiant déjà pris) : nouvel identifiant, puis 503
+GAME_ID_ATTEMPTS = 3
+
+async def create_game(player_name, difficulty, language, infinite=False):
+    """Tire un mot, enregistre la nouvelle partie et retourne son état initial"""
+    if difficulty not in DIFFICULTY_LEVELS:
         raise HTTPException(status_code=400, detail="Invalid difficulty")
 
     # Valider la langue
-    if game_data.language not in DICTIONARIES:
+    if language not in DICTIONARIES:
         raise HTTPException(status_code=400, detail="Invalid language")
 
-    difficulty_level = difficulty_map[game_data.difficulty]
-    secret_word = choose_random_word(difficulty_level, game_data.language)
-    game_id = f"{game_data.player_name}_{datetime.datetime.now().timestamp()}"
-
-    games[game_id] = {
-        "player_name": game_data.player_name,
-        "secret_word": secret_word,
-        "secret_word_normalized": normalize_word(secret_word.lower()),
-        "found_letters": set(),
-        "wrong_letters": set(),
-        "difficulty": difficulty_level,
-        "difficulty_name": game_data.difficulty,
-        "language": game_data.language,  # Ajouter la langue
-        "max_errors": max_errors_map[game_data.difficulty],
-        "lives": max_errors_map[game_data.difficulty],  # Nouvelle source de vérité
-        "errors": 0,
-        "hints_used": 0,
-        "start_time": datetime.datetime.now().timestamp(),
-        "status": "playing"
-    }
+    record = choose_random_word_record(DIFFICULTY_LEVELS[difficulty], language)
+    engine = HangmanGame.new(player_name, difficulty, language, record, infinite)
+    for _ in range(GAME_ID_ATTEMPTS):
+        game_id = f"{player_name}_{datetime.datetime.now().timestamp()}"
+        if await game_store.save(game_id, engine.state):
+            break
+    else:
+        raise HTTPException(status_code=503, detail="Game could not be created, please retry")
+    GAMES_STARTED.inc(difficulty, language)
 
-    return GameResponse(
-        game_id=game_id,
-        status="playing",
-        word_display=display_masked_word(secret_word, set()),
-        wrong_letters=[],
-        lives=max_errors_map[game_data.difficulty],
-        max_lives=max_errors_map[game_data.difficulty],
-        message=f"Nouveau jeu commencé ! Mot de {len(secret_word)} lettres (difficulté: {game_data.difficulty}, langue: {DICTIONARIES[game_data.language]['name']})",
-        hints_used=0
+    return game_state(
+        game_id, engine.state,
+        f"Nouveau jeu commencé ! Mot de {len(record.word)} lettres (difficulté: {difficulty}, langue: {DICTIONARIES[language]['name']})"
     )
 
 @app.post("/api/game/guess")
 async def make_guess(guess_data: GameGuess):
-    if guess_data.game_id not in games:
+    game = await game_store.get(guess_data.game_id)
+    if game is None:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    game = games[guess_data.game_id]
+    # Le jeton est facultatif (l'identifiant de partie suffit), mais s'il est fourni il doit correspondre
+    if guess_data.token and verify_session_token(guess_data.token) != game["player_name"]:
+        raise HTTPException(status_code=401, detail="Authentification requise")
 
     if game["status"] != "playing":
         raise HTTPException(status_code=400, detail="Game is finished")
 
-    # Handle hint request
-    if guess_data.hint_requested:
-        if game["lives"] <= 1:  # Doit avoir au moins 1 vie après l'indice
-            return GameResponse(
-                game_id=guess_data.game_id,
-                status="playing",
-                word_display=display_masked_word(game["secret_word"], game["found_letters"]),
-                wrong_letters=list(game["wrong_letters"]),
-                lives=game["lives"],
-                max_lives=game["max_errors"],
-                message="❌ Tu n'as pas assez de vies pour un indice !",
-                hints_used=game["hints_used"]
-            )
-
-        hint_letter, original_letter = get_hint(game["secret_word"], game["found_letters"])
-        if hint_letter:
-            game["found_letters"].add(hint_letter)
-            game["lives"] -= 1  # Utiliser lives directement
-            game["errors"] += 1  # Maintenir errors pour la cohérence
-            game["hints_used"] += 1
-
-            return GameResponse(
-                game_id=guess_data.game_id,
-                status="playing",
-                word_display=display_masked_word(game["secret_word"], game["found_letters"]),
-                wrong_letters=list(game["wrong_letters"]),
-                lives=game["lives"],
-                max_lives=game["max_errors"],
-                message=f"💡 INDICE: La lettre '{original_letter}' est dans le mot ! (coût: 1 vie)",
-                hints_used=game["hints_used"]
-            )
-
-    guess = guess_data.guess.strip().lower()
-
-    if not guess:
-        return GameResponse(
-            game_id=guess_data.game_id,
-            status="playing",
-            word_display=display_masked_word(game["secret_word"], game["found_letters"]),
-            wrong_letters=list(game["wrong_letters"]),
-            lives=game["lives"],
-            max_lives=game["max_errors"],
-            message="Tu dois taper quelque chose !",
-            hints_used=game["hints_used"]
-        )
-
-    # Single letter guess
-    if len(guess) == 1:
-        if not guess.isalpha():
-            return GameResponse(
-                game_id=guess_data.game_id,
-                status="playing",
-                word_display=display_masked_word(game["secret_word"], game["found_letters"]),
-                wrong_letters=list(game["wrong_letters"]),
-                lives=game["lives"],
-                max_lives=game["max_errors"],
-                message="Merci d'entrer une lettre valide !",
-                hints_used=game["hints_used"]
-            )
-
-        normalized_letter = normalize_character(guess)
-
-        if normalized_letter in game["found_letters"] or normalized_letter in game["wrong_letters"]:
-            return GameResponse(
-                game_id=guess_data.game_id,
-                status="playing",
-                word_display=display_masked_word(game["secret_word"], game["found_letters"]),
-                wrong_letters=list(game["wrong_letters"]),
-                lives=game["lives"],
-                max_lives=game["max_errors"],
-                message="Tu as déjà essayé cette lettre !",
-                hints_used=game["hints_used"]
-            )
-
-        if normalized_letter in game["secret_word_normalized"]:
-            game["found_letters"].add(normalized_letter)
-            message = f"✓ Bonne lettre : {guess}"
-        else:
-            game["wrong_letters"].add(normalized_letter)
-            game["lives"] -= 1  # Décrémenter les vies directement
-            game["errors"] += 1  # Maintenir errors pour la cohérence
-            message = f"✗ Mauvaise lettre : {guess}"
-
-            # VÉRIFICATION IMMÉDIATE DES VIES APRÈS ERREUR
-            if game["lives"] <= 0:
-                game["status"] = "lost"
-                end_time = datetime.datetime.now().timestamp()
-                game_time = end_time - game["start_time"]
-
-                # Update stats
-                player_stats = update_player_stats(
-                    game["player_name"], False, len(game["secret_word"]),
-                    len(game["wrong_letters"]), game_time, game["difficulty"],
-                    game["hints_used"], game["secret_word"], None, False, game.get("language", "fr")
-                )
-
-                progress_art = draw_progress_bar(game["errors"], game["max_errors"], game["difficulty"])
-
-                return GameResponse(
-                    game_id=guess_data.game_id,
-                    status="lost",
-                    word_display=display_masked_word(game["secret_word"], game["found_letters"]),
-                    wrong_letters=list(game["wrong_letters"]),
-                    lives=0,
-                    max_lives=game["max_errors"],
-                    message=f"💀 PERDU ! Le mot était : {game['secret_word']} (Temps: {game_time:.1f}s)",
-                    progress_art=progress_art,
-                    hints_used=game["hints_used"],
-                    game_time=game_time,
-                    secret_word=game["secret_word"]
-                )
+    response, delta = await play_guess(guess_data.game_id, game, guess_data, guess_data.compact)
 
-    else:
-        # Whole word guess
-        guess_normalized = normalize_word(guess)
-        if guess_normalized == game["secret_word_normalized"]:
-            # Instant win
-            game["status"] = "won"
-            end_time = datetime.datetime.now().timestamp()
-            game_time = end_time - game["start_time"]
-
-            # Update stats
-            player_stats = update_player_stats(
-                game["player_name"], True, len(game["secret_word"]),
-                len(game["wrong_letters"]), game_time, game["difficulty"],
-                game["hints_used"], game["secret_word"], None, False, game.get("language", "fr")
-            )
-
-            return GameResponse(
-                game_id=guess_data.game_id,
-                status="won",
-                word_display=game["secret_word"],
-                wrong_letters=list(game["wrong_letters"]),
-                lives=game["lives"],
-                max_lives=game["max_errors"],
-                message=f"🎉 BRAVO ! Tu as trouvé le mot entier : {game['secret_word']} (Temps: {game_time:.1f}s)",
-                hints_used=game["hints_used"],
-                game_time=game_time,
-                secret_word=game["secret_word"]
-            )
-        else:
-            game["lives"] -= 1  # Décrémenter les vies directement
-            game["errors"] += 1  # Maintenir errors pour la cohérence
-            message = f"✗ Mauvaise proposition de mot : \"{guess}\""
-
-            # VÉRIFICATION IMMÉDIATE DES VIES APRÈS ERREUR DE MOT
-            if game["lives"] <= 0:
-                game["status"] = "lost"
-                end_time = datetime.datetime.now().timestamp()
-                game_time = end_time - game["start_time"]
-
-                # Update stats
-                player_stats = update_player_stats(
-                    game["player_name"], False, len(game["secret_word"]),
-                    len(game["wrong_letters"]), game_time, game["difficulty"],
-                    game["hints_used"], game["secret_word"], None, False, game.get("language", "fr")
-                )
-
-                progress_art = draw_progress_bar(game["errors"], game["max_errors"], game["difficulty"])
-
-                return GameResponse(
-                    game_id=guess_data.game_id,
-                    status="lost",
-                    word_display=display_masked_word(game["secret_word"], game["found_letters"]),
-                    wrong_letters=list(game["wrong_letters"]),
-                    lives=0,
-                    max_lives=game["max_errors"],
-                    message=f"💀 PERDU ! Le mot était : {game['secret_word']} (Temps: {game_time:.1f}s)",
-                    progress_art=progress_art,
-                    hints_used=game["hints_used"],
-                    game_time=game_time,
-                    secret_word=game["secret_word"]
-                )
-
-    # Check win condition
-    if word_is_complete(game["secret_word"], game["found_letters"]):
-        game["status"] = "won"
-        end_time = datetime.datetime.now().timestamp()
-        game_time = end_time - game["start_time"]
-
-        # Update stats
-        player_stats = update_player_stats(
-            game["player_name"], True, len(game["secret_word"]),
-            len(game["wrong_letters"]), game_time, game["difficulty"],
-            game["hints_used"], game["secret_word"]
-        )
+    # Mode compact : seulement les changements, le client garde le reste de l'état
+    if guess_data.compact:
+        return JSONResponse(delta)
+    return response
 
-        return GameResponse(
-            game_id=guess_data.game_id,
-            status="won",
-            word_display=game["secret_word"],
-            wrong_letters=list(game["wrong_letters"]),
-            lives=game["lives"],
-            max_lives=game["max_errors"],
-            message=f"🎉 BRAVO ! Tu as trouvé le mot : {game['secret_word']} (Temps: {game_time:.1f}s)",
-            hints_used=game["hints_used"],
-            game_time=game_time,
-            secret_word=game["secret_word"]
-        )
+def guess_message(outcome, detail, state):
+    """Message affiché au joueur pour le résultat d'un coup"""
+    if state["status"] == WON:
+        whole = " entier" if outcome == "word_found" else ""
+        return f"🎉 BRAVO ! Tu as trouvé le mot{whole} : {state['secret_word']} (Temps: {state['game_time']:.1f}s)"
+    if state["status"] == LOST:
+        return f"💀 PERDU ! Le mot était : {state['secret_word']} (Temps: {state['game_time']:.1f}s)"
 
-    # Check lose condition (cette vérification ne devrait normalement plus être nécessaire)
-    if game["lives"] <= 0:
-        game["status"] = "lost"
-        end_time = datetime.datetime.now().timestamp()
-        game_time = end_time - game["start_time"]
-
-        # Update stats
-        player_stats = update_player_stats(
-            game["player_name"], False, len(game["secret_word"]),
-            len(game["wrong_letters"]), game_time, game["difficulty"],
-            game["hints_used"], game["secret_word"]
-        )
-
-        progress_art = draw_progress_bar(game["errors"], game["max_errors"], game["difficulty"])
-
-        return GameResponse(
-            game_id=guess_data.game_id,
-            status="lost",
-            word_display=display_masked_word(game["secret_word"], game["found_letters"]),
-            wrong_letters=list(game["wrong_letters"]),
-            lives=0,
-            max_lives=game["max_errors"],
-            message=f"💀 PERDU ! Le mot était : {game['secret_word']} (Temps: {game_time:.1f}s)",
-            progress_art=progress_art,
-            hints_used=game["hints_used"],
-            game_time=game_time,
-            secret_word=game["secret_word"]
-        )
+    return {
+        "timeout": "⏰ Temps écoulé ! Tu perds une vie.",
+        "hint": f"💡 INDICE: La lettre '{detail}' est dans le mot ! (coût: 1 vie)",
+        "no_lives_for_hint": "❌ Tu n'as pas assez de vies pour un indice !",
+        "no_hint": "💡 Aucune lettre cachée disponible pour l'indice !",
+        "empty": "Tu dois taper quelque chose !",
+        "invalid": "Merci d'entrer une lettre valide !",
+        "repeated": "Tu as déjà essayé cette lettre !",
+        "good_letter": f"✓ Bonne lettre : {detail}",
+        "wrong_letter": f"✗ Mauvaise lettre : {detail}",
+        "wrong_word": f"✗ Mauvaise proposition de mot : \"{detail}\""
+    }[outcome]
+
+def guess_response(game_id, engine: HangmanGame, outcome, detail, art_id=False):
+    """Réponse complète après un coup (mot et temps révélés en fin de partie)"""
+    state = engine.state
+    response = game_state(game_id, state, guess_message(outcome, detail, state))
+    if state["status"] == WON:
+        response.word_display = state["secret_word"]
+    if state["status"] != PLAYING:
+        response.game_time = state["game_time"]
+        response.secret_word = state["secret_word"]
+    if state["status"] == LOST:
+        frame = (state["errors"], state["max_errors"], state["difficulty"])
+        if art_id:
+            response.progress_art_id = frame_id(*frame)
+        else:
+            response.progress_art = draw_progress_bar(*frame)
+    return response
 
+def game_state(game_id, game, message=""):
+    """État complet d'une partie, tel que renvoyé au début d'une partie"""
+    record = get_word_record(game["secret_word"])
     return GameResponse(
-        game_id=guess_data.game_id,
-        status="playing",
-        word_display=display_masked_word(game["secret_word"], game["found_letters"]),
-        wrong_letters=list(game["wrong_letters"]),
+        game_id=game_id,
+        status=game["status"],
+        word_display=display_masked_word(record, game["found_letters"]),
+        wrong_letters=letters_from_mask(game["wrong_letters"]),
         lives=game["lives"],
         max_lives=game["max_errors"],
         message=message,
-        hints_used=game["hints_used"]
+        hints_used=game["hints_used"],
+        words_found=game.get("words_found")
     )
 
+def game_delta(game_id, game, before, response: GameResponse):
+    """Différence compacte entre l'état `before` (found, wrong, lives, hints) et l'état actuel.
+
+    Seules les positions révélées (avec leur caractère), la lettre fausse ajoutée et la
+    variation de vies sont envoyées ; le client garde le reste de l'état.
+    """
+    found_before, wrong_before, lives_before, hints_before = before
+    # En mode infini la partie est déjà passée au mot suivant : le mot joué est celui de la réponse
+    record = get_word_record(response.secret_word or game["secret_word"])
+
+    revealed = record.positions_of(game["found_letters"] & ~found_before)
+    if response.status == "won":
+        revealed = record.hidden_mask & ~record.positions_of(found_before)
+    reveal = {i: record.word[i] for i in range(len(record.word)) if revealed >> i & 1}
+
+    delta = {"game_id": game_id, "status": response.status, "message": response.message}
+    if reveal:
+        delta["reveal"] = reveal
+    wrong_added = letters_from_mask(game["wrong_letters"] & ~wrong_before) if response.status != "won" else []
+    if wrong_added:
+        delta["wrong"] = wrong_added[0]
+    if response.lives != lives_before:
+        delta["lives"] = response.lives - lives_before
+    if game["hints_used"] != hints_before:
+        delta["hints_used"] = game["hints_used"]
+    if response.status != "playing":
+        delta["secret_word"] = response.secret_word
+        delta["game_time"] = response.game_time
+        if response.progress_art:
+            delta["progress_art"] = response.progress_art
+        if response.progress_art_id:
+            delta["progress_art_id"] = response.progress_art_id
+    if response.words_found is not None:
+        delta["words_found"] = response.words_found
+    if response.next_word_display:
+        delta["next_word_display"] = response.next_word_display
+    return delta
+
+def advance_infinite_session(engine: HangmanGame, response: GameResponse):
+    """Mode infini : enchaîne le mot suivant après une victoire.
+
+    Les vies sont reportées (+1 par mot trouvé) et la partie garde le même identifiant ;
+    le client n'a qu'à afficher `next_word_display`.
+    """
+    if engine.status == WON:
+        record = choose_random_word_record(engine.state["difficulty"], engine.state.get("language", "fr"))
+        engine.next_word(record)
+        response.lives = engine.state["lives"]
+        response.max_lives = engine.state["max_errors"]
+        response.next_word_display = engine.word_display()
+        response.message += " 🔄 MODE INFINI : +1 vie !"
+    response.words_found = engine.state["words_found"]
+
+# Sauvegarde refusée : la partie a été modifiée par une autre requête depuis sa lecture
+GAME_CONFLICT_DETAIL = "Game was modified by another request, please retry"
+
+def step_guess(game_id, game, guess_data: GameGuess, with_delta=False):
+    """Applique une proposition sans sauvegarder, retourne (réponse complète, delta ou None, partie terminée ou None)"""
+    before = (game["found_letters"], game["wrong_letters"], game["lives"], game["hints_used"])
+    engine = HangmanGame(game)
+    outcome, detail = engine.play(guess_data.guess, guess_data.hint_requested, guess_data.timeout)
+    response = guess_response(game_id, engine, outcome, detail, guess_data.art_id)
+    finished = engine.finished
+
+    if game.get("infinite"):
+        advance_infinite_session(engine, response)
+    return response, game_delta(game_id, game, before, response) if with_delta else None, finished
+
+async def record_finished_games(game, finished_games):
+    """Une seule écriture des stats par partie terminée, différée (file vidée par lots).
+
+    Appelé seulement après une sauvegarde acceptée : une requête concurrente dont la
+    sauvegarde est refusée ne compte pas la partie une seconde fois.
+    """
+    for finished in finished_games:
+        await stats_writer.put(finished)
+        GAMES_FINISHED.inc(game["difficulty_name"], finished["language"], "won" if finished["won"] else "lost")
+
+async def play_guess(game_id, game, guess_data: GameGuess, with_delta=False):
+    """Applique une proposition, sauvegarde la partie et retourne (réponse complète, delta ou None)"""
+    response, delta, finished = step_guess(game_id, game, guess_data, with_delta)
+    if not await game_store.save(game_id, game):
+        raise HTTPException(status_code=409, detail=GAME_CONFLICT_DETAIL)
+    if finished:
+        await record_finished_games(game, [finished])
+    return response, delta
+
+# Nombre maximal de propositions par appel à /api/game/guess/batch
+MAX_BATCH_GUESSES = int(os.getenv("MAX_BATCH_GUESSES", "500"))
+
+@app.post("/api/game/guess/batch")
+async def make_guess_batch(batch: GameGuessBatch):
+    """Applique des listes ordonnées de propositions à une ou plusieurs parties en un seul appel.
+
+    Mêmes règles que /api/game/guess (coût des indices, vies) ; la suite s'arrête dès que la
+    partie est terminée. Chaque partie n'est sauvegardée qu'une fois, après sa dernière proposition.
+    """
+    if sum(len(sequence.guesses) for sequence in batch.games) > MAX_BATCH_GUESSES:
+        raise HTTPException(status_code=400, detail=f"Too many guesses (max {MAX_BATCH_GUESSES})")
+
+    token_player = verify_session_token(batch.token) if batch.token else None
+    if batch.token and token_player is None:
+        raise HTTPException(status_code=401, detail="Authentification requise")
+
+    results = []
+    for sequence in batch.games:
+        game = await game_store.get(sequence.game_id)
+        if game is None:
+            results.append({"game_id": sequence.game_id, "error": "Game not found"})
+            continue
+        if token_player is not None and token_player != game["player_name"]:
+            results.append({"game_id": sequence.game_id, "error": "Authentification requise"})
+            continue
+        if game["status"] != "playing":
+            results.append({"game_id": sequence.game_id, "error": "Game is finished"})
+            continue
+
+        steps = []
+        finished_games = []
+        applied = 0
+        for step in sequence.guesses:
+            guess_data = GameGuess(game_id=sequence.game_id, art_id=batch.art_id, **step.model_dump())
+            response, delta, finished = step_guess(sequence.game_id, game, guess_data, batch.compact)
+            applied += 1
+            if finished:
+                finished_games.append(finished)
+            if batch.steps:
+                steps.append(delta if batch.compact else response.model_dump())
+            if game["status"] != "playing":
+                break
+        if applied:
+            if not await game_store.save(sequence.game_id, game):
+                results.append({"game_id": sequence.game_id, "error": GAME_CONFLICT_DETAIL})
+                continue
+            await record_finished_games(game, finished_games)
+        else:
+            response = game_state(sequence.game_id, game)
+
+        result = {"game_id": sequence.game_id, "applied": applied, "final": response.model_dump()}
+        if batch.steps:
+            result["steps"] = steps
+        results.append(result)
+
+    return {"results": results}
+
+# Types des champs des messages WebSocket (un champ absent ou null garde sa valeur par défaut)
+WEBSOCKET_STRING_FIELDS = ("token", "difficulty", "language", "game_id", "guess")
+WEBSOCKET_BOOL_FIELDS = ("infinite", "hint", "timeout", "art_id")
+WEBSOCKET_FIELD_TYPES = ((WEBSOCKET_STRING_FIELDS, str), (WEBSOCKET_BOOL_FIELDS, bool))
+
+@app.websocket("/ws/game")
+async def game_websocket(websocket: WebSocket):
+    """Canal de jeu persistant : une connexion par joueur, des deltas compacts dans les deux sens.
+
+    Messages du client :
+      {"type": "auth", "token": ...}                        -> {"type": "auth", "player_name": ...}
+      {"type": "start", "difficulty": ..., "language": ..., "infinite": false}
+                                                            -> {"type": "state", ...GameResponse}
+      {"type": "join", "game_id": ...}                      -> {"type": "state", ...GameResponse}
+      {"type": "guess", "guess": ..., "hint": false, "timeout": false, "art_id": false}
+                                                            -> {"type": "delta", ...}
+    En mode infini, le mot suivant est enchaîné dans la même partie (`next_word_display`).
+    """
+    await websocket.accept()
+    player_name = None
+    game_id = None
+
+    async def send_error(detail):
+        await websocket.send_json({"type": "error", "detail": detail})
+
+    try:
+        while True:
+            try:
+                message = await websocket.receive_json()
+            except ValueError:
+                await send_error("Invalid JSON")
+                continue
+            message_type = message.get("type") if isinstance(message, dict) else None
+
+            # Champs texte : un autre type ferait échouer la validation ou les recherches plus loin.
+            # Booléens : "false" ou "no" ne doivent pas valoir True
+            invalid = next((field for fields, expected in WEBSOCKET_FIELD_TYPES for field in fields
+                            if message_type and message.get(field) is not None
+                            and not isinstance(message[field], expected)), None)
+            if invalid:
+                await send_error(f"Invalid {invalid}")
+                continue
+
+            if message_type == "auth":
+                player_name = verify_session_token(message.get("token") or "")
+                if player_name is None:
+                    await send_error("Authentification requise")
+                else:
+                    await websocket.send_json({"type": "auth", "player_name": player_name})
+                continue
+
+            if player_name is None:
+                await send_error("Authentification requise")
+                continue
+
+            if message_type == "start":
+                try:
+                    state = await create_game(player_name, message.get("difficulty", "easy"),
+                                              message.get("language", "fr"), bool(message.get("infinite")))
+                except HTTPException as e:
+                    await send_error(e.detail)
+                    continue
+                game_id = state.game_id
+                await websocket.send_json({"type": "state", **state.model_dump()})
+
+            elif message_type == "join":
+                game = await game_store.get(message.get("game_id", ""))
+                if game is None or game["player_name"] != player_name:
+                    await send_error("Game not found")
+                    continue
+                game_id = message["game_id"]
+                await websocket.send_json({"type": "state", **game_state(game_id, game).model_dump()})
+
+            elif message_type == "guess":
+                game = await game_store.get(game_id) if game_id else None
+                if game is None:
+                    await send_error("Game not found")
+                    continue
+                if game["status"] != "playing":
+                    await send_error("Game is finished")
+                    continue
+                guess_data = GameGuess(game_id=game_id, guess=message.get("guess", ""),
+                                       hint_requested=bool(message.get("hint")), timeout=bool(message.get("timeout")),
+                                       art_id=bool(message.get("art_id")))
+                try:
+                    _, delta = await play_guess(game_id, game, guess_data, with_delta=True)
+                except HTTPException as e:
+                    await send_error(e.detail)
+                    continue
+                await websocket.send_json({"type": "delta", **delta})
+
+            else:
+                await send_error("Unknown message type")
+
+    except WebSocketDisconnect:
+        pass
+
 @app.get("/api/stats/{player_name}")
 async def get_player_stats(player_name: str, language: str = None):
-    stats = load_stats()
-    if player_name not in stats:
+    # Fins de partie du joueur encore en file d'écriture : la partie qui vient de finir doit compter
+    await stats_writer.flush_player(player_name)
+    player_stats = await load_player_stats(player_name)
+    if player_stats is None:
         raise HTTPException(status_code=404, detail="Player not found")
 
-    player_stats = stats[player_name]
-
     # Si aucune langue spécifiée, retourner toutes les stats
     if not language:
         return player_stats
 
-    # Filtrer par langue si spécifiée
-    filtered_stats = {
-        "games_played": 0,
-        "games_won": 0,
-        "total_words_found": 0,
-        "total_wrong_letters": 0,
-        "total_time": 0,
-        "best_time": None,
-        "longest_word": 0,
+    # Filtrer par langue si spécifiée : agrégats maintenus à chaque fin de partie
+    rollups = await redis_client.hgetall(rollups_key(player_name))
+    filtered_stats = language_stats_from_rollups(
+        {field: json.loads(value) for field, value in rollups.items()}, language
+    )
+    filtered_stats.update({
         "current_streak": 0,
         "best_streak": 0,
-        "total_hints": 0,
-        "difficulty_stats": {},
-        "infinite_mode_stats": {
-            "games_played": 0,
-            "best_words_found": 0,
-            "average_words_found": 0,
-            "max_lives_reached": 0,
-            "total_lives_gained": 0,
-            "best_session_time": None,
-            "total_session_time": 0
-        }
-    }
-
-    # Parcourir l'historique des parties pour filtrer par langue
-    game_history = player_stats.get("game_history", [])
-    language_games = [game for game in game_history if game.get("language") == language]
-
-    if not language_games:
-        return filtered_stats
-
-    # Calculer les stats pour cette langue
-    total_time = 0
-    best_time = None
-    won_games = 0
-    total_words = 0
-    total_wrong = 0
-    total_hints = 0
-    longest_word = 0
-    difficulty_counts = {}
-
-    for game in language_games:
-        total_time += game.get("game_time", 0)
-        total_words += 1 if game.get("won") else 0
-        total_wrong += game.get("wrong_letters_count", 0)
-        total_hints += game.get("hints_used", 0)
-
-        if game.get("won"):
-            won_games += 1
-            game_time = game.get("game_time", 0)
-            if best_time is None or game_time < best_time:
-                best_time = game_time
-
-        word_length = game.get("word_length", 0)
-        if word_length > longest_word:
-            longest_word = word_length
-
-        difficulty = game.get("difficulty", "unknown")
-        difficulty_counts[difficulty] = difficulty_counts.get(difficulty, 0) + 1
-
-    filtered_stats.update({
-        "games_played": len(language_games),
-        "games_won": won_games,
-        "total_words_found": total_words,
-        "total_wrong_letters": total_wrong,
-        "total_time": total_time,
-        "best_time": best_time,
-        "longest_word": longest_word,
-        "total_hints": total_hints,
-        "difficulty_stats": difficulty_counts
+        # Pour les stats du mode infini, on garde les stats globales car elles ne sont pas encore stockées par langue
+        "infinite_mode_stats": player_stats["infinite_mode_stats"]
     })
 
-    # Pour les stats du mode infini, on garde les stats globales car elles ne sont pas encore stockées par langue
-    if "infinite_mode_stats" in player_stats:
-        filtered_stats["infinite_mode_stats"] = player_stats["infinite_mode_stats"]
-
     return filtered_stats
 
-@app.post("/api/infinite/stats")
-async def update_infinite_stats(infinite_data: dict):
-    """Enregistre les statistiques de fin de session en mode infini"""
-    player_name = infinite_data.get("player_name")
-    password = infinite_data.get("password")
-
-    # Vérification de l'authentification
-    if not verify_player(player_name, password):
-        raise HTTPException(status_code=401, detail="Authentification requise")
+@app.get("/api/stats/{player_name}/history")
+async def get_player_history(player_name: str, kind: str = "games", offset: int = 0, limit: int = 20):
+    """Historique paginé d'un joueur : parties ("games") ou mots gagnés/perdus ("won"/"lost")"""
+    if kind not in HISTORY_KINDS:
+        raise HTTPException(status_code=400, detail="Invalid history kind")
+
+    offset = max(0, offset)
+    limit = max(1, min(limit, 100))
+    await stats_writer.flush_player(player_name)
+    total, entries = await load_history(player_name, kind, offset, limit)
+    if total == 0 and not await redis_client.exists(player_stats_key(player_name)):
+        raise HTTPException(status_code=404, detail="Player not found")
 
-    # Préparer les stats du mode infini
-    infinite_stats = {
-        "is_end_of_session": True,
-        "words_found": infinite_data.get("words_found", 0),
-        "lives_gained": infinite_data.get("lives_gained", 0),
-        "max_lives": infinite_data.get("max_lives", 0),
-        "session_time": infinite_data.get("session_time", 0)
+    return {
+        "player_name": player_name,
+        "kind": kind,
+        "offset": offset,
+        "limit": limit,
+        "total": total,
+        "entries": entries
     }
 
-    # Mettre à jour les stats avec des valeurs factices pour le mot final
-    update_player_stats(
-        player_name=player_name,
-        won=False,  # Défaite en mode infini
-        word_length=1,  # Pas important pour les stats infini
-        wrong_letters_count=0,  # Pas important pour les stats infini
-        game_time=0,  # Pas important pour les stats infini
-        difficulty=0,  # Pas important pour les stats infini
-        infinite_stats=infinite_stats,
-        is_infinite_mode=True,
-        language="fr"  # Pour le mode infini, langue par défaut
-    )
-
-    return {"status": "success", "message": "Statistiques du mode infini enregistrées"}
+async def leaderboard_page(board, offset=0, limit=5):
+    """Une page d'un classement : [nom, {games_won, games_played, best_time}] dans l'ordre"""
+    key, descending = LEADERBOARDS[board]
+    player_names = await redis_client.zrange(key, offset, offset + limit - 1, desc=descending)
+    if not player_names:
+        return []
+
+    pipe = redis_client.pipeline(transaction=False)
+    for player_name in player_names:
+        pipe.hmget(player_stats_key(player_name), "games_won", "games_played", "best_time")
+    rows = await pipe.execute()
+
+    return [
+        [player_name, {
+            "games_won": json.loads(games_won or "0"),
+            "games_played": json.loads(games_played or "0"),
+            "best_time": json.loads(best_time or "null")
+        }]
+        for player_name, (games_won, games_played, best_time) in zip(player_names, rows)
+    ]
 
 @app.get("/api/leaderboard")
-async def get_leaderboard():
-    stats = load_stats()
-    if not stats:
-        return {"players_by_wins": [], "players_by_winrate": [], "players_by_speed": []}
-
-    # Sort players by different criteria
-    players_by_wins = sorted(stats.items(), key=lambda x: x[1]["games_won"], reverse=True)[:5]
-    players_by_winrate = sorted(
-        [(name, data) for name, data in stats.items() if data["games_played"] >= 3],
-        key=lambda x: x[1]["games_won"] / x[1]["games_played"] if x[1]["games_played"] > 0 else 0,
-        reverse=True
-    )[:5]
-    players_by_speed = sorted(
-        [(name, data) for name, data in stats.items() if data["best_time"] is not None],
-        key=lambda x: x[1]["best_time"]
-    )[:5]
+async def get_leaderboard(limit: int = 5):
+    limit = max(1, min(limit, 100))
+    return {
+        "players_by_wins": await leaderboard_page("wins", 0, limit),
+        "players_by_winrate": await leaderboard_page("winrate", 0, limit),
+        "players_by_speed": await leaderboard_page("speed", 0, limit)
+    }
 
+@app.get("/api/leaderboard/player/{player_name}")
+async def get_player_ranks(player_name: str):
+    """Rang (à partir de 1) et score du joueur dans chaque classement"""
+    pipe = redis_client.pipeline(transaction=False)
+    for key, descending in LEADERBOARDS.values():
+        if descending:
+            pipe.zrevrank(key, player_name)
+        else:
+            pipe.zrank(key, player_name)
+        pipe.zscore(key, player_name)
+    results = await pipe.execute()
+
+    ranks = {}
+    for i, board in enumerate(LEADERBOARDS):
+        rank, score = results[2 * i], results[2 * i + 1]
+        ranks[board] = {"rank": rank + 1, "score": score} if rank is not None else None
+    return {"player_name": player_name, "ranks": ranks}
+
+@app.get("/api/leaderboard/{board}")
+async def get_leaderboard_board(board: str, offset: int = 0, limit: int = 20):
+    """Pagination d'un classement (wins, winrate ou speed)"""
+    if board not in LEADERBOARDS:
+        raise HTTPException(status_code=404, detail="Leaderboard not found")
+
+    offset = max(0, offset)
+    limit = max(1, min(limit, 100))
     return {
-        "players_by_wins": players_by_wins,
-        "players_by_winrate": players_by_winrate,
-        "players_by_speed": players_by_speed
+        "board": board,
+        "offset": offset,
+        "total": await redis_client.zcard(LEADERBOARDS[board][0]),
+        "players": await leaderboard_page(board, offset, limit)
     }
 
 if __name__ == "__main__":
@@ -0,0 +1,78 @@
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import time
+
+# Hash des mots de passe : PBKDF2-SHA256 salé, "pbkdf2_sha256$<itérations>$<sel>$<hash>"
+PASSWORD_ALGORITHM = "pbkdf2_sha256"
+PASSWORD_ITERATIONS = int(os.getenv("PASSWORD_ITERATIONS", "200000"))
+
+# Jetons de session signés (HMAC-SHA256). SESSION_SECRET doit être identique sur tous
+# les workers, sinon un jeton émis par l'un sera refusé par les autres. Sans variable,
+# un secret aléatoire propre au processus est tiré (un seul worker, développement).
+SESSION_SECRET_FROM_ENV = bool(os.getenv("SESSION_SECRET"))
+SESSION_SECRET = os.getenv("SESSION_SECRET") or secrets.token_hex(32)
+SESSION_TTL = int(os.getenv("SESSION_TTL", str(7 * 24 * 3600)))
+
+# Jeton des routes d'administration (/api/admin/...) ; sans ADMIN_TOKEN elles sont désactivées
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+
+def hash_password(password: str) -> str:
+    """Hash le mot de passe avec PBKDF2-SHA256 et un sel aléatoire"""
+    salt = secrets.token_hex(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt.encode(), PASSWORD_ITERATIONS)
+    return f"{PASSWORD_ALGORITHM}${PASSWORD_ITERATIONS}${salt}${digest.hex()}"
+
+
+def verify_password(password: str, stored_hash: str):
+    """Vérifie un mot de passe, retourne (valide, à_rehasher).
+
+    Les anciens comptes ont un SHA-256 non salé : ils sont acceptés puis signalés
+    pour être rehashés, tout comme les hashes PBKDF2 avec moins d'itérations.
+    """
+    if not stored_hash.startswith(f"{PASSWORD_ALGORITHM}$"):
+        legacy = hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(legacy, stored_hash), True
+
+    _, iterations, salt, expected = stored_hash.split("$")
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt.encode(), int(iterations))
+    valid = hmac.compare_digest(digest.hex(), expected)
+    return valid, valid and int(iterations) < PASSWORD_ITERATIONS
+
+
+def _sign(payload: str) -> str:
+    return hmac.new(SESSION_SECRET.encode(), payload.encode(), hashlib.sha256).hexdigest()
+
+
+def create_session_token(player_name: str) -> str:
+    """Jeton signé "<nom en base64>.<expiration>.<signature>" remis à la connexion"""
+    encoded_name = base64.urlsafe_b64encode(player_name.encode()).decode().rstrip("=")
+    payload = f"{encoded_name}.{int(time.time()) + SESSION_TTL}"
+    return f"{payload}.{_sign(payload)}"
+
+
+def verify_session_token(token: str):
+    """Retourne le nom du joueur si le jeton est valide et non expiré, sinon None"""
+    try:
+        encoded_name, expires_at, signature = token.split(".")
+    except (AttributeError, ValueError):
+        return None
+
+    payload = f"{encoded_name}.{expires_at}"
+    if not hmac.compare_digest(_sign(payload), signature):
+        return None
+    if not expires_at.isdigit() or int(expires_at) < time.time():
+        return None
+
+    padding = "=" * (-len(encoded_name) % 4)
+    return base64.urlsafe_b64decode(encoded_name + padding).decode()
+
+
+def verify_admin_token(token) -> bool:
+    """Vrai si `token` est le jeton d'administration configuré"""
+    if not ADMIN_TOKEN or not token:
+        return False
+    return hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode())
@@ -0,0 +1,90 @@
+"""Démarrage à froid d'un worker : import de api.py puis première réponse HTTP.
+
+Usage :
+    python benchmarks/cold_start.py --runs 10
+    python benchmarks/cold_start.py --runs 10 --fake   # serveur sur fakeredis
+
+Chaque mesure lance un processus neuf. "import_ms" est le temps d'import de api.py
+seul ; "first_response_ms" va du lancement du processus uvicorn à la première
+réponse de /api/languages (lifespan et migration compris).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+from common import patch_fakeredis
+
+
+def import_only(fake):
+    """Point d'entrée du processus de mesure de l'import"""
+    if fake:
+        patch_fakeredis()
+    start = time.perf_counter()
+    import api  # noqa: F401
+    print(json.dumps({"import_ms": (time.perf_counter() - start) * 1000}))
+
+
+def serve(port, fake):
+    """Point d'entrée du processus serveur"""
+    if fake:
+        patch_fakeredis()
+    import uvicorn
+    import api
+    uvicorn.run(api.app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def measure_import(fake):
+    command = [sys.executable, os.path.abspath(__file__), "--import-only"] + (["--fake"] if fake else [])
+    output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])["import_ms"]
+
+
+def measure_first_response(port, fake, timeout=30):
+    command = [sys.executable, os.path.abspath(__file__), "--serve", "--port", str(port)] + (["--fake"] if fake else [])
+    start = time.perf_counter()
+    server = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/languages", timeout=1):
+                    return (time.perf_counter() - start) * 1000
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError("Le serveur n'a pas répondu")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def summary(values):
+    return {"median": round(statistics.median(values), 1), "min": round(min(values), 1), "max": round(max(values), 1)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--fake", action="store_true", help="fakeredis au lieu de REDIS_URL")
+    parser.add_argument("--import-only", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.import_only:
+        import_only(args.fake)
+        sys.exit(0)
+    if args.serve:
+        serve(args.port, args.fake)
+        sys.exit(0)
+
+    imports = [measure_import(args.fake) for _ in range(args.runs)]
+    responses = [measure_first_response(args.port, args.fake) for _ in range(args.runs)]
+    print(json.dumps({
+        "runs": args.runs,
+        "import_ms": summary(imports),
+        "first_response_ms": summary(responses)
+    }, indent=2))
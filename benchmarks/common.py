@@ -0,0 +1,41 @@
+"""Outils communs aux benchmarks.
+
+L'import place la racine du dépôt dans sys.path et en fait le répertoire courant
+(dictionnaires, fichiers statiques), quel que soit l'endroit d'où le script est lancé.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+# Lettres par fréquence décroissante dans chaque langue
+LETTER_ORDER = {
+    "fr": "esaitnrulodcmpgbvhfqyxjkwz",
+    "en": "etaoinshrdlcumwfgypbvkjxqz"
+}
+GUESS_ORDER = LETTER_ORDER["fr"]
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def patch_fakeredis():
+    """Remplace les clients Redis (synchrone et asynchrone) par fakeredis, sur un même serveur.
+
+    À appeler avant `import api` dans un processus serveur lancé par le benchmark.
+    """
+    import fakeredis
+    import redis
+    import redis.asyncio
+
+    server = fakeredis.FakeServer()
+    redis.from_url = lambda *args, **kwargs: fakeredis.FakeRedis(server=server, decode_responses=True)
+    redis.asyncio.Redis = lambda *args, **kwargs: fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
@@ -0,0 +1,109 @@
+"""Latence de /api/game/guess avec N parties jouées en parallèle.
+
+Usage :
+    python benchmarks/guess_latency.py --games 500
+    python benchmarks/guess_latency.py --games 500 --fake   # fakeredis au lieu de REDIS_URL
+    python benchmarks/guess_latency.py --games 500 --fake --redis-latency-ms 0.5
+
+Les requêtes passent directement par l'application ASGI (httpx.ASGITransport),
+donc le chiffre mesuré est le temps passé dans les handlers et dans Redis.
+fakeredis répond sans aucune latence réseau : un aller-retour de plus ou de moins
+ne change presque rien au p99. --redis-latency-ms ajoute un délai à chaque commande
+et à chaque pipeline (un aller-retour chacun) pour simuler un Redis distant et
+comparer deux versions dans des conditions proches de la production. Sans
+--think-ms, chaque partie renvoie son coup suivant dès la réponse reçue (boucle
+fermée) : avec beaucoup de parties, le p99 mesure surtout la file d'attente.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import httpx
+
+from common import GUESS_ORDER, percentile
+
+
+def simulate_redis_latency(latency_ms):
+    """Ajoute `latency_ms` à chaque aller-retour des clients redis.asyncio (fakeredis compris)"""
+    import redis.asyncio.client
+
+    delay = latency_ms / 1000
+    execute_command = redis.asyncio.client.Redis.execute_command
+    pipeline_execute = redis.asyncio.client.Pipeline.execute
+
+    async def delayed_execute_command(self, *args, **options):
+        await asyncio.sleep(delay)
+        return await execute_command(self, *args, **options)
+
+    async def delayed_pipeline_execute(self, *args, **kwargs):
+        if self.command_stack:
+            await asyncio.sleep(delay)
+        return await pipeline_execute(self, *args, **kwargs)
+
+    redis.asyncio.client.Redis.execute_command = delayed_execute_command
+    redis.asyncio.client.Pipeline.execute = delayed_pipeline_execute
+
+
+async def play_game(client, player_index, token, latencies, think_ms, rng):
+    response = await client.post("/api/game/start", json={
+        "player_name": f"bench {player_index}", "token": token, "difficulty": "easy", "language": "fr"
+    })
+    game_id = response.json()["game_id"]
+
+    for letter in GUESS_ORDER:
+        if think_ms:
+            await asyncio.sleep(rng.uniform(0, 2 * think_ms) / 1000)
+        start = time.perf_counter()
+        response = await client.post("/api/game/guess", json={"game_id": game_id, "guess": letter})
+        latencies.append((time.perf_counter() - start) * 1000)
+        if response.json()["status"] != "playing":
+            break
+
+
+async def run(games, fake, redis_latency_ms=0.0, think_ms=0.0):
+    if redis_latency_ms:
+        simulate_redis_latency(redis_latency_ms)
+    import api
+
+    if fake:
+        import fakeredis
+        api.redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        api.game_store.client = api.redis_client
+
+    latencies = []
+    transport = httpx.ASGITransport(app=api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Comptes créés séquentiellement : seul le jeu est mesuré en parallèle
+        tokens = []
+        for i in range(games):
+            response = await client.post("/api/player/login", json={"player_name": f"bench {i}", "password": "bench"})
+            tokens.append(response.json()["token"])
+
+        start = time.perf_counter()
+        await asyncio.gather(*(play_game(client, i, token, latencies, think_ms, random.Random(i)) for i, token in enumerate(tokens)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "games": games,
+        "redis_latency_ms": redis_latency_ms,
+        "think_ms": think_ms,
+        "guesses": len(latencies),
+        "elapsed_s": round(elapsed, 3),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3)
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--fake", action="store_true", help="utiliser fakeredis au lieu de REDIS_URL")
+    parser.add_argument("--redis-latency-ms", type=float, default=0.0,
+                        help="délai ajouté à chaque aller-retour Redis (simule un Redis distant)")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="temps de réflexion moyen entre deux coups")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args.games, args.fake, args.redis_latency_ms, args.think_ms)), indent=2))
@@ -0,0 +1,65 @@
+"""Débit de make_guess (propositions par seconde), sans la couche HTTP.
+
+Usage :
+    python benchmarks/guess_throughput.py --games 2000
+    python benchmarks/guess_throughput.py --games 2000 --fake   # fakeredis au lieu de REDIS_URL
+
+Les parties sont créées avec start_game puis jouées lettre par lettre jusqu'à
+la fin ; seul le temps passé dans make_guess est compté. Les propositions qui
+terminent la partie (écriture des stats) sont aussi mesurées à part.
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from common import GUESS_ORDER
+
+
+async def run(games, fake):
+    import api
+
+    if fake:
+        import fakeredis
+        api.redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        api.game_store.client = api.redis_client
+
+    login = await api.login_player(api.PlayerLogin(player_name="bench", password="bench"))
+
+    guesses = 0
+    elapsed = 0.0
+    playing_guesses = 0
+    playing_elapsed = 0.0
+    for _ in range(games):
+        game = await api.start_game(api.GameStart(
+            player_name="bench", token=login["token"], difficulty="easy", language="fr"
+        ))
+        for letter in GUESS_ORDER:
+            start = time.perf_counter()
+            response = await api.make_guess(api.GameGuess(game_id=game.game_id, guess=letter))
+            duration = time.perf_counter() - start
+            elapsed += duration
+            guesses += 1
+            if response.status != "playing":
+                break
+            playing_elapsed += duration
+            playing_guesses += 1
+
+    return {
+        "games": games,
+        "guesses": guesses,
+        "elapsed_s": round(elapsed, 3),
+        "guesses_per_s": round(guesses / elapsed, 1),
+        "us_per_guess": round(elapsed / guesses * 1e6, 2),
+        "us_per_playing_guess": round(playing_elapsed / playing_guesses * 1e6, 2),
+        "us_per_final_guess": round((elapsed - playing_elapsed) / (guesses - playing_guesses) * 1e6, 2)
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--fake", action="store_true", help="utiliser fakeredis au lieu de REDIS_URL")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args.games, args.fake)), indent=2))
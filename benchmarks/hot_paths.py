@@ -0,0 +1,233 @@
+"""Micro-benchmarks des fonctions appelées à chaque coup ou à chaque partie.
+
+Usage :
+    python benchmarks/hot_paths.py --output bench.json
+    python benchmarks/hot_paths.py --baseline bench.json   # code de sortie 1 si régression
+    python benchmarks/hot_paths.py --quick --players 10 1000
+
+Couvre normalize_word, display_masked_word, word_is_complete, get_hint,
+choose_random_word (par difficulté et langue), draw_progress_bar (en cache et sans
+cache) et update_player_stats avec 10, 1 000 et 100 000 joueurs déjà en base.
+update_player_stats tourne sur fakeredis, sauf avec --redis-url : utiliser alors une
+base dédiée, elle est vidée (FLUSHDB) avant chaque taille. Sur fakeredis, remplir
+100 000 joueurs prend environ 100 s et les temps de Redis simulé sont plus bruités :
+comparer ces lignes avec une tolérance plus large.
+
+Les graines aléatoires sont fixes. Chaque mesure garde la médiane de plusieurs
+répétitions en nanosecondes par appel ; le résultat est un JSON comparable d'une
+version à l'autre avec --baseline.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+import common  # noqa: F401  (racine du dépôt dans sys.path)
+
+SAMPLE_WORDS = 200  # Mots tirés par langue pour les fonctions sur un mot
+
+
+def measure(function, number, repeat):
+    """Médiane et minimum en ns par appel de `function()` sur `repeat` séries de `number` appels"""
+    timings = [t / number * 1e9 for t in timeit.repeat(function, number=number, repeat=repeat)]
+    return {"ns_per_op": round(statistics.median(timings), 1), "min_ns": round(min(timings), 1)}
+
+
+def cycle(items):
+    """Fonction retournant l'élément suivant d'une liste à chaque appel (coût fixe, sans allocation)"""
+    state = [0]
+    count = len(items)
+
+    def next_item():
+        index = state[0]
+        state[0] = index + 1 if index + 1 < count else 0
+        return items[index]
+    return next_item
+
+
+def word_benchmarks(number, repeat):
+    from engine import display_masked_word, word_is_complete, get_hint
+    from list import DICTIONARIES, get_word_index, normalize_word, choose_random_word
+
+    random.seed(42)
+    results = {}
+    for language in DICTIONARIES:
+        index = get_word_index(language)
+        records = [index.record(random.randrange(len(index))) for _ in range(SAMPLE_WORDS)]
+        # État de partie réaliste : environ la moitié des lettres du mot trouvées
+        states = []
+        for record in records:
+            letters = [1 << i for i in range(26) if record.letters_mask >> i & 1]
+            found = sum(random.sample(letters, len(letters) // 2))
+            states.append((record, found))
+
+        next_word = cycle([record.word for record in records])
+        next_state = cycle(states)
+
+        results[f"normalize_word[{language}]"] = measure(lambda: normalize_word(next_word()), number, repeat)
+        results[f"display_masked_word[{language}]"] = measure(lambda: display_masked_word(*next_state()), number, repeat)
+        results[f"word_is_complete[{language}]"] = measure(lambda: word_is_complete(*next_state()), number, repeat)
+        results[f"get_hint[{language}]"] = measure(lambda: get_hint(*next_state()), number, repeat)
+
+        for difficulty in range(3):
+            results[f"choose_random_word[{language},{difficulty}]"] = measure(
+                lambda: choose_random_word(difficulty, language), number, repeat
+            )
+    return results
+
+
+def art_benchmarks(number, repeat):
+    from engine import DIFFICULTY_LEVELS, MAX_ERRORS
+    from hangman_art import draw_progress_bar, render_progress_bar
+
+    frames = cycle([
+        (errors, MAX_ERRORS[name], level)
+        for name, level in DIFFICULTY_LEVELS.items()
+        for errors in range(MAX_ERRORS[name] + 1)
+    ])
+    return {
+        "draw_progress_bar": measure(lambda: draw_progress_bar(*frames()), number, repeat),
+        "render_progress_bar": measure(lambda: render_progress_bar(*frames()), number, repeat)
+    }
+
+
+def populate(client, players):
+    """`players` joueurs avec des stats plausibles (hash, index et classements), par paquets de 1 000"""
+    from storage import (STATS_INDEX_KEY, default_player_stats, encode_player_stats, player_stats_key,
+                         write_leaderboard_scores)
+
+    rng = random.Random(players)
+    for start in range(0, players, 1000):
+        pipe = client.pipeline(transaction=False)
+        for i in range(start, min(players, start + 1000)):
+            player_stats = default_player_stats()
+            games_played = rng.randint(1, 200)
+            player_stats.update({
+                "games_played": games_played,
+                "games_won": rng.randint(0, games_played),
+                "total_time": games_played * rng.uniform(20, 90),
+                "best_time": rng.uniform(5, 60),
+                "longest_word": rng.randint(4, 15)
+            })
+            player_name = f"joueur {i}"
+            pipe.hset(player_stats_key(player_name), mapping=encode_player_stats(player_stats))
+            pipe.sadd(STATS_INDEX_KEY, player_name)
+            write_leaderboard_scores(pipe, player_name, player_stats)
+        pipe.execute()
+
+
+async def time_updates(update_player_stats, calls):
+    rng = random.Random(0)
+    timings = []
+    for i in range(calls):
+        won = rng.random() < 0.5
+        start = time.perf_counter()
+        await update_player_stats(
+            "bench", won=won, word_length=rng.randint(4, 12), wrong_letters_count=rng.randint(0, 5),
+            game_time=rng.uniform(10, 120), difficulty=i % 3, hints_used=rng.randint(0, 2),
+            secret_word="ordinateur", language="fr"
+        )
+        timings.append((time.perf_counter() - start) * 1e9)
+    timings.sort()
+    return {
+        "ns_per_op": round(statistics.median(timings), 1),
+        "min_ns": round(timings[0], 1),
+        "p95_ns": round(timings[int(0.95 * (len(timings) - 1))], 1)
+    }
+
+
+def stats_benchmarks(sizes, calls, redis_url=None):
+    import redis
+    import redis.asyncio
+    import api
+
+    results = {}
+    for players in sizes:
+        if redis_url:
+            sync_client = redis.from_url(redis_url, decode_responses=True)
+            sync_client.flushdb()
+            api.redis_client = redis.asyncio.from_url(redis_url, decode_responses=True)
+        else:
+            import fakeredis
+            server = fakeredis.FakeServer()
+            sync_client = fakeredis.FakeRedis(server=server, decode_responses=True)
+            api.redis_client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+
+        start = time.perf_counter()
+        populate(sync_client, players)
+        populate_s = time.perf_counter() - start
+
+        result = asyncio.run(time_updates(api.update_player_stats, calls))
+        result["populate_s"] = round(populate_s, 2)
+        results[f"update_player_stats[{players}]"] = result
+        sync_client.close()
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, tolerance):
+    """Benchmarks plus lents que la référence de plus de `tolerance` (0.2 = 20 %)"""
+    regressions = {}
+    for name, result in results.items():
+        reference = baseline.get("results", {}).get(name)
+        if reference and result["ns_per_op"] > reference["ns_per_op"] * (1 + tolerance):
+            regressions[name] = {
+                "baseline_ns": reference["ns_per_op"],
+                "ns_per_op": result["ns_per_op"],
+                "ratio": round(result["ns_per_op"] / reference["ns_per_op"], 2)
+            }
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, nargs="+", default=[10, 1000, 100000],
+                        help="tailles de la base pour update_player_stats")
+    parser.add_argument("--calls", type=int, default=200, help="appels à update_player_stats par taille")
+    parser.add_argument("--quick", action="store_true", help="moins de répétitions (vérification rapide)")
+    parser.add_argument("--redis-url", help="base Redis dédiée au lieu de fakeredis (vidée par le benchmark)")
+    parser.add_argument("--output", help="fichier JSON des résultats (sinon sortie standard)")
+    parser.add_argument("--baseline", help="résultats de référence à comparer")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="ralentissement toléré (0.2 = 20 %%)")
+    args = parser.parse_args()
+
+    number, repeat = (2000, 3) if args.quick else (20000, 7)
+    results = {}
+    results.update(word_benchmarks(number, repeat))
+    results.update(art_benchmarks(number, repeat))
+    results.update(stats_benchmarks(args.players, args.calls, args.redis_url))
+
+    report = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "redis": "redis" if args.redis_url else "fakeredis",
+        "results": results
+    }
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            report["regressions"] = compare(results, json.load(f), args.tolerance)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if report.get("regressions"):
+        print(f"❌ {len(report['regressions'])} benchmark(s) en régression", file=sys.stderr)
+        sys.exit(1)
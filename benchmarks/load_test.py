@@ -0,0 +1,214 @@
+"""Test de charge de bout en bout : N joueurs simulés suivent le parcours réel.
+
+Usage :
+    python benchmarks/load_test.py --players 100 --games 5 --fake        # application en processus, fakeredis
+    python benchmarks/load_test.py --players 100 --games 5               # en processus, REDIS_URL
+    python benchmarks/load_test.py --players 100 --url http://127.0.0.1:8000 --redis-url redis://localhost:6379
+
+Chaque joueur se connecte (/api/player/login) puis enchaîne ses parties :
+/api/game/start, propositions sur /api/game/guess dans l'ordre des lettres les plus
+fréquentes de la langue (un indice de temps en temps, un peu de hasard), puis
+/api/stats/{player} et /api/leaderboard. Les stats sont écrites en différé, mais
+/api/stats écrit d'abord les fins de partie du joueur encore en file : la partie qui
+vient de finir y figure (les erreurs sont comptées dans "errors" par code HTTP).
+
+En processus, l'application tourne avec son lifespan (file d'écriture des stats
+comprise) et les commandes Redis sont comptées côté client. Avec --url, le serveur
+est déjà lancé ; les commandes ne sont comptées que si --redis-url donne accès à
+INFO sur le même Redis (les autres clients de ce Redis sont comptés aussi).
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+from collections import defaultdict
+
+import httpx
+
+from common import LETTER_ORDER, percentile
+
+HINT_PROBABILITY = 0.05
+
+
+class RedisCommandCounter:
+    """Compte les commandes envoyées par les clients redis.asyncio du processus"""
+
+    def __init__(self):
+        self.commands = 0
+        self.round_trips = 0
+
+    def install(self):
+        import redis.asyncio.client
+
+        counter = self
+        execute_command = redis.asyncio.client.Redis.execute_command
+        pipeline_execute = redis.asyncio.client.Pipeline.execute
+
+        async def counted_execute_command(self, *args, **options):
+            counter.commands += 1
+            counter.round_trips += 1
+            return await execute_command(self, *args, **options)
+
+        async def counted_pipeline_execute(self, *args, **kwargs):
+            counter.commands += len(self.command_stack)
+            counter.round_trips += 1 if self.command_stack else 0
+            return await pipeline_execute(self, *args, **kwargs)
+
+        redis.asyncio.client.Redis.execute_command = counted_execute_command
+        redis.asyncio.client.Pipeline.execute = counted_pipeline_execute
+
+    def snapshot(self):
+        return {"commands": self.commands, "round_trips": self.round_trips}
+
+
+def redis_info_commands(redis_url):
+    import redis
+    with redis.from_url(redis_url) as client:
+        return {"commands": client.info("stats")["total_commands_processed"], "round_trips": None}
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)  # endpoint -> ms
+        self.errors = defaultdict(lambda: defaultdict(int))  # endpoint -> code HTTP -> nombre
+
+    async def request(self, client, endpoint, method, url, **kwargs):
+        start = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        self.latencies[endpoint].append((time.perf_counter() - start) * 1000)
+        if response.status_code >= 400:
+            self.errors[endpoint][response.status_code] += 1
+            return None
+        return response.json()
+
+
+def guess_order(language, rng):
+    """Ordre de fréquence légèrement mélangé : deux joueurs ne jouent pas exactement pareil"""
+    letters = list(LETTER_ORDER.get(language, LETTER_ORDER["fr"]))
+    for i in range(len(letters) - 1):
+        if rng.random() < 0.3:
+            letters[i], letters[i + 1] = letters[i + 1], letters[i]
+    return letters
+
+
+async def simulate_player(client, recorder, index, games, think_ms, languages, rng, delay):
+    await asyncio.sleep(delay)
+    player_name = f"charge {index}"
+    login = await recorder.request(client, "login", "POST", "/api/player/login",
+                                   json={"player_name": player_name, "password": "charge"})
+    if login is None:
+        return 0
+    token = login["token"]
+
+    finished = 0
+    for _ in range(games):
+        language = rng.choice(languages)
+        state = await recorder.request(client, "start", "POST", "/api/game/start", json={
+            "player_name": player_name, "token": token,
+            "difficulty": rng.choice(["easy", "middle", "hard"]), "language": language
+        })
+        if state is None:
+            continue
+
+        for letter in guess_order(language, rng):
+            if think_ms:
+                await asyncio.sleep(rng.uniform(0, 2 * think_ms) / 1000)
+            hint = state["lives"] > 2 and rng.random() < HINT_PROBABILITY
+            state = await recorder.request(client, "guess", "POST", "/api/game/guess", json={
+                "game_id": state["game_id"], "guess": "" if hint else letter,
+                "hint_requested": hint, "token": token
+            })
+            if state is None or state["status"] != "playing":
+                break
+        finished += 1
+
+        await recorder.request(client, "stats", "GET", f"/api/stats/{player_name}")
+        await recorder.request(client, "leaderboard", "GET", "/api/leaderboard")
+    return finished
+
+
+async def run(args):
+    recorder = Recorder()
+    rng = random.Random(args.seed)
+    languages = args.languages
+
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, limits=httpx.Limits(max_connections=args.players),
+                                   timeout=60)
+        count_commands = (lambda: redis_info_commands(args.redis_url)) if args.redis_url else None
+        lifespan = None
+    else:
+        os.environ.setdefault("MIGRATE_ON_STARTUP", "0")
+        os.environ.setdefault("SESSION_SECRET", "charge")  # Un seul processus, et pas d'avertissement dans le JSON
+        counter = RedisCommandCounter()
+        counter.install()
+        import api
+
+        if args.fake:
+            import fakeredis
+            api.redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+            api.game_store.client = api.redis_client
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=api.app), base_url="http://charge", timeout=60)
+        count_commands = counter.snapshot
+        lifespan = api.lifespan(api.app)
+        await lifespan.__aenter__()
+
+    before = count_commands() if count_commands else None
+    start = time.perf_counter()
+    async with client:
+        games = sum(await asyncio.gather(*(
+            simulate_player(client, recorder, i, args.games, args.think_ms, languages, random.Random(rng.random()),
+                            args.ramp_s * i / args.players)
+            for i in range(args.players)
+        )))
+    elapsed = time.perf_counter() - start
+    if lifespan is not None:
+        await lifespan.__aexit__(None, None, None)  # Vide la file des stats : ses écritures sont comptées
+    after = count_commands() if count_commands else None
+
+    requests = sum(len(values) for values in recorder.latencies.values())
+    report = {
+        "mode": "http" if args.url else "asgi",
+        "redis": "fakeredis" if args.fake else "redis",
+        "players": args.players,
+        "games": games,
+        "requests": requests,
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_s": round(requests / elapsed, 1),
+        "games_per_s": round(games / elapsed, 1),
+        "endpoints": {
+            endpoint: {
+                "requests": len(values),
+                "errors": dict(recorder.errors[endpoint]),
+                "mean_ms": round(statistics.fmean(values), 3),
+                "p50_ms": round(percentile(values, 50), 3),
+                "p95_ms": round(percentile(values, 95), 3),
+                "p99_ms": round(percentile(values, 99), 3)
+            }
+            for endpoint, values in recorder.latencies.items()
+        }
+    }
+    if before is not None and games:
+        report["redis_commands_per_game"] = round((after["commands"] - before["commands"]) / games, 1)
+        if after["round_trips"] is not None:
+            report["redis_round_trips_per_game"] = round((after["round_trips"] - before["round_trips"]) / games, 1)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=100, help="joueurs simultanés")
+    parser.add_argument("--games", type=int, default=5, help="parties par joueur")
+    parser.add_argument("--ramp-s", type=float, default=0, help="arrivée des joueurs étalée sur cette durée")
+    parser.add_argument("--think-ms", type=float, default=0, help="temps de réflexion moyen entre deux coups")
+    parser.add_argument("--languages", nargs="+", default=["fr", "en"])
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--fake", action="store_true", help="en processus : fakeredis au lieu de REDIS_URL")
+    parser.add_argument("--url", help="serveur déjà lancé (sinon application en processus)")
+    parser.add_argument("--redis-url", help="avec --url : Redis du serveur, pour compter les commandes (INFO)")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
@@ -0,0 +1,142 @@
+"""Test de charge : propositions par seconde via REST (/api/game/guess) et via WebSocket (/ws/game).
+
+Usage :
+    python benchmarks/ws_vs_rest.py --clients 50 --games 10
+    python benchmarks/ws_vs_rest.py --clients 50 --games 10 --fake   # serveur sur fakeredis
+
+Le serveur tourne dans un processus uvicorn séparé (un seul worker) ; son temps CPU
+est lu dans /proc pour donner le débit par cœur (messages par seconde CPU serveur).
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from common import GUESS_ORDER, patch_fakeredis
+
+
+def serve(port, fake):
+    """Point d'entrée du processus serveur"""
+    if fake:
+        patch_fakeredis()
+    import uvicorn
+    import api
+    uvicorn.run(api.app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def server_cpu_seconds(pid):
+    """Temps CPU (user + system) consommé par le processus serveur, ou None hors Linux"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def wait_for_port(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.1)
+    raise RuntimeError("Le serveur n'a pas démarré")
+
+
+async def rest_client(client, token, player_name, games):
+    messages = 0
+    for _ in range(games):
+        response = await client.post("/api/game/start", json={
+            "player_name": player_name, "token": token, "difficulty": "easy", "language": "fr"
+        })
+        game_id = response.json()["game_id"]
+        for letter in GUESS_ORDER:
+            response = await client.post("/api/game/guess", json={"game_id": game_id, "guess": letter, "token": token})
+            messages += 1
+            if response.json()["status"] != "playing":
+                break
+    return messages
+
+
+async def ws_client(url, token, games):
+    from websockets.asyncio.client import connect
+
+    messages = 0
+    async with connect(url) as websocket:
+        await websocket.send(json.dumps({"type": "auth", "token": token}))
+        await websocket.recv()
+        for _ in range(games):
+            await websocket.send(json.dumps({"type": "start", "difficulty": "easy", "language": "fr"}))
+            await websocket.recv()
+            for letter in GUESS_ORDER:
+                await websocket.send(json.dumps({"type": "guess", "guess": letter}))
+                delta = json.loads(await websocket.recv())
+                messages += 1
+                if delta["status"] != "playing":
+                    break
+    return messages
+
+
+async def measure(name, pid, coroutines):
+    cpu_before = server_cpu_seconds(pid)
+    start = time.perf_counter()
+    messages = sum(await asyncio.gather(*coroutines))
+    elapsed = time.perf_counter() - start
+    cpu_after = server_cpu_seconds(pid)
+
+    result = {"transport": name, "guesses": messages, "elapsed_s": round(elapsed, 3),
+              "guesses_per_s": round(messages / elapsed, 1)}
+    if cpu_before is not None and cpu_after is not None and cpu_after > cpu_before:
+        result["server_cpu_s"] = round(cpu_after - cpu_before, 3)
+        result["guesses_per_cpu_s"] = round(messages / (cpu_after - cpu_before), 1)
+    return result
+
+
+async def run(pid, port, clients, games):
+    import httpx
+
+    base_url = f"http://127.0.0.1:{port}"
+    async with httpx.AsyncClient(base_url=base_url, limits=httpx.Limits(max_connections=clients)) as client:
+        tokens = []
+        for i in range(clients):
+            response = await client.post("/api/player/login", json={"player_name": f"charge {i}", "password": "charge"})
+            tokens.append(response.json()["token"])
+
+        rest = await measure("rest", pid, [
+            rest_client(client, token, f"charge {i}", games) for i, token in enumerate(tokens)
+        ])
+
+    ws = await measure("websocket", pid, [
+        ws_client(f"ws://127.0.0.1:{port}/ws/game", token, games) for token in tokens
+    ])
+    return [rest, ws]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=50, help="joueurs simultanés")
+    parser.add_argument("--games", type=int, default=10, help="parties par joueur")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fake", action="store_true", help="serveur sur fakeredis au lieu de REDIS_URL")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.port, args.fake)
+        sys.exit(0)
+
+    command = [sys.executable, os.path.abspath(__file__), "--serve", "--port", str(args.port)]
+    if args.fake:
+        command.append("--fake")
+    server = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+    try:
+        wait_for_port(args.port)
+        print(json.dumps(asyncio.run(run(server.pid, args.port, args.clients, args.games)), indent=2))
+    finally:
+        server.terminate()
+        server.wait()
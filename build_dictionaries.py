@@ -0,0 +1,56 @@
+"""Compile les dictionnaires (dictionaries/<langue>.txt -> dictionaries/<langue>.dict).
+
+Usage :
+    python build_dictionaries.py            # toutes les langues
+    python build_dictionaries.py fr         # une seule langue
+    python build_dictionaries.py --check    # code de sortie 1 si un .dict est absent ou périmé
+
+Pour ajouter une langue : créer dictionaries/<code>.txt (en-tête "# name: ..." et
+"# flag: ...", puis un mot par ligne), lancer ce script et livrer les deux fichiers.
+Les doublons sont supprimés et les mots triés par longueur à la compilation.
+"""
+import argparse
+import os
+import sys
+
+from list import (DICTIONARY_DIR, compile_dictionary, dictionary_paths, read_dictionary_header,
+                  read_word_source, source_digest)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("languages", nargs="*", help="codes de langue (par défaut : toutes les sources)")
+    parser.add_argument("--check", action="store_true", help="vérifier sans écrire")
+    args = parser.parse_args()
+
+    languages = args.languages or sorted(
+        os.path.splitext(name)[0] for name in os.listdir(DICTIONARY_DIR) if name.endswith(".txt")
+    )
+
+    stale = []
+    for language in languages:
+        source_path, compiled_path = dictionary_paths(language)
+        if not os.path.exists(source_path):
+            print(f"❌ Source introuvable: {source_path}")
+            sys.exit(1)
+        digest = source_digest(source_path)
+
+        if args.check:
+            header = None
+            if os.path.exists(compiled_path):
+                with open(compiled_path, "rb") as f:
+                    header = read_dictionary_header(f.read())
+            if header is None or header.get("source_sha256") != digest:
+                stale.append(language)
+                print(f"⚠️ {compiled_path} absent ou périmé")
+            else:
+                print(f"✅ {compiled_path} à jour ({header['count']} mots)")
+            continue
+
+        meta, words = read_word_source(source_path)
+        data = compile_dictionary(language, meta, words, digest)
+        with open(compiled_path, "wb") as f:
+            f.write(data)
+        print(f"✅ {compiled_path}: {len(words)} mots, {len(data)} octets")
+
+    if stale:
+        sys.exit(1)
@@ -0,0 +1,191 @@
+import random
+import time
+
+from list import get_word_record, letter_bit, normalize_character, normalize_word
+
+# Difficultés : niveau et nombre de vies de départ
+DIFFICULTY_LEVELS = {"easy": 0, "middle": 1, "hard": 2}
+MAX_ERRORS = {"easy": 10, "middle": 6, "hard": 3}
+
+# États d'une partie
+PLAYING = "playing"
+WON = "won"
+LOST = "lost"
+
+# État des lettres d'une partie : deux masques de 26 bits (found_letters, wrong_letters)
+
+def display_masked_word(record, found_letters):
+    hidden = record.hidden_mask & ~record.positions_of(found_letters)
+    return "".join("_" if hidden >> i & 1 else character for i, character in enumerate(record.word))
+
+def word_is_complete(record, found_letters):
+    return record.letters_mask & ~found_letters == 0
+
+def get_hint(record, found_letters):
+    unfound_mask = record.positions_of(~found_letters)
+    unfound_positions = [i for i in range(len(record.word)) if unfound_mask >> i & 1]
+
+    if unfound_positions:
+        position = random.choice(unfound_positions)
+        return record.normalized[position], record.word[position]
+    return None, None
+
+
+class HangmanGame:
+    """Règles d'une partie de pendu, communes à l'API et au jeu en terminal.
+
+    L'état est le dictionnaire conservé par le stockage des parties. Chaque coup passe
+    par `play()`, qui retourne (résultat, détail) ; les seules transitions sont
+    playing -> won, playing -> lost et, en mode infini, won -> playing (`next_word()`).
+    Une fin de partie produit un unique événement `finished` : les arguments de
+    `update_player_stats`, à persister en une seule écriture.
+    """
+
+    def __init__(self, state):
+        self.state = state
+        self.record = get_word_record(state["secret_word"])
+        self.finished = None
+
+    @classmethod
+    def new(cls, player_name, difficulty, language, record, infinite=False):
+        """Nouvelle partie sur le mot `record` ; `difficulty` est "easy", "middle" ou "hard" """
+        state = {
+            "player_name": player_name,
+            "secret_word": record.word,
+            "found_letters": 0,
+            "wrong_letters": 0,
+            "difficulty": DIFFICULTY_LEVELS[difficulty],
+            "difficulty_name": difficulty,
+            "language": language,
+            "max_errors": MAX_ERRORS[difficulty],
+            "lives": MAX_ERRORS[difficulty],
+            "errors": 0,
+            "hints_used": 0,
+            "start_time": time.time(),
+            "status": PLAYING
+        }
+        if infinite:
+            state.update({
+                "infinite": True,
+                "words_found": 0,
+                "max_lives_reached": state["lives"],
+                "session_start": state["start_time"]
+            })
+        return cls(state)
+
+    @property
+    def status(self):
+        return self.state["status"]
+
+    def word_display(self):
+        return display_masked_word(self.record, self.state["found_letters"])
+
+    def play(self, guess, hint_requested=False, timeout=False):
+        """Joue un coup et retourne (résultat, détail).
+
+        Résultats : "timeout", "hint", "no_lives_for_hint", "no_hint", "empty",
+        "invalid", "repeated", "good_letter", "wrong_letter", "word_found", "wrong_word".
+        Le détail est la lettre révélée pour un indice, sinon la proposition.
+        """
+        if self.status != PLAYING:
+            raise ValueError("Game is finished")
+
+        if timeout:
+            return self._lose_life("timeout", None)
+
+        if hint_requested:
+            if self.state["lives"] <= 1:  # Doit avoir au moins 1 vie après l'indice
+                return "no_lives_for_hint", None
+            hint_letter, original_letter = get_hint(self.record, self.state["found_letters"])
+            if not hint_letter:
+                return "no_hint", None
+            self.state["found_letters"] |= letter_bit(hint_letter)
+            self.state["hints_used"] += 1
+            return self._lose_life("hint", original_letter)
+
+        guess = guess.strip().lower()
+        if not guess:
+            return "empty", guess
+
+        if len(guess) == 1:
+            letter = letter_bit(normalize_character(guess))
+            if not guess.isalpha() or not letter:
+                return "invalid", guess
+            if letter & (self.state["found_letters"] | self.state["wrong_letters"]):
+                return "repeated", guess
+            if letter & self.record.letters_mask:
+                self.state["found_letters"] |= letter
+                return self._check_complete("good_letter", guess)
+            self.state["wrong_letters"] |= letter
+            return self._lose_life("wrong_letter", guess)
+
+        if normalize_word(guess) == self.record.normalized:
+            self._finish(WON)
+            return "word_found", guess
+        return self._lose_life("wrong_word", guess)
+
+    def _lose_life(self, outcome, detail):
+        self.state["lives"] -= 1
+        self.state["errors"] += 1  # Maintenir errors pour la cohérence
+        if self.state["lives"] <= 0:
+            self._finish(LOST)
+        return self._check_complete(outcome, detail)
+
+    def _check_complete(self, outcome, detail):
+        if self.status == PLAYING and word_is_complete(self.record, self.state["found_letters"]):
+            self._finish(WON)
+        return outcome, detail
+
+    def _finish(self, status):
+        """Transition vers won/lost : fige le temps et prépare l'événement de persistance"""
+        state = self.state
+        state["status"] = status
+        state["game_time"] = time.time() - state["start_time"]
+        self.finished = {
+            "player_name": state["player_name"],
+            "won": status == WON,
+            "word_length": len(state["secret_word"]),
+            "wrong_letters_count": state["wrong_letters"].bit_count(),
+            "game_time": state["game_time"],
+            "difficulty": state["difficulty"],
+            "hints_used": state["hints_used"],
+            "secret_word": state["secret_word"],
+            "language": state.get("language", "fr")
+        }
+
+        # Fin d'une session infinie : ses stats partent dans le même événement
+        if status == LOST and state.get("infinite"):
+            self.finished["infinite_stats"] = {
+                "is_end_of_session": True,
+                "words_found": state["words_found"],
+                "lives_gained": state["words_found"],  # Une vie par mot trouvé
+                "max_lives": state["max_lives_reached"],
+                "session_time": time.time() - state["session_start"]
+            }
+
+    def next_word(self, record):
+        """Mode infini : après une victoire, enchaîne le mot suivant (+1 vie, vies reportées).
+
+        `max_errors` devient le nombre de vies au début du mot : la barre de progression
+        et `max_lives` restent cohérents avec des vies au-delà de celles de la difficulté.
+        """
+        if self.status != WON or not self.state.get("infinite"):
+            raise ValueError("Only a won infinite game can continue")
+
+        state = self.state
+        lives = state["lives"] + 1
+        state.update({
+            "secret_word": record.word,
+            "found_letters": 0,
+            "wrong_letters": 0,
+            "errors": 0,
+            "hints_used": 0,
+            "start_time": time.time(),
+            "status": PLAYING,
+            "lives": lives,
+            "max_errors": lives,
+            "words_found": state["words_found"] + 1,
+            "max_lives_reached": max(state["max_lives_reached"], lives)
+        })
+        state.pop("game_time", None)
+        self.record = record
@@ -1,4 +1,9 @@
-def draw_progress_bar(errors, max_errors, difficulty):
+from functools import lru_cache
+
+from engine import DIFFICULTY_LEVELS, MAX_ERRORS
+
+
+def render_progress_bar(errors, max_errors, difficulty):
     """
     Draw a visual progress bar that adapts to the difficulty level
     """
@@ -67,6 +72,33 @@ def draw_progress_bar(errors, max_errors, difficulty):
     {remaining} chances restantes
         """
 
+# Le dessin ne dépend que de (errors, max_errors, difficulty) : chaque image est calculée
+# une seule fois, et celles des trois difficultés standard dès l'import
+@lru_cache(maxsize=256)
+def draw_progress_bar(errors, max_errors, difficulty):
+    return render_progress_bar(errors, max_errors, difficulty)
+
+def frame_id(errors, max_errors, difficulty):
+    """Identifiant stable d'une image, que le client peut mettre en cache à la place du dessin"""
+    return f"{difficulty}-{max_errors}-{errors}"
+
+def parse_frame_id(value):
+    """(errors, max_errors, difficulty) d'un identifiant d'image, ou None s'il est invalide.
+    En mode infini `max_errors` suit les vies reportées et dépasse celui de la difficulté."""
+    try:
+        difficulty, max_errors, errors = (int(part) for part in value.split("-"))
+    except ValueError:
+        return None
+    if difficulty not in DIFFICULTY_LEVELS.values() or not 0 < max_errors <= 100 or not 0 <= errors <= 100:
+        return None
+    return errors, max_errors, difficulty
+
+FRAMES = {
+    frame_id(errors, MAX_ERRORS[name], level): draw_progress_bar(errors, MAX_ERRORS[name], level)
+    for name, level in DIFFICULTY_LEVELS.items()
+    for errors in range(MAX_ERRORS[name] + 1)
+}
+
 def draw_hangman(errors):
     """Legacy function for compatibility - redirects to progress bar"""
     return draw_progress_bar(errors, 6, 1)
\ No newline at end of file
@@ -1,314 +1,291 @@
+import hashlib
+import json
+import mmap
+import os
 import random
+import string
+import struct
+import unicodedata
 
-# Dictionnaire français (conservé tel quel)
-words = {
-    "ABANDONNER", "ABORDER", "ABOUTIR", "ABRITER", "ABSOUDRE", "ABSTENIR", "ACCEPTER", "ACCOMPAGNER", "ACCOMPLIR", "ACCORDER",
-    "ACCROCHER", "ACCUEILLIR", "ACHETER", "ACHEVER", "ACQUERIR", "ADAPTER", "ADDITIONNER", "ADHERER", "ADMETTRE", "ADOPTER",
-    "ADORER", "ADRESSER", "AFFAIBLIR", "AFFECTER", "AFFICHER", "AFFIRMER", "AFFRONTER", "AGACER", "AGGRAVER", "AGITER",
-    "AIDER", "AIMER", "AJOUTER", "ALARMER", "ALERTER", "ALIMENTER", "ALLER", "ALLONGER", "ALLUMER", "AMELIORER",
-    "AMENER", "AMUSER", "ANALYSER", "ANNONCER", "ANTICIPER", "APERCEVOIR", "APPARAITRE", "APPARTENIR", "APPELER", "APPORTER",
-    "APPRENDRE", "APPROCHER", "APPROUVER", "APPUYER", "ARRACHER", "ARRANGER", "ARRETER", "ARRIVER", "ASPIRER", "ASSEOIR",
-    "ASSISTER", "ASSOCIER", "ASSOMMER", "ASSURER", "ATTACHER", "ATTAQUER", "ATTEINDRE", "ATTENDRE", "ATTIRER", "ATTRAPER",
-    "AUGMENTER", "AUTORISER", "AVANCER", "AVISER", "AVOIR", "BAISSER", "BALANCER", "BANNIR", "BARRER", "BASER",
-    "BATTRE", "BAVARDER", "BENEFICIER", "BERCER", "BLESSER", "BLOQUER", "BOIRE", "BORDER", "BOUCHER", "BOUGER",
-    "BOULEVERSER", "BRILLER", "BRISER", "BRULER", "CACHER", "CALCULER", "CALMER", "CAMPER", "CAPTER", "CARACTERISER",
-    "CARESSER", "CASSER", "CAUSER", "CEDER", "CELEBRER", "CENTRER", "CERNER", "CESSER", "CHANGER", "CHANTER",
-    "CHARGER", "CHASSER", "CHAUFFER", "CHERCHER", "CHOISIR", "CHOQUER", "CIRCULER", "CITER", "CLASSER", "COGNER",
-    "COIFFER", "COINCER", "COLLABORER", "COLLER", "COLORER", "COMBATTRE", "COMBINER", "COMMANDER", "COMMENCER", "COMMETTRE",
-    "COMMUNIQUER", "COMPARER", "COMPENSER", "COMPLETER", "COMPLIQUER", "COMPOSER", "COMPRENDRE", "COMPRESSER", "COMPROMETTRE", "COMPTER",
-    "CONCEVOIR", "CONCERNER", "CONCLURE", "CONDAMNER", "CONDUIRE", "CONFIER", "CONFIRMER", "CONFONDRE", "CONGELER", "CONNAITRE",
-    "CONSACRER", "CONSEILLER", "CONSENTIR", "CONSERVER", "CONSIDERER", "CONSOLER", "CONSTATER", "CONSTITUER", "CONSTRUIRE", "CONSULTER",
-    "CONTACTER", "CONTENIR", "CONTENTER", "CONTINUER", "CONTRACTER", "CONTRAINDRE", "CONTRASTER", "CONTROLER", "CONVAINCRE", "CONVENIR",
-    "COOPERER", "COORDONNER", "COPIER", "CORRIGER", "CORRESPONDRE", "COUCHER", "COUDRE", "COULER", "COUPER", "COURIR",
-    "COUTER", "COUVRIR", "CRAINDRE", "CREER", "CREUSER", "CRIER", "CROIRE", "CROISER", "CROITRE", "CULTIVER",
-    "DANSER", "DATER", "DEBALLER", "DEBANDER", "DEBARQUER", "DEBARRASSER", "DEBATTRE", "DEBITER", "DEBORDER", "DEBOUCHER",
-    "DEBUTER", "DECEDER", "DECEVOIR", "DECIDER", "DECLARER", "DECLENCHER", "DECOLLER", "DECORER", "DECOUPER", "DECOURAGER",
-    "DECOUVRIR", "DECRIRE", "DECROCHER", "DEDIER", "DEFAIRE", "DEFENDRE", "DEFILER", "DEFINIR", "DEGAGER", "DEGONFLER",
-    "DEGUISER", "DEJEUNER", "DELIER", "DELIVRER", "DEMANDER", "DEMARRER", "DEMENAGER", "DEMOLIR", "DEMONTRER", "DENICHER",
-    "DENONCER", "DEPANNER", "DEPART", "DEPASSER", "DEPENDRE", "DEPENSER", "DEPLACER", "DEPLAIRE", "DEPOSER", "DERANGER",
-    "DEROBER", "DESCENDRE", "DESIGNER", "DESIRER", "DESSINER", "DETACHER", "DETAILLER", "DETECTER", "DETENDRE", "DETENIR",
-    "DETERMINER", "DETESTER", "DETOURNER", "DETRUIRE", "DEVELOPPER", "DEVENIR", "DEVINER", "DEVOIR", "DEVORER", "DIFFERER",
-    "DIFFUSER", "DIMINUER", "DINER", "DIRE", "DIRIGER", "DISCUTER", "DISPARAITRE", "DISPOSER", "DISTINGUER", "DISTRAIRE",
-    "DISTRIBUER", "DIVERTIR", "DIVISER", "DOMINER", "DONNER", "DORMIR", "DOUTER", "DRESSER", "DURER", "ECARQUER",
-    "ECARTER", "ECHANGER", "ECHAPPER", "ECHOUER", "ECLAIRCIR", "ECLAIRER", "ECLATER", "ECONOMISER", "ECOUTER", "ECRASER",
-    "ECRIRE", "EFFACER", "EFFECTUER", "EFFORCER", "EFFRAYER", "EGALER", "EGARER", "ELARGIR", "ELEVER", "ELIMINER",
-    "ELOIGNER", "EMBARQUER", "EMBRASSER", "EMMENER", "EMOUVOIR", "EMPECHER", "EMPLOYER", "EMPORTER", "EMPRUNTER", "ENCADRER",
-    "ENCOURAGER", "ENDORMIR", "ENERVER", "ENFILER", "ENFONCER", "ENGAGER", "ENLEVER", "ENNUYER", "ENRICHIR", "ENSEIGNER",
-    "ENSEMBLE", "ENTENDRE", "ENTERRER", "ENTOURER", "ENTRAINER", "ENTREPRENDRE", "ENTRER", "ENTRETENIR", "ENVELOPPER", "ENVIER",
-    "ENVOYER", "EPARGNER", "EPROUVER", "EQUILIBRER", "EQUIPER", "ESCALADER", "ESPERER", "ESSAYER", "ESSUYER", "ETABLIR",
-    "ETALER", "ETEINDRE", "ETENDRE", "ETONNER", "ETRANGLER", "ETRE", "ETUDIER", "EVACUER", "EVALUER", "EVANOUIR",
-    "EVITER", "EVOLUER", "EVOQUER", "EXAGERER", "EXAMINER", "EXCITER", "EXCLURE", "EXCUSER", "EXECUTER", "EXERCER",
-    "EXIGER", "EXISTER", "EXPLIQUER", "EXPLOITER", "EXPLORER", "EXPLOSER", "EXPORTER", "EXPOSER", "EXPRIMER", "FABRIQUER",
-    "FACILITER", "FACHER", "FAIRE", "FALLOIR", "FATIGUER", "FELICITER", "FERMER", "FETER", "FICHER", "FIGURER",
-    "FILER", "FINIR", "FIXER", "FLATTER", "FLEURIR", "FONCER", "FONCTIONNER", "FONDER", "FORCER", "FORMER",
-    "FORMULER", "FOURNIR", "FRAPPER", "FREINER", "FREQUENTER", "FROTTER", "FUIR", "FUMER", "GAGNER", "GARANTIR",
-    "GARDER", "GARER", "GATER", "GELER", "GENER", "GERER", "GLISSER", "GONFLER", "GOUTER", "GOUVERNER",
-    "GRANDIR", "GRATTER", "GRIMPER", "GROGNER", "GROSSIR", "GROUPER", "GUERIR", "GUIDER", "HABILLER", "HABITER",
-    "HABITUER", "HAIR", "HAUSSER", "HESITER", "HEURTER", "IDENTIFIER", "IGNORER", "ILLUMINER", "IMAGINER", "IMITER",
-    "IMPORTER", "IMPOSER", "IMPRESSIONNER", "IMPRIMER", "INCLURE", "INDIQUER", "INFECTER", "INFLIGER", "INFLUENCER", "INFORMER",
-    "INQUIETER", "INSCRIRE", "INSISTER", "INSTALLER", "INSTRUIRE", "INTEGRER", "INTERDIRE", "INTERESSER", "INTERPRETER", "INTERROGER",
-    "INTERROMPRE", "INTERVENIR", "INTIMIDER", "INTRODUIRE", "INVENTER", "INVITER", "ISOLER", "JETER", "JOINDRE", "JOUER",
-    "JOUIR", "JUGER", "JURER", "JUSTIFIER", "LACHER", "LAISSER", "LANCER", "LAVER", "LECHER", "LIBERER",
-    "LIMITER", "LIRE", "LIVRER", "LOGER", "LOUER", "LUTTER", "MACHER", "MAINTENIR", "MAITRISER", "MANGER",
-    "MANIPULER", "MANQUER", "MARCHER", "MARIER", "MARQUER", "MASSACRER", "MELANGER", "MENACER", "MENER", "MENTIR",
-    "MERITER", "MESURER", "METTRE", "MEUBLER", "MODERNISER", "MODIFIER", "MONTER", "MONTRER", "MOQUER", "MORDRE",
-    "MOUILLER", "MOURIR", "MOUVOIR", "MULTIPLIER", "MUNIR", "MURMURER", "NAITRE", "NAGER", "NEGLIGER", "NEGOCIER",
-    "NETTOYER", "NEUTRALISER", "NIER", "NIVELER", "NOMMER", "NOTER", "NOURRIR", "NUIRE", "OBEIR", "OBJECTER",
-    "OBLIGER", "OBSERVER", "OBTENIR", "OCCUPER", "OFFENSER", "OFFRIR", "OINDRE", "OPERER", "OPPOSER", "OPPRIMER",
-    "ORGANISER", "ORIENTER", "ORNER", "OSER", "OTER", "OUBLIER", "OUVRIR", "PARAITRE", "PARCOURIR", "PARDONNER",
-    "PARFAIRE", "PARFUMER", "PARIER", "PARLER", "PARTAGER", "PARTICIPER", "PARTIR", "PARVENIR", "PASSER", "PASSIONNER",
-    "PATIENTER", "PAYER", "PEINDRE", "PEINER", "PENCHER", "PENDRE", "PENETRER", "PENSER", "PERCEVOIR", "PERDRE",
-    "PERFECTIONNER", "PERMETTRE", "PERSISTER", "PERSUADER", "PESER", "PHOTOGRAPHIER", "PIEGER", "PLACER", "PLAINDRE", "PLAIRE",
-    "PLAISANTER", "PLANTER", "PLEUVOIR", "PLIER", "PLONGER", "PORTER", "POSER", "POSSEDER", "POURRIR", "POURSUIVRE",
-    "POUSSER", "POUVOIR", "PRATIQUER", "PRECEDER", "PRECHER", "PRECIPITER", "PRECISER", "PREDIRE", "PREFERER", "PRENDRE",
-    "PREOCCUPER", "PREPARER", "PRESENTER", "PRESERVER", "PRESSER", "PRETENDRE", "PRETER", "PREVOIR", "PRIER", "PRIVER",
-    "PROCEDER", "PROCURER", "PRODUIRE", "PROFITER", "PROGRAMMER", "PROJETER", "PROLONGER", "PROMENER", "PROMETTRE", "PRONONCER",
-    "PROPOSER", "PROTEGER", "PROUVER", "PROVOQUER", "PUBLIER", "PUISER", "PUNIR", "QUALIFIER", "QUITTER", "RACONTER",
-    "RAFRAICHIR", "RAISONNER", "RALENTIR", "RAMASSER", "RAMENER", "RANGER", "RAPPELER", "RAPPORTER", "RAPPROCHER", "RASSEMBLER",
-    "RASSURER", "RATER", "RATTRAPER", "REAGIR", "REALISER", "RECEVOIR", "RECHERCHER", "RECOMMANDER", "RECOMMENCER", "RECOMPENSER",
-    "RECONNAITRE", "RECOUVRIR", "RECUPERER", "REFAIRE", "REFERMER", "REFLECHIR", "REFLETER", "REFROIDIR", "REFUSER", "REGARDER",
-    "REGLER", "REGRETTER", "REJOINDRE", "REJOUIR", "RELACHER", "RELANCER", "RELEVER", "RELIER", "RELIRE", "REMARQUER",
-    "REMERCIER", "REMETTRE", "REMONTER", "REMPLACER", "REMPLIR", "REMUER", "RENCONTRER", "RENDRE", "RENONCER", "RENOUVELER",
-    "RENSEIGNER", "RENTRER", "RENVERSER", "RENVOYER", "REPANDRE", "REPARER", "REPARTIR", "REPASSER", "REPERER", "REPETER",
-    "REPONDRE", "REPORTER", "REPOSER", "REPRENDRE", "REPRESENTER", "REPROCHER", "RESERVER", "RESISTER", "RESOUDRE", "RESPECTER",
-    "RESPIRER", "RESSEMBLER", "RESSENTIR", "RESSORTIR", "RESTER", "RESUMER", "RETENIR", "RETIRER", "RETOMBER", "RETOURNER",
-    "RETROUVER", "REUNIR", "REUSSIR", "REVEILLER", "REVELER", "REVENIR", "REVER", "REVOIR", "RHABILLER", "RICHIR",
-    "RIMER", "RINCER", "RIRE", "RISQUER", "ROMPRE", "RONGER", "ROUGIR", "ROULER", "ROUVRIR", "SAISIR",
-    "SALIR", "SALUER", "SATISFAIRE", "SAUTER", "SAUVER", "SAVOIR", "SECHER", "SECOUER", "SECOURIR", "SEDUIRE",
-    "SEMBLER", "SEMER", "SENTIR", "SEPARER", "SERRER", "SERVIR", "SIGNER", "SIGNIFIER", "SIMPLIFIER", "SITUER",
-    "SOIGNER", "SOMBRER", "SONGER", "SONNER", "SORTIR", "SOUCIER", "SOUFFLER", "SOUFFRIR", "SOUHAITER", "SOULAGER",
-    "SOULEVER", "SOULIGNER", "SOUMETTRE", "SOUPCONNER", "SOURIRE", "SOUTENIR", "SOUVENIR", "SUBIR", "SUCCEDER", "SUFFIRE",
-    "SUGGERER", "SUIVRE", "SUPPORTER", "SUPPOSER", "SUPPRIMER", "SURGIR", "SURPRENDRE", "SURSAUTER", "SURVEILLER", "SURVIVRE",
-    "SUSCITER", "SUSPENDRE", "TACHER", "TACHER", "TAIRE", "TAPER", "TARDER", "TEINDRE", "TELEPHONER", "TEMOIN",
-    "TENDRE", "TENIR", "TENTER", "TERMINER", "TERRORISER", "TIRER", "TISSER", "TOMBER", "TONDRE", "TOUCHER",
-    "TOURNER", "TOUSSER", "TRACER", "TRADUIRE", "TRAINER", "TRAITER", "TRANCHER", "TRANSPORTER", "TRAVAILLER", "TRAVERSER",
-    "TREMBLER", "TROMPER", "TROUBLER", "TROUVER", "TUER", "UNIR", "UTILISER", "VACCINER", "VAINCRE", "VALOIR",
-    "VANTER", "VARIER", "VEGETER", "VEILLER", "VENDRE", "VENGER", "VENIR", "VERIFIER", "VERSER", "VETIR",
-    "VEXER", "VIDER", "VIEILLIR", "VISER", "VISITER", "VIVRE", "VOIR", "VOLER", "VOULOIR", "VOYAGER",
-    "ABRI", "ACCENT", "ACCORD", "ACHAT", "ACTION", "ACTIVITE", "ADRESSE", "AFFAIRE", "AFFICHE", "AGE",
-    "AIDE", "AILE", "AIR", "ALARME", "ALBUM", "ALIMENTATION", "ALLURE", "AMENDE", "AMI", "AMOUR",
-    "ANALYSE", "ANIMAL", "ANNEE", "ANNONCE", "APPAREIL", "APPARTEMENT", "APPEL", "APPETIT", "APPLICATION", "ARBRE",
-    "ARGENT", "ARME", "ARMOIRE", "ARRET", "ARRIVEE", "ART", "ARTICLE", "ASPECT", "ASSIETTE", "ASSOCIATION",
-    "ASSURANCE", "ATMOSPHERE", "ATTAQUE", "ATTENTION", "ATTITUDE", "AUGMENTATION", "AUTOROUTE", "AVANCEMENT", "AVENIR", "AVENTURE",
-    "AVERTISSEMENT", "AVION", "AVIS", "AVOCAT", "BAGARRE", "BAGUE", "BAIGNOIRE", "BAISSE", "BALANCE", "BANC",
-    "BANQUE", "BARBE", "BARQUE", "BASE", "BATAILLE", "BATEAU", "BATIMENT", "BATON", "BATTERIE", "BEAUTE",
-    "BESOIN", "BETE", "BEURRE", "BIBLIOTHEQUE", "BICYCLETTE", "BIEN", "BIERE", "BIJOU", "BILLET", "BIOLOGIE",
-    "BLAGUE", "BLANC", "BLESSURE", "BLOC", "BOEUF", "BOIRE", "BOIS", "BOISSON", "BOITE", "BONHEUR",
-    "BORD", "BOUCHE", "BOUCHON", "BOUE", "BOUGIE", "BOUTEILLE", "BOUTIQUE", "BRAS", "BRUIT", "BUREAU",
-    "BUS", "BUT", "CABANE", "CABINET", "CABLE", "CADEAU", "CADRE", "CAFE", "CAHIER", "CALCUL",
-    "CAMPAGNE", "CANAL", "CANAPE", "CANARD", "CAPITALE", "CARACTERE", "CARBONE", "CARNET", "CARRE", "CARTE",
-    "CARTON", "CASCADE", "CASQUE", "CASSURE", "CAUSE", "CAVE", "CENTRE", "CERCLE", "CERISE", "CERVEAU",
-    "CHAINE", "CHAIR", "CHAISE", "CHALEUR", "CHAMBRE", "CHAMP", "CHANCE", "CHANGEMENT", "CHANSON", "CHAPEAU",
-    "CHAQUE", "CHARBON", "CHARGE", "CHASSE", "CHATEAU", "CHAT", "CHAUSSURE", "CHEMIN", "CHEMISE", "CHEQUE",
-    "CHEVAL", "CHEVEU", "CHIEN", "CHIFFRE", "CHIMIE", "CHOCOLAT", "CHOIX", "CHOSE", "CIEL", "CIGARETTE",
-    "CINEMA", "CIRCULATION", "CIRE", "CITOYEN", "CITRON", "CLASSE", "CLE", "CLIENT", "CLIMAT", "CLOCHE",
-    "COEUR", "COFFRE", "COIN", "COLERE", "COLIS", "COLLEGE", "COLLINE", "COLONNE", "COMBAT", "COMEDIE",
-    "COMMANDE", "COMMENTAIRE", "COMMERCE", "COMMISSION", "COMPAGNIE", "COMPARAISON", "COMPETITION", "COMPORTEMENT", "COMPOSITION", "COMPREHENSION",
-    "COMPTE", "CONCENTRATION", "CONCEPT", "CONCOURS", "CONDITION", "CONFERENCE", "CONFIANCE", "CONFLIT", "CONGRES", "CONNAISSANCE",
-    "CONSEIL", "CONSENTEMENT", "CONSEQUENCE", "CONSERVATION", "CONSIDERATION", "CONSIGNE", "CONSTITUTION", "CONSTRUCTION", "CONSULTATION", "CONTACT",
-    "CONTE", "CONTENU", "CONTEXTE", "CONTRAT", "CONTRAIRE", "CONTROLE", "CONVERSATION", "COPIE", "CORPS", "CORRESPONDANCE",
-    "COULEUR", "COUP", "COUPLE", "COUR", "COURAGE", "COURRIER", "COURSE", "COUSIN", "COUTEAU", "COUTUME",
-    "COUVERTURE", "CRAINTE", "CRAVATE", "CRAYON", "CREATION", "CREATURE", "CREDIT", "CRIME", "CRISE", "CRISTAL",
-    "CRITERE", "CRITIQUE", "CROYANCE", "CUISINE", "CULTURE", "CURIOSITE", "CYCLE", "DAME", "DANGER", "DATE",
-    "DEBUT", "DECISION", "DECLARATION", "DECOR", "DECOUVERTE", "DEFAUT", "DEFENSE", "DEFI", "DEGRE", "DEMANDE",
-    "DEMARCHE", "DEMONSTRATION", "DENT", "DEPART", "DEPARTEMENT", "DEPENDANCE", "DEPENSE", "DEPOT", "DESCENTE", "DESCRIPTION",
-    "DESERT", "DESIR", "DESORDRE", "DETAIL", "DETENTION", "DETTE", "DEUIL", "DEVELOPPEMENT", "DEVOIR", "DIAGNOSTIC",
-    "DIALOGUE", "DIAMANT", "DICTIONNAIRE", "DIFFERENCE", "DIFFICULTE", "DIMENSION", "DIRECTION", "DIRECTEUR", "DISCIPLINE", "DISCOURS",
-    "DISCUSSION", "DISPOSITION", "DISTANCE", "DISTRIBUTION", "DIVERS", "DIVISION", "DOCUMENT", "DOMAINE", "DOMMAGE", "DONNEE",
-    "DOSSIER", "DOUTE", "DOUZAINE", "DROIT", "DUREE", "EAU", "ECHANTILLON", "ECHELLE", "ECLAIRAGE", "ECOLE",
-    "ECONOMIE", "ECRAN", "ECRITURE", "EDITION", "EDUCATION", "EFFET", "EFFORT", "EGALITE", "EGLISE", "ELECTION",
-    "ELECTRICITE", "ELEMENT", "ELEVATION", "EMOTION", "EMPLOI", "EMPLOYE", "EMPREINTE", "ENERGIE", "ENFANCE", "ENFANT",
-    "ENGAGEMENT", "ENQUETE", "ENSEIGNEMENT", "ENTHOUSIASME", "ENTRETIEN", "ENVIRONNEMENT", "EPISODE", "EPOQUE", "EPREUVE", "EQUILIBRE",
-    "EQUIPEMENT", "ERREUR", "ESCALIER", "ESPACE", "ESPECE", "ESPOIR", "ESPRIT", "ESSAI", "ESSENCE", "ETABLISSEMENT",
-    "ETAGE", "ETAPE", "ETAT", "ETIQUETTE", "ETOILE", "ETONNEMENT", "ETRANGER", "ETUDE", "EVALUATION", "EVENEMENT",
-    "EVOLUTION", "EXAMEN", "EXCEPTION", "EXCITATION", "EXCUSE", "EXEMPLE", "EXERCICE", "EXISTENCE", "EXPERIENCE", "EXPLICATION",
-    "EXPLOITATION", "EXPLORATION", "EXPLOSION", "EXPOSITION", "EXPRESSION", "EXTENSION", "EXTERIEUR", "FACE", "FACILITE", "FACTEUR",
-    "FACTURE", "FAIBLESSE", "FAIM", "FAMILLE", "FATIGUE", "FAUTE", "FAVEUR", "FEMME", "FENETRE", "FERME",
-    "FERMETURE", "FETE", "FEU", "FEUILLE", "FICHIER", "FIGURE", "FILM", "FILS", "FIN", "FINANCE",
-    "FLEUR", "FONCTION", "FOND", "FORCE", "FORME", "FORMULE", "FORTUNE", "FOULE", "FOURNITURE", "FRACTION",
-    "FRAICHEUR", "FRANCAIS", "FRANCHISE", "FREIN", "FREQUENCE", "FRERE", "FRONT", "FRUIT", "FUMEE", "FONCTION",
-    "GALERIE", "GANT", "GARAGE", "GARANTIE", "GARDE", "GARE", "GESTE", "GESTION", "GLACE", "GLOIRE",
-    "GOUVERNEMENT", "GRACE", "GRADE", "GRAIN", "GRAMMAIRE", "GRANDEUR", "GREVE", "GRIMACE", "GROUPE", "GUERRE",
-    "GUIDE", "HABITUDE", "HARMONIE", "HASARD", "HAUTEUR", "HERBE", "HERITAGE", "HEURE", "HISTOIRE", "HIVER",
-    "HOMME", "HONNEUR", "HOPITAL", "HORIZON", "HORLOGE", "HORREUR", "HOTEL", "HUMEUR", "HUMOUR", "HYPOTHESE",
-    "IDEE", "IMAGE", "IMAGINATION", "IMMEUBLE", "IMPORTANCE", "IMPRESSION", "IMPRIMANTE", "INCIDENT", "INDEPENDENCE", "INDICATION",
-    "INDUSTRIE", "INFECTION", "INFLUENCE", "INFORMATION", "INITIATIVE", "INJECTION", "INNOCENCE", "INQUIETUDE", "INSCRIPTION", "INSECTE",
-    "INSPIRATION", "INSTALLATION", "INSTANT", "INSTITUT", "INSTRUCTION", "INSTRUMENT", "INTELLIGENCE", "INTENTION", "INTERDICTION", "INTERET",
-    "INTERIEUR", "INTERPRETATION", "INTERROGATION", "INTERVENTION", "INTERVIEW", "INVENTION", "INVITATION", "ISSUE", "JARDIN", "JETON",
-    "JEU", "JEUNE", "JOIE", "JOURNAL", "JOURNEE", "JUGE", "JUGEMENT", "JUSTICE", "KILOMETRE", "LABORATOIRE",
-    "LANGUE", "LARGEUR", "LARME", "LECON", "LECTURE", "LETTRE", "LEVER", "LIAISON", "LIBERTE", "LICENCE",
-    "LIEU", "LIGNE", "LIMITE", "LINGE", "LISTE", "LIVRE", "LIVRAISON", "LOGEMENT", "LOGIQUE", "LOISIR",
-    "LONGUEUR", "LUMIERE", "LUNE", "LUNETTES", "LUTTE", "LUXE", "MACHINE", "MAGASIN", "MAGIE", "MAGISTRAT",
-    "MAIN", "MAINTIEN", "MAIRE", "MAISON", "MAITRE", "MAJEUR", "MAJORITE", "MALADIE", "MALENTENDU", "MALHEUR",
-    "MAMAN", "MANCHE", "MANDAT", "MANIERE", "MANIFESTATION", "MANIPULATION", "MANQUE", "MARCHE", "MARIAGE", "MARINE",
-    "MARQUE", "MASSE", "MATERIAU", "MATIERE", "MATIN", "MAXIMUM", "MECANISME", "MEDECIN", "MEDECINE", "MEETING",
-    "MELANCOLIE", "MEMBRE", "MEMOIRE", "MENACE", "MENAGE", "MENTION", "MENU", "MERCI", "MERE", "MESSAGE",
-    "MESURE", "METAL", "METHODE", "METRE", "MEUBLE", "MEURTRE", "MILIEU", "MILLION", "MINIMUM", "MINISTRE",
-    "MINUTE", "MIRACLE", "MIROIR", "MISSION", "MODELE", "MODIFICATION", "MOITIE", "MOMENT", "MONDE", "MONNAIE",
-    "MONTAGNE", "MONTE", "MONTRE", "MONUMENT", "MORCEAU", "MORT", "MOTEUR", "MOTIF", "MOUCHE", "MOUVEMENT",
-    "MOYEN", "MULE", "MULTICOLORE", "MUSEE", "MUSICIEN", "MUSIQUE", "MYSTERE", "NAISSANCE", "NATURE", "NAVIGATION",
-    "NECESSITE", "NEIGE", "NERF", "NETTOYAGE", "NIVEAU", "NOBLESSE", "NOEL", "NOMBRE", "NORD", "NORMALE",
-    "NOTE", "NOTION", "NOUVEAU", "NOUVELLE", "NUAGE", "NUANCE", "NUIT", "NUMERO", "OBJET", "OBLIGATION",
-    "OBSERVATION", "OBSTACLE", "OCCASION", "OCEAN", "ODEUR", "OEIL", "OEUF", "OEUVRE", "OFFICE", "OISEAU",
-    "OMBRE", "ONCLE", "OPINION", "OPPOSITION", "OPTION", "ORAGE", "ORDINATEUR", "ORDRE", "OREILLE", "ORGANE",
-    "ORGANISATION", "ORIGINE", "OUTIL", "OUVERTURE", "OUVRAGE", "OUVRIER", "PAGE", "PAIN", "PAIX", "PAPIER",
-    "PAQUET", "PARADIS", "PARAGRAPHE", "PARC", "PARCOURS", "PARENT", "PARESSE", "PARFUM", "PARLEMENT", "PAROLE",
-    "PART", "PARTAGE", "PARTI", "PARTIE", "PASSAGE", "PASSE", "PASSION", "PATIENCE", "PATRON", "PATTE",
-    "PAUME", "PAUVRE", "PAVILLON", "PAYS", "PAYSAGE", "PEAU", "PECHE", "PEINE", "PEINTURE", "PENSEE",
-    "PENTE", "PERCEPTION", "PERFECTION", "PERFORMANCE", "PERIODE", "PERMISSION", "PERSONNAGE", "PERSONNE", "PERSPECTIVE", "PERTE",
-    "PETIT", "PEUPLE", "PEUR", "PHASE", "PHENOMENE", "PHILOSOPHIE", "PHOTO", "PHRASE", "PHYSIQUE",
-    "PIANO", "PIECE", "PIED", "PIERRE", "PILOTE", "PINCEAU", "PIPE", "PISCINE", "PITIE", "PLACE",
-    "PLAFOND", "PLAGE", "PLAINTE", "PLAISIR", "PLAN", "PLANCHE", "PLANETE", "PLANTE", "PLASTIQUE", "PLAT",
-    "PLATEAU", "PLUIE", "PLUME", "POCHE", "POESIE", "POETE", "POIDS", "POINT", "POINTURE", "POISON",
-    "POISSON", "POLICE", "POLITIQUE", "POLLUTION", "POMME", "POMPE", "PONT", "POPULATION", "PORC", "PORT",
-    "PORTE", "PORTEE", "PORTION", "PORTRAIT", "POSITION", "POSSIBILITE", "POSTE", "POTERIE", "POUCE", "POUDRE",
-    "POULET", "POUMON", "POUPEE", "POURCENTAGE", "POURSUITE", "POUVOIR", "PRAIRIE", "PRATIQUE", "PRECISION", "PREDICTION",
-    "PREFERENCE", "PREMIER", "PREPARATION", "PRESENCE", "PRESENTATION", "PRESERVATION", "PRESIDENT", "PRESSION", "PRETEXTE", "PREUVE",
-    "PREVISION", "PRIERE", "PRINCIPE", "PRINTEMPS", "PRIORITE", "PRISON", "PRIX", "PROBLEME", "PROCEDURE", "PROCES",
-    "PRODUCTION", "PRODUIT", "PROFESSEUR", "PROFESSION", "PROFIL", "PROFIT", "PROFONDEUR", "PROGRAMME", "PROJET", "PROMESSE",
-    "PROMOTION", "PROPORTION", "PROPOSITION", "PROPRIETE", "PROTECTION", "PROTESTATION", "PROVINCE", "PROVISION", "PROXIMITE", "PRUDENCE",
-    "PSYCHOLOGIE", "PUBLIC", "PUBLICITE", "PUISSANCE", "PUNITION", "PURETE", "PYRAMIDE", "QUALITE", "QUANTITE", "QUARTIER",
-    "QUESTION", "QUEUE", "QUICONQUE", "RADIO", "RAISON", "RAPPORT", "RAPPROCHEMENT", "REALISATION", "REALITE", "RECOMPENSE",
-    "RECORD", "RECREATION", "RECUL", "REDUCTION", "REFLEXE", "REFLEXION", "REFORME", "REFUS", "REGARD", "REGIME",
-    "REGION", "REGLE", "REGLEMENT", "REGRET", "RELATION", "RELIEF", "RELIGION", "REMARQUE", "REMEDE", "REMERCIEMENT",
-    "REMISE", "REMPLACEMENT", "RENCONTRE", "RENDEMENT", "RENOVATION", "RENSEIGNEMENT", "RENTREE", "REPARATION", "REPAS", "REPETITION",
-    "REPONSE", "REPOS", "REPRESENTATION", "REPRODUCTION", "REPUTATION", "REQUETE", "RESERVE", "RESIDENCE", "RESISTANCE", "RESOLUTION",
-    "RESPECT", "RESPONSABILITE", "RESSOURCE", "RESTAURANT", "RESULTAT", "RETARD", "RETOUR", "RETRAITE", "RETROUVAILLE", "REUNION",
-    "REVE", "REVEIL", "REVELATION", "REVENU", "REVISION", "REVOLUTION", "REVUE", "RICHESSE", "RIDEAU", "RIGUEUR",
-    "RISQUE", "RIVIERE", "ROBE", "ROBOT", "ROLE", "ROMAN", "ROND", "ROSE", "ROUGE", "ROUTE",
-    "ROYAUME", "RUBAN", "RUE", "RUIN", "RYTHME", "SAC", "SACRIFICE", "SAGE", "SAGESSE", "SAISON",
-    "SALLE", "SALON", "SALUT", "SANTE", "SATISFACTION", "SAUCE", "SAUVETAGE", "SAVEUR", "SAVOIR", "SCANDALE",
-    "SCENE", "SCHEMA", "SCIENCE", "SCULPTURE", "SECONDE", "SECOURS", "SECRET", "SECTEUR", "SECURITE", "SEJOUR",
-    "SELECTION", "SEMAINE", "SEMENCE", "SENSATION", "SENS", "SENTIMENT", "SEPARATION", "SERIE", "SERPENT", "SERVICE",
-    "SEUIL", "SEXE", "SIEDE", "SIGNE", "SILENCE", "SIMPLICITE", "SIMULATION", "SITUATION", "SOCIETE", "SOEUR",
-    "SOIE", "SOIN", "SOIR", "SOIREE", "SOL", "SOLDAT", "SOLEIL", "SOLUTION", "SOMMEIL", "SOMMET",
-    "SON", "SONDAGE", "SONGE", "SORT", "SORTIE", "SOUCI", "SOUFFRANCE", "SOUHAIT", "SOULAGEMENT", "SOUPCON",
-    "SOURCE", "SOURIRE", "SOUVENIR", "SPECIALITE", "SPECTACLE", "SPECTATEUR", "SPORT", "STAGE", "STATION", "STATUE",
-    "STATUT", "STRUCTURE", "STUDIO", "STYLE", "SUCCES", "SUCRE", "SUD", "SUFFRAGE", "SUGGESTION", "SUITE",
-    "SUJET", "SUPERIEUR", "SUPPLEMENT", "SUPPORT", "SURFACE", "SURPRISE", "SURVEILLANCE", "SURVIE", "SYMBOLE", "SYMPATHIE",
-    "SYSTEME", "TABLE", "TABLEAU", "TACHE", "TAILLE", "TALENT", "TAPIS", "TARIF", "TASSE", "TAUX",
-    "TAXI", "TECHNIQUE", "TECHNOLOGIE", "TELEVISION", "TEMPERATURE", "TEMPLE", "TEMPS", "TENDANCE", "TENSION", "TENTATIVE",
-    "TENUE", "TERME", "TERRAIN", "TERRITOIRE", "TERREUR", "TETE", "TEXTE", "THEATRE", "THEME", "THEORIE",
-    "THERAPIE", "TICKET", "TIMBRE", "TITRE", "TOILETTE", "TOLERANCE", "TOMBE", "TON", "TONNERRE", "TORRENT",
-    "TORTUE", "TOTAL", "TOUCHE", "TOUR", "TOURISME", "TRADITION", "TRAFIC", "TRAIN", "TRAIT", "TRAITEMENT",
-    "TRANCHE", "TRANSPORT", "TRAVAIL", "TRAVERSE", "TRIBUNAL", "TRISTESSE", "TRONE", "TROU", "TROUPE", "TUBE",
-    "TUILE", "TUNNEL", "TYPE", "UNION", "UNITE", "UNIVERS", "UNIVERSITE", "URGENCE", "USAGE", "USINE",
-    "USTENSILE", "UTILISATION", "UTILITE", "VACANCE", "VAGUE", "VAISSELLE", "VALEUR", "VALLÉE", "VARIETE", "VASE",
-    "VEHICULE", "VEINE", "VELO", "VENDEUR", "VENTE", "VENT", "VENTRE", "VERITE", "VERRE", "VERSION",
-    "VERT", "VESTIGE", "VETEMENT", "VIANDE", "VICTOIRE", "VIDEO", "VIE", "VIEILLESSE", "VILLAGE", "VILLE",
-    "VIN", "VIOLENCE", "VIOLON", "VISAGE", "VISION", "VISITE", "VITESSE", "VOEU", "VOIE", "VOITURE",
-    "VOIX", "VOL", "VOLEUR", "VOLONTE", "VOLUME", "VOTE", "VOYAGE", "VRAIE", "VUE", "ZONE"
-}
-
-# Dictionnaire anglais
-words_en = {
-    "ABANDON", "ABILITY", "ABSENCE", "ABSOLUTE", "ABSTRACT", "ACADEMY", "ACCEPT", "ACCESS", "ACCIDENT", "ACCOUNT",
-    "ACCURATE", "ACHIEVE", "ACQUIRE", "ACTION", "ACTIVE", "ACTUAL", "ADDITION", "ADDRESS", "ADEQUATE", "ADVANCE",
-    "ADVANTAGE", "ADVENTURE", "ADVICE", "AFRAID", "AGAINST", "AGREEMENT", "AIRCRAFT", "ALCOHOL", "ALREADY", "ALTHOUGH",
-    "AMAZING", "AMOUNT", "ANALYSIS", "ANCIENT", "ANIMAL", "ANOTHER", "ANSWER", "ANXIETY", "ANYBODY", "ANYMORE",
-    "ANYTHING", "ANYWHERE", "APARTMENT", "APPARENT", "APPEAR", "APPROACH", "APPROVAL", "APPROVE", "ARGUMENT", "ARRANGE",
-    "ARRIVAL", "ARRIVE", "ARTICLE", "ARTIST", "ASSEMBLY", "ASSIGNMENT", "ASSIST", "ASSUME", "ATMOSPHERE", "ATTACH",
-    "ATTACK", "ATTEMPT", "ATTENTION", "ATTITUDE", "ATTRACT", "AUDIENCE", "AUTHOR", "AUTHORITY", "AVAILABLE", "AVERAGE",
-    "BALANCE", "BEAUTIFUL", "BECAUSE", "BECOME", "BEDROOM", "BEGINNING", "BEHAVIOR", "BELIEVE", "BENEFIT", "BETWEEN",
-    "BICYCLE", "BIRTHDAY", "BROTHER", "BUILDING", "BUSINESS", "CABINET", "CAMERA", "CAMPAIGN", "CAPABLE", "CAPACITY",
-    "CAPITAL", "CAPTAIN", "CAPTURE", "CAREFUL", "CAREER", "CENTURY", "CERTAIN", "CHAIRMAN", "CHALLENGE", "CHAMPION",
-    "CHAPTER", "CHARACTER", "CHARGE", "CHICKEN", "CHILDREN", "CHOCOLATE", "CHOICE", "CHRISTMAS", "CITIZEN", "CLASSIC",
-    "CLIMATE", "CLOTHES", "COLLECTION", "COLLEGE", "COLUMN", "COMBINATION", "COMMENT", "COMMITTEE", "COMMON", "COMMUNITY",
-    "COMPANY", "COMPARE", "COMPLETE", "COMPUTER", "CONCEPT", "CONCERN", "CONDITION", "CONFERENCE", "CONGRESS", "CONSIDER",
-    "CONSTRUCTION", "CONTACT", "CONTAIN", "CONTENT", "CONTEST", "CONTINUE", "CONTRACT", "CONTROL", "CONVERSATION", "CORNER",
-    "CORRECT", "COUNCIL", "COUNTRY", "COURAGE", "COURSE", "COVERAGE", "CREATIVE", "CREATURE", "CRIMINAL", "CRISIS",
-    "CRITICAL", "CULTURE", "CURIOUS", "CURRENT", "CUSTOMER", "DANGEROUS", "DAUGHTER", "DECISION", "DELIVERY", "DEMOCRACY",
-    "DEPARTMENT", "DESCRIBE", "DESIGN", "DESPERATE", "DETAIL", "DETERMINE", "DEVELOP", "DEVELOPMENT", "DEVICE", "DIAMOND",
-    "DIFFERENT", "DIFFICULT", "DINNER", "DIRECTION", "DIRECTOR", "DISCOVER", "DISCUSSION", "DISEASE", "DISPLAY", "DISTANCE",
-    "DISTRICT", "DOCUMENT", "DOMESTIC", "DRAMATIC", "DRAWING", "DRIVER", "DURING", "ECONOMY", "EDUCATION", "EFFECTIVE",
-    "EFFICIENCY", "ELECTION", "ELECTRIC", "ELEMENT", "ELEPHANT", "EMERGENCY", "EMOTION", "EMPLOYEE", "EMPLOYMENT", "ENERGY",
-    "ENGINEER", "ENGLISH", "ENORMOUS", "ENOUGH", "ENSURE", "ENTIRE", "ENVIRONMENT", "EPISODE", "EQUIPMENT", "ESCAPE",
-    "EVENING", "EVERYBODY", "EVERYONE", "EVERYTHING", "EVIDENCE", "EXACTLY", "EXAMPLE", "EXCHANGE", "EXCITEMENT", "EXERCISE",
-    "EXISTENCE", "EXPENSIVE", "EXPERIENCE", "EXPERIMENT", "EXPLAIN", "EXPRESSION", "EXTREME", "FACILITY", "FACTORY", "FAILURE",
-    "FAMILY", "FANTASY", "FASHION", "FATHER", "FEATURE", "FEDERAL", "FEELING", "FICTION", "FIFTEEN", "FIGHTER",
-    "FIGURE", "FINANCE", "FINDING", "FINGER", "FINISH", "FISHING", "FLIGHT", "FLOWER", "FOLLOWING", "FOOTBALL",
-    "FOREIGN", "FOREST", "FOREVER", "FORGET", "FORMAT", "FORMER", "FORTUNE", "FORWARD", "FOUNDATION", "FREEDOM",
-    "FREQUENT", "FRIENDLY", "FUNCTION", "FUNDAMENTAL", "FURNITURE", "FUTURE", "GALLERY", "GARDEN", "GENERAL", "GENERATION",
-    "GENTLEMAN", "GETTING", "GOVERNMENT", "GRAPHIC", "GROUND", "GROWING", "GROWTH", "GUARANTEE", "GUITAR", "HANDLE",
-    "HAPPEN", "HAPPINESS", "HARDWARE", "HEALTH", "HEARING", "HEAVEN", "HELPFUL", "HERITAGE", "HERSELF", "HIGHLIGHT",
-    "HISTORY", "HOLIDAY", "HOSPITAL", "HOWEVER", "HUNDRED", "HUSBAND", "IDENTITY", "IMAGINE", "IMMEDIATE", "IMPACT",
-    "IMPLEMENT", "IMPORTANT", "IMPROVE", "INCLUDE", "INCREASE", "INDEPENDENT", "INDUSTRY", "INFORMATION", "INITIAL", "INITIATIVE",
-    "INQUIRY", "INSIDE", "INSIGHT", "INSPIRE", "INSTALL", "INSTANCE", "INSTEAD", "INSTITUTE", "INSTRUCTION", "INSTRUMENT",
-    "INSURANCE", "INTELLIGENCE", "INTENTION", "INTEREST", "INTERNAL", "INTERNET", "INTERVIEW", "INTRODUCE", "INVASION", "INVEST",
-    "INVOLVE", "ISLAND", "ITSELF", "JACKET", "JOURNEY", "JUNIOR", "JUSTICE", "KITCHEN", "KNOWLEDGE", "LANGUAGE",
-    "LAPTOP", "LARGELY", "LATEST", "LAUNCH", "LAWYER", "LEADER", "LEADERSHIP", "LEADING", "LEAGUE", "LEARNING",
-    "LEATHER", "LEAVING", "LECTURE", "LEGACY", "LEGEND", "LEISURE", "LENGTH", "LESSON", "LETTER", "LIBRARY",
-    "LICENSE", "LIMITED", "LISTEN", "LITERATURE", "LIVING", "MACHINE", "MAGAZINE", "MAJORITY", "MANAGER", "MANNER",
-    "MANUFACTURE", "MARINE", "MARKET", "MARRIAGE", "MATERIAL", "MATTER", "MAXIMUM", "MEANING", "MEASURE", "MECHANIC",
-    "MEDICAL", "MEDICINE", "MEETING", "MEMBER", "MEMORY", "MENTION", "MESSAGE", "METHOD", "MIDDLE", "MILITARY",
-    "MILLION", "MINIMUM", "MINISTER", "MINUTE", "MIRROR", "MISSION", "MISTAKE", "MIXTURE", "MOBILE", "MODERN",
-    "MONITOR", "MONTH", "MORNING", "MORTGAGE", "MOTHER", "MOTION", "MOUNTAIN", "MOVEMENT", "MULTIPLE", "MUSCLE",
-    "MUSEUM", "MUSICIAN", "NATIONAL", "NATURAL", "NATURE", "NECESSARY", "NETWORK", "NEUTRAL", "NEWSPAPER", "NOTHING",
-    "NOTICE", "NUMBER", "NURSING", "OBJECT", "OBSERVE", "OBVIOUS", "OCCASION", "OFFICER", "OFFICIAL", "OPENING",
-    "OPERATE", "OPINION", "OPPOSITE", "OPTION", "ORANGE", "ORDINARY", "ORGANIZE", "ORIGINAL", "OTHER", "OUTCOME",
-    "OUTPUT", "OUTSIDE", "OVERALL", "PACKAGE", "PAINTER", "PAINTING", "PALACE", "PANEL", "PAPER", "PARENT",
-    "PARKING", "PARTNER", "PASSAGE", "PASSION", "PATIENT", "PATTERN", "PAYMENT", "PEOPLE", "PERCENT", "PERFECT",
-    "PERFORM", "PERHAPS", "PERIOD", "PERSON", "PERSONAL", "PHASE", "PHILOSOPHY", "PHONE", "PHOTOGRAPH", "PHYSICAL",
-    "PICTURE", "PIECE", "PLACE", "PLANET", "PLANNING", "PLATFORM", "PLAYER", "PLEASE", "PLEASURE", "PLENTY",
-    "POETRY", "POINT", "POLICY", "POLITICAL", "POLITICS", "POPULAR", "POPULATION", "POSITIVE", "POSSIBLE", "POVERTY",
-    "PRACTICE", "PRECISE", "PREFER", "PREPARE", "PRESENCE", "PRESENT", "PRESIDENT", "PRESSURE", "PREVENT", "PREVIOUS",
-    "PRICE", "PRIMARY", "PRINCE", "PRINCESS", "PRINCIPLE", "PRIORITY", "PRISON", "PRIVATE", "PROBABLY", "PROBLEM",
-    "PROCESS", "PRODUCE", "PRODUCT", "PROFILE", "PROGRAM", "PROJECT", "PROMISE", "PROPER", "PROPERTY", "PROTECT",
-    "PROVIDE", "PUBLIC", "PURPOSE", "QUALITY", "QUARTER", "QUESTION", "QUICKLY", "RABBIT", "RADICAL", "RAILWAY",
-    "RAINBOW", "RANDOM", "RARELY", "RATHER", "READING", "REALITY", "REASON", "RECEIVE", "RECENT", "RECOGNIZE",
-    "RECORD", "RECOVER", "REDUCE", "REFLECT", "REFORM", "REFUSE", "REGION", "REGULAR", "RELATE", "RELATION",
-    "RELATIVE", "RELEASE", "RELIGION", "REMAIN", "REMEMBER", "REMOTE", "REMOVE", "REPEAT", "REPLACE", "REPORT",
-    "REPRESENT", "REQUEST", "REQUIRE", "RESEARCH", "RESERVE", "RESIDENT", "RESOLVE", "RESOURCE", "RESPECT", "RESPOND",
-    "RESPONSE", "RESULT", "RETURN", "REVEAL", "REVENUE", "REVIEW", "REVOLUTION", "REWARD", "RHYTHM", "RIFLE",
-    "RIGHT", "RIVER", "ROCKET", "ROUTINE", "ROYAL", "RUBBER", "RULING", "RUNNING", "SAFETY", "SAMPLE",
-    "SATISFY", "SAVING", "SCALE", "SCANDAL", "SCENE", "SCHEDULE", "SCHEME", "SCHOOL", "SCIENCE", "SCREEN",
-    "SCRIPT", "SEARCH", "SEASON", "SECOND", "SECRET", "SECTION", "SECTOR", "SECURE", "SECURITY", "SELECT",
-    "SENIOR", "SERIOUS", "SERVICE", "SESSION", "SETTLE", "SEVERAL", "SHADOW", "SHAKE", "SHAPE", "SHARE",
-    "SHEET", "SHELTER", "SHIRT", "SHOCK", "SHOE", "SHOOT", "SHOPPING", "SHOULDER", "SHOWER", "SIGNAL",
-    "SILVER", "SIMPLE", "SINGLE", "SISTER", "SITUATION", "SIXTEEN", "SKETCH", "SKILL", "SMILE", "SMOKE",
-    "SMOOTH", "SNAKE", "SOCIAL", "SOCIETY", "SOLDIER", "SOLUTION", "SOMEBODY", "SOMEONE", "SOMETHING", "SOMETIMES",
-    "SOMEWHERE", "SOUND", "SOURCE", "SOUTH", "SPACE", "SPARE", "SPEAK", "SPECIAL", "SPECIES", "SPEECH",
-    "SPEED", "SPEND", "SPIRIT", "SPORT", "SPREAD", "SPRING", "SQUARE", "STABLE", "STAFF", "STAGE",
-    "STANDARD", "STATION", "STATUS", "STICK", "STILL", "STOCK", "STONE", "STORAGE", "STORE", "STORM",
-    "STORY", "STRAIGHT", "STRANGE", "STRATEGY", "STREET", "STRENGTH", "STRESS", "STRIKE", "STRING", "STRONG",
-    "STRUCTURE", "STRUGGLE", "STUDENT", "STUDIO", "STUDY", "STYLE", "SUBJECT", "SUCCESS", "SUDDEN", "SUFFER",
-    "SUGAR", "SUGGEST", "SUMMER", "SUNDAY", "SUPER", "SUPPLY", "SUPPORT", "SURFACE", "SURPRISE", "SURVEY",
-    "SURVIVE", "SWITCH", "SYMBOL", "SYSTEM", "TABLE", "TACKLE", "TALENT", "TARGET", "TEACHER", "TECHNIQUE",
-    "TECHNOLOGY", "TELEPHONE", "TELEVISION", "TEMPERATURE", "TEMPLE", "TENNIS", "TERRIBLE", "TERRITORY", "TERROR", "THANKS",
-    "THEATER", "THEORY", "THERAPY", "THEREFORE", "THINKING", "THIRTEEN", "THIRTY", "THOUGHT", "THOUSAND", "THREAT",
-    "THROUGH", "THUNDER", "TICKET", "TISSUE", "TITLE", "TODAY", "TOGETHER", "TOMORROW", "TONIGHT", "TOTAL",
-    "TOURISM", "TOWARD", "TRACK", "TRADE", "TRADITION", "TRAFFIC", "TRAINING", "TRANSFER", "TRANSPORT", "TRAVEL",
-    "TREAT", "TREATMENT", "TREATY", "TRIPLE", "TROUBLE", "TRUCK", "TRUTH", "TWELVE", "TWENTY", "TYPICAL",
-    "ULTIMATE", "UMBRELLA", "UNABLE", "UNCLE", "UNDER", "UNDERSTAND", "UNIVERSE", "UNIVERSITY", "UNLESS", "UNTIL",
-    "UNUSUAL", "UPDATE", "UPPER", "URBAN", "URGENT", "USAGE", "USEFUL", "USUALLY", "VALUE", "VARIETY",
-    "VARIOUS", "VEHICLE", "VERSION", "VICTIM", "VIDEO", "VILLAGE", "VIOLENCE", "VIRTUAL", "VIRUS", "VISION",
-    "VISUAL", "VOICE", "VOLUME", "WAITING", "WALKING", "WANTED", "WARNING", "WATCH", "WATER", "WEAPON",
-    "WEATHER", "WEBSITE", "WEDDING", "WEEKEND", "WEEKLY", "WEIGHT", "WELCOME", "WESTERN", "WHATEVER", "WHEEL",
-    "WHEREAS", "WHETHER", "WHICH", "WHILE", "WHITE", "WHOLE", "WHOSE", "WIDELY", "WINDOW", "WINNER",
-    "WINTER", "WISDOM", "WITHIN", "WITHOUT", "WOMAN", "WONDER", "WOODEN", "WORKER", "WORKING", "WORLD",
-    "WORRIED", "WORSE", "WORTH", "WRITE", "WRITER", "WRONG", "YELLOW", "YESTERDAY", "YOUNG", "YOURSELF"
-}
-
-# Dictionnaire de tous les dictionnaires disponibles
-DICTIONARIES = {
-    "fr": {"words": words, "name": "Français", "flag": "🇫🇷"},
-    "en": {"words": words_en, "name": "English", "flag": "🇺🇸"}
-}
-
-def choose_random_word(difficulty=0, language="fr"):
-    # Récupérer le dictionnaire selon la langue
-    if language in DICTIONARIES:
-        word_set = DICTIONARIES[language]["words"]
-    else:
-        word_set = words  # Fallback vers français
-
-    word_list = list(word_set)
-
-    if difficulty == 1:
-        # 5 MINIMUM
-        word_list = [word for word in word_set if len(word) > 5]
-    elif difficulty == 2:
-        # 10 MINIMUM
-        word_list = [word for word in word_set if len(word) > 10]
-
-    return random.choice(word_list)
+# Dictionnaires : une source texte par langue (dictionaries/<langue>.txt, un mot par ligne,
+# en-tête "# name:" / "# flag:"), compilée par build_dictionaries.py en dictionaries/<langue>.dict
+DICTIONARY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dictionaries")
+DEFAULT_LANGUAGE = "fr"
+
+def normalize_character(character):
+    return unicodedata.normalize("NFD", character).encode("ascii", "ignore").decode("ascii")
+
+def normalize_word(word):
+    return "".join(normalize_character(c) for c in word)
+
+def letter_bit(letter):
+    """Bit d'une lettre normalisée dans un masque de 26 bits (0 si ce n'est pas a-z)"""
+    if len(letter) == 1 and letter in string.ascii_lowercase:
+        return 1 << (ord(letter) - ord("a"))
+    return 0
+
+def letters_from_mask(mask):
+    return [letter for i, letter in enumerate(string.ascii_lowercase) if mask >> i & 1]
+
+
+class WordRecord:
+    """Mot du dictionnaire avec tout ce qu'une partie doit savoir, calculé une seule fois.
+
+    - `normalized` : forme minuscule sans accents
+    - `positions` : table de 26 masques, positions de chaque lettre (a=0 ... z=25)
+    - `hidden_mask` : positions masquées tant que la lettre n'est pas trouvée
+    - `letters_mask` : masque de 26 bits des lettres distinctes à trouver
+    """
+
+    __slots__ = ("word", "normalized", "positions", "hidden_mask", "letters_mask")
+
+    def __init__(self, word, normalized=None):
+        self.word = word
+        self.normalized = normalized if normalized is not None else normalize_word(word.lower())
+        positions = [0] * 26
+        self.hidden_mask = 0
+        self.letters_mask = 0
+
+        for i, character in enumerate(self.normalized):
+            bit = letter_bit(character)
+            if bit:
+                positions[bit.bit_length() - 1] |= 1 << i
+                self.letters_mask |= bit
+        for i, character in enumerate(word):
+            if character.lower() in string.ascii_lowercase:
+                self.hidden_mask |= 1 << i
+
+        self.positions = tuple(positions)
+
+    def positions_of(self, letters_mask):
+        """Positions occupées par les lettres d'un masque de 26 bits"""
+        mask = 0
+        letters_mask &= self.letters_mask
+        while letters_mask:
+            bit = letters_mask & -letters_mask
+            mask |= self.positions[bit.bit_length() - 1]
+            letters_mask ^= bit
+        return mask
+
+    def __len__(self):
+        return len(self.word)
+
+
+# Fiches des mots déjà tirés ou joués (pas tout le dictionnaire : il reste sur disque)
+_word_records = {}
+
+def get_word_record(word, normalized=None):
+    record = _word_records.get(word)
+    if record is None:
+        record = _word_records[word] = WordRecord(word, normalized)
+    return record
+
+
+# Longueur minimale des mots par difficulté (1 : plus de 5 lettres, 2 : plus de 10 lettres)
+DIFFICULTY_MIN_LENGTHS = {0: 0, 1: 6, 2: 11}
+
+
+# Format compilé (entiers non signés 32 bits little-endian) :
+#   "PENDUDIC", version, taille de l'en-tête, en-tête JSON (langue, nom, drapeau, empreinte
+#   de la source, nombre de mots, longueur max), bourrage jusqu'à un multiple de 4,
+#   offsets[max_length + 2] (indice du premier mot de longueur >= n),
+#   entries[count + 1] (début de chaque entrée dans le bloc de texte),
+#   puis le bloc : "MOT\0forme normalisée" pour chaque mot, triés par (longueur, mot)
+DICTIONARY_MAGIC = b"PENDUDIC"
+DICTIONARY_VERSION = 1
+_PREFIX = struct.Struct("<8sII")
+_UINT = struct.Struct("<I")
+
+
+def read_word_source(path):
+    """(métadonnées de l'en-tête, mots en majuscules sans doublon) d'une source texte"""
+    meta = {}
+    words = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("#"):
+                key, _, value = line[1:].partition(":")
+                if value:
+                    meta[key.strip()] = value.strip()
+            elif line:
+                words.add(line.upper())
+    return meta, words
+
+
+def source_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read().replace(b"\r\n", b"\n")).hexdigest()  # Indépendant des fins de ligne
+
+
+def compile_dictionary(language, meta, words, digest=None):
+    """Contenu du fichier compilé pour une langue (voir le format ci-dessus)"""
+    ordered = sorted(words, key=lambda word: (len(word), word))
+    max_length = len(ordered[-1]) if ordered else 0
+    header = json.dumps({
+        "language": language,
+        "name": meta.get("name", language),
+        "flag": meta.get("flag", ""),
+        "source_sha256": digest,
+        "count": len(ordered),
+        "max_length": max_length
+    }, ensure_ascii=False).encode("utf-8")
+    header += b" " * (-(_PREFIX.size + len(header)) % 4)
+
+    offsets = []
+    index = 0
+    for length in range(max_length + 2):
+        while index < len(ordered) and len(ordered[index]) < length:
+            index += 1
+        offsets.append(index)
+
+    blob = bytearray()
+    entries = []
+    for word in ordered:
+        entries.append(len(blob))
+        blob += word.encode("utf-8") + b"\0" + normalize_word(word.lower()).encode("utf-8")
+    entries.append(len(blob))
+
+    tables = struct.pack(f"<{len(offsets)}I{len(entries)}I", *offsets, *entries)
+    return _PREFIX.pack(DICTIONARY_MAGIC, DICTIONARY_VERSION, len(header)) + header + tables + bytes(blob)
+
+
+def read_dictionary_header(data):
+    """En-tête d'un dictionnaire compilé (octets ou mmap), ou None s'il n'est pas reconnu"""
+    if len(data) < _PREFIX.size:
+        return None
+    magic, version, header_length = _PREFIX.unpack_from(data, 0)
+    if magic != DICTIONARY_MAGIC or version != DICTIONARY_VERSION:
+        return None
+    return json.loads(bytes(data[_PREFIX.size:_PREFIX.size + header_length]))
+
+
+class WordIndex:
+    """Dictionnaire compilé d'une langue, lu directement dans le fichier projeté en mémoire.
+
+    Les mots sont triés par longueur : une plage de longueurs correspond à une tranche
+    contiguë d'entrées, donc un tirage se fait en O(1). Seul le mot tiré est décodé ; les
+    pages du fichier sont partagées entre les workers par le cache du système.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.header = read_dictionary_header(data)
+        if self.header is None:
+            raise ValueError("Dictionnaire compilé invalide")
+        self.size = self.header["count"]
+        self.max_length = self.header["max_length"]
+
+        position = _PREFIX.size + _PREFIX.unpack_from(data, 0)[2]
+        self.offsets = struct.unpack_from(f"<{self.max_length + 2}I", data, position)
+        self.entries_position = position + 4 * (self.max_length + 2)
+        self.blob_position = self.entries_position + 4 * (self.size + 1)
+        self.records = {}  # Indice -> fiche, pour les mots déjà tirés
+
+    def __len__(self):
+        return self.size
+
+    def record(self, index):
+        """Fiche du mot numéro `index` (ordre longueur, puis alphabétique)"""
+        record = self.records.get(index)
+        if record is not None:
+            return record
+        start = _UINT.unpack_from(self.data, self.entries_position + 4 * index)[0]
+        end = _UINT.unpack_from(self.data, self.entries_position + 4 * index + 4)[0]
+        word, normalized = bytes(self.data[self.blob_position + start:self.blob_position + end]).decode("utf-8").split("\0")
+        record = self.records[index] = get_word_record(word, normalized)
+        return record
+
+    def bounds(self, min_length=0, max_length=None):
+        min_length = max(0, min(min_length, self.max_length + 1))
+        if max_length is None or max_length > self.max_length:
+            max_length = self.max_length
+        if max_length < min_length:
+            return 0, 0
+        return self.offsets[min_length], self.offsets[max_length + 1]
+
+    def count(self, min_length=0, max_length=None):
+        start, end = self.bounds(min_length, max_length)
+        return end - start
+
+    def choose(self, min_length=0, max_length=None):
+        start, end = self.bounds(min_length, max_length)
+        if start >= end:
+            raise ValueError(f"Aucun mot entre {min_length} et {max_length} lettres")
+        return self.record(random.randrange(start, end))
+
+
+def dictionary_paths(language):
+    base = os.path.join(DICTIONARY_DIR, language)
+    return base + ".txt", base + ".dict"
+
+
+def load_word_index(language):
+    """Projette le dictionnaire compilé en mémoire, sans relire sa source (la fraîcheur est
+    vérifiée par `build_dictionaries.py --check`). S'il manque ou est illisible, le compile
+    en mémoire (plus lent, à corriger avec build_dictionaries.py)"""
+    source_path, compiled_path = dictionary_paths(language)
+
+    if os.path.exists(compiled_path):
+        with open(compiled_path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if read_dictionary_header(data) is not None:
+            return WordIndex(data)
+        data.close()
+
+    print(f"⚠️ Dictionnaire compilé absent ou illisible pour '{language}', lancez: python build_dictionaries.py")
+    meta, words = read_word_source(source_path)
+    return WordIndex(compile_dictionary(language, meta, words, source_digest(source_path)))
+
+
+def discover_dictionaries():
+    """Langues disponibles (nom et drapeau) lues dans les en-têtes, sans charger les mots"""
+    found = {}
+    for filename in sorted(os.listdir(DICTIONARY_DIR)):
+        language, extension = os.path.splitext(filename)
+        path = os.path.join(DICTIONARY_DIR, filename)
+        if extension == ".dict" and language not in found:
+            with open(path, "rb") as f:
+                prefix = f.read(_PREFIX.size)
+                header_length = _PREFIX.unpack(prefix)[2] if len(prefix) == _PREFIX.size else 0
+                header = read_dictionary_header(prefix + f.read(header_length))
+            if header is not None:
+                found[language] = {"name": header["name"], "flag": header["flag"]}
+        elif extension == ".txt":
+            meta = {}
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.startswith("#"):
+                        break
+                    key, _, value = line[1:].partition(":")
+                    meta[key.strip()] = value.strip()
+            found[language] = {"name": meta.get("name", language), "flag": meta.get("flag", "")}
+
+    # Langue par défaut en premier (ordre de /api/languages)
+    return dict(sorted(found.items(), key=lambda item: item[0] != DEFAULT_LANGUAGE))
+
+
+# Dictionnaire de tous les dictionnaires disponibles (métadonnées seulement)
+DICTIONARIES = discover_dictionaries()
+
+# Index ouverts à la demande, une seule fois par langue
+_word_indexes = {}
+
+def get_word_index(language="fr"):
+    if language not in DICTIONARIES:
+        language = DEFAULT_LANGUAGE  # Fallback vers français
+
+    if language not in _word_indexes:
+        _word_indexes[language] = load_word_index(language)
+    return _word_indexes[language]
+
+def choose_random_word_record(difficulty=0, language="fr", min_length=None, max_length=None):
+    index = get_word_index(language)
+
+    if min_length is None:
+        min_length = DIFFICULTY_MIN_LENGTHS.get(difficulty, 0)
+
+    return index.choose(min_length, max_length)
+
+def choose_random_word(difficulty=0, language="fr", min_length=None, max_length=None):
+    return choose_random_word_record(difficulty, language, min_length, max_length).word
@@ -1,14 +1,12 @@
-import string
-import unicodedata
 import threading
 import time
 import json
 import datetime
 import os
 import sys
-from list import choose_random_word
-from hangman_art import draw_hangman, draw_progress_bar
-import random
+from list import choose_random_word_record, letters_from_mask
+from hangman_art import draw_progress_bar
+from engine import HangmanGame, DIFFICULTY_LEVELS, PLAYING, WON
 
 RED = "\033[31m"
 GREEN = "\033[32m"
@@ -44,8 +42,8 @@ def save_stats(stats):
     except Exception as e:
         print(f"Erreur lors de la sauvegarde des stats: {e}")
 
-def update_player_stats(player_name, won, word_length, wrong_letters_count, game_time, difficulty, hints_used=0, secret_word=""):
-    """Update statistics for a player"""
+def update_player_stats(player_name, won, word_length, wrong_letters_count, game_time, difficulty, hints_used=0, secret_word="", language="fr"):
+    """Update statistics for a player (language is accepted for parity with the API, stats.json is not split by language)"""
     stats = load_stats()
 
     if player_name not in stats:
@@ -396,42 +394,10 @@ def get_input_with_timer(prompt, timeout=10, game_state=None):
         if game_state['wrong_letters'] and game_state['difficulty'] == 0:
             print("Lettres fausses : " + ", ".join(sorted(game_state['wrong_letters'])))
         print(f"Vies restantes : {(RED + '♥ ' + RESET) * game_state['lives']}")
-        print(f"\n⏰  Temps écoulé ! Tu perds une vie.")
+        print("\n⏰  Temps écoulé ! Tu perds une vie.")
 
     return None
 
-def normalize_character(character):
-    return unicodedata.normalize("NFD", character).encode("ascii", "ignore").decode("ascii")
-
-def normalize_word(word):
-    return "".join(normalize_character(c) for c in word)
-
-def display_masked_word(word, found_letters):
-    displayed_word = ""
-    normalized_word = normalize_word(word.lower())
-
-    for i, character in enumerate(word):
-        if character.lower() in string.ascii_lowercase:
-            if normalized_word[i] in found_letters:
-                displayed_word += character
-            else:
-                displayed_word += "_"
-        else:
-            displayed_word += character
-
-    return displayed_word
-
-def is_valid_letter(entry):
-    return len(entry) == 1 and entry.isalpha()
-
-def word_is_complete(word, found_letters):
-    """Check if all letters of the word have been found"""
-    normalized_word = normalize_word(word.lower())
-    for character in normalized_word:
-        if character in string.ascii_lowercase and character not in found_letters:
-            return False
-    return True
-
 def show_loading_animation(message, duration=1):
     """Show a loading animation"""
     chars = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
@@ -440,20 +406,6 @@ def show_loading_animation(message, duration=1):
         time.sleep(0.1)
     print(f"\r{' ' * (len(message) + 10)}\r", end="", flush=True)
 
-def get_hint(secret_word, found_letters):
-    """Get a random unfound letter as hint"""
-    normalized_word = normalize_word(secret_word.lower())
-    unfound_letters = []
-
-    for i, char in enumerate(normalized_word):
-        if char in string.ascii_lowercase and char not in found_letters:
-            unfound_letters.append((char, secret_word[i]))
-
-    if unfound_letters:
-        normalized_hint, original_hint = random.choice(unfound_letters)
-        return normalized_hint, original_hint
-    return None, None
-
 def check_achievements(player_stats, difficulty_names):
     """Check and award new achievements"""
     new_achievements = []
@@ -505,211 +457,133 @@ def display_achievements(achievements):
 
 def play_hangman(player_name):
     """Main function of the game"""
-    start_time = time.time()
-
     clear_screen()
     print(f"Bonjour {player_name} ! 🎮\n")
     difficulty = input("Choisis une difficulté (f-easy/m-middle/d-hard) : ").strip().lower()
     if difficulty == "easy" or difficulty == "f":
-        max_errors = 10
-        difficulty = 0
+        difficulty = "easy"
     elif difficulty == "middle" or difficulty == "m":
-        max_errors = 6
-        difficulty = 1
+        difficulty = "middle"
     elif difficulty == "hard" or difficulty == "d":
-        max_errors = 3
-        difficulty = 2
+        difficulty = "hard"
     else:
         print("Difficulté invalide. Par défaut : middle.")
-        difficulty = 1
-        max_errors = 6
+        difficulty = "middle"
 
-    secret_word = choose_random_word(difficulty)
-    secret_word_normalized = normalize_word(secret_word.lower())
-    found_letters = set()
-    wrong_letters = set()
-    errors = 0
-    hints_used = 0
+    # Mêmes règles que l'API (engine.py) : seule l'interface change
+    game = HangmanGame.new(player_name, difficulty, "fr", choose_random_word_record(DIFFICULTY_LEVELS[difficulty]))
+    state = game.state
+    outcome = None
 
-    print(f"Mot à deviner : {len(secret_word)} lettres")
+    print(f"Mot à deviner : {len(state['secret_word'])} lettres")
     print(f"{CYAN}💡 Tapez 'indice' pour révéler une lettre (coûte 1 vie){RESET}")
 
-    while errors < max_errors:
+    while game.status == PLAYING:
         clear_screen()
         print(" ")
         # Visual progress indicator
-        if errors > 0:
-            print(f"{RED}{draw_progress_bar(errors, max_errors, difficulty)}{RESET}")
+        if state["errors"] > 0:
+            print(f"{RED}{draw_progress_bar(state['errors'], state['max_errors'], state['difficulty'])}{RESET}")
 
-        print(f"Mot : {display_masked_word(secret_word, found_letters)}")
+        print(f"Mot : {game.word_display()}")
 
-        if wrong_letters and difficulty == 0:
+        wrong_letters = letters_from_mask(state["wrong_letters"])
+        if wrong_letters and state["difficulty"] == 0:
             wrong_letters_display = []
-            for letter in sorted(wrong_letters):
+            for letter in wrong_letters:
                 wrong_letters_display.append(f"{BRIGHT_RED}{letter}{RESET}")
             print(f"Lettres fausses : {', '.join(wrong_letters_display)}")
 
-        if hints_used > 0:
-            print(f"{CYAN}💡  Indices utilisés : {hints_used}{RESET}")
-
-        if word_is_complete(secret_word, found_letters):
-            end_time = time.time()
-            game_time = end_time - start_time
-
-            # Victory animation
-            show_loading_animation("Victoire", 1)
-            clear_screen()
-
-            print(f"\n{BRIGHT_GREEN}🎉  BRAVO ! Tu as trouvé le mot : {secret_word}{RESET}")
-            print(f"⏱️  Temps de jeu: {game_time:.1f} secondes")
-            print(f"❌  Lettres fausses: {len(wrong_letters)}")
-
-            if hints_used > 0:
-                print(f"💡  Indices utilisés: {hints_used}")
-
-            # Update stats
-            player_stats = update_player_stats(player_name, True, len(secret_word), len(wrong_letters), game_time, difficulty, hints_used, secret_word)
-
-            # Check for achievements
-            difficulty_names = ["easy", "middle", "hard"]
-            new_achievements = check_achievements(player_stats, difficulty_names)
-            if new_achievements:
-                display_achievements(new_achievements)
-
-            print(f"\n📊  Tes stats: {player_stats['games_won']} victoires sur {player_stats['games_played']} parties")
-            if "current_streak" in player_stats and player_stats['current_streak'] > 1:
-                print(f"🔥  Série actuelle: {player_stats['current_streak']}")
-
-            input("\nAppuie sur Entrée pour continuer...")
-            return True
+        if state["hints_used"] > 0:
+            print(f"{CYAN}💡  Indices utilisés : {state['hints_used']}{RESET}")
 
         # Get input with the timer for hard mode
-        if difficulty == 1 or difficulty == 2:
+        if state["difficulty"] == 1 or state["difficulty"] == 2:
             game_state = {
-                "word_display": display_masked_word(secret_word, found_letters),
+                "word_display": game.word_display(),
                 "wrong_letters": wrong_letters,
-                "difficulty": difficulty,
-                "lives": max_errors - errors
+                "difficulty": state["difficulty"],
+                "lives": state["lives"]
             }
 
-            delay = {1: 10, 2: 5}.get(difficulty, None)
+            delay = {1: 10, 2: 5}.get(state["difficulty"], None)
 
             entry = get_input_with_timer("Entre une lettre ou le mot entier : ", delay, game_state)
 
             if entry is None:  # Timer expired
-                errors += 1
+                outcome, _ = game.play("", timeout=True)
                 input("Appuie sur Entrée pour continuer...")
                 continue
         else:
             entry = input("\nEntre une lettre ou le mot entier : ").strip().lower()
 
-        if not entry:
+        outcome, detail = game.play(entry, hint_requested=entry == "indice")
+
+        if outcome == "empty":
             print("Tu dois taper quelque chose !")
             input("Appuie sur Entrée pour continuer...")
-            continue
-
-        # Handle hint request
-        if entry == "indice":
-            if errors >= max_errors - 1:
-                print(f"{RED}❌ Tu n'as pas assez de vies pour un indice !{RESET}")
-                input("Appuie sur Entrée pour continuer...")
-                continue
-
-            hint_letter, original_letter = get_hint(secret_word, found_letters)
-            if hint_letter:
-                found_letters.add(hint_letter)
-                errors += 1
-                hints_used += 1
-                show_loading_animation("Recherche d'indice", 1)
-                print(f"\n{BRIGHT_YELLOW}💡 INDICE: La lettre '{original_letter}' est dans le mot !{RESET}")
-                input("Appuie sur Entrée pour continuer...")
-                continue
-            else:
-                print(f"{YELLOW}💡 Aucune lettre cachée disponible pour l'indice !{RESET}")
-                input("Appuie sur Entrée pour continuer...")
-                continue
-
-        if len(entry) == 1:
-            if not is_valid_letter(entry):
-                print("Merci d\'entrer une lettre valide !")
-                continue
-
-            normalized_letter = normalize_character(entry)
-
-            if normalized_letter in found_letters or normalized_letter in wrong_letters:
-                print("Tu as déjà essayé cette lettre !")
-                continue
-
-            if normalized_letter in secret_word_normalized:
-                found_letters.add(normalized_letter)
-                print(f"{BRIGHT_GREEN}✓ Bonne lettre : {entry}{RESET}")
-            else:
-                wrong_letters.add(normalized_letter)
-                errors += 1
-                show_loading_animation("Ajout d'une partie du pendu", 0.5)
-                print(f"{BRIGHT_RED}✗ Mauvaise lettre : {entry}{RESET}")
-
-        else:
-            # Tentative de mot entier
-            guess_normalized = normalize_word(entry)
-            if guess_normalized == secret_word_normalized:
-                # Victoire immédiate
-                end_time = time.time()
-                game_time = end_time - start_time
-
-                show_loading_animation("Victoire parfaite", 1)
-                clear_screen()
-
-                print(f"\n{BRIGHT_GREEN}🎉  BRAVO ! Tu as trouvé le mot entier : {secret_word}{RESET}")
-                print(f"⏱️  Temps de jeu: {game_time:.1f} secondes")
-                print(f"❌  Lettres fausses: {len(wrong_letters)}")
-
-                if hints_used > 0:
-                    print(f"💡  Indices utilisés: {hints_used}")
-
-                # Update stats
-                player_stats = update_player_stats(player_name, True, len(secret_word), len(wrong_letters), game_time, difficulty, hints_used, secret_word)
-
-                # Check for achievements
-                difficulty_names = ["easy", "middle", "hard"]
-                new_achievements = check_achievements(player_stats, difficulty_names)
-                if new_achievements:
-                    display_achievements(new_achievements)
-
-                print(f"\n📊  Tes stats: {player_stats['games_won']} victoires sur {player_stats['games_played']} parties")
-                if "current_streak" in player_stats and player_stats['current_streak'] > 1:
-                    print(f"🔥  Série actuelle: {player_stats['current_streak']}")
-
-                input("\nAppuie sur Entrée pour continuer...")
-                return True
-            else:
-                show_loading_animation("Vérification du mot", 0.5)
-                print(f"{BRIGHT_RED}✗ Mauvaise proposition de mot : \"{entry}\"{RESET}")
-                errors += 1
-
-    # Game over
-    show_loading_animation("Défaite", 1)
-    clear_screen()
+        elif outcome == "no_lives_for_hint":
+            print(f"{RED}❌ Tu n'as pas assez de vies pour un indice !{RESET}")
+            input("Appuie sur Entrée pour continuer...")
+        elif outcome == "hint":
+            show_loading_animation("Recherche d'indice", 1)
+            print(f"\n{BRIGHT_YELLOW}💡 INDICE: La lettre '{detail}' est dans le mot !{RESET}")
+            input("Appuie sur Entrée pour continuer...")
+        elif outcome == "no_hint":
+            print(f"{YELLOW}💡 Aucune lettre cachée disponible pour l'indice !{RESET}")
+            input("Appuie sur Entrée pour continuer...")
+        elif outcome == "invalid":
+            print("Merci d\'entrer une lettre valide !")
+        elif outcome == "repeated":
+            print("Tu as déjà essayé cette lettre !")
+        elif outcome == "good_letter":
+            print(f"{BRIGHT_GREEN}✓ Bonne lettre : {entry}{RESET}")
+        elif outcome == "wrong_letter":
+            show_loading_animation("Ajout d'une partie du pendu", 0.5)
+            print(f"{BRIGHT_RED}✗ Mauvaise lettre : {entry}{RESET}")
+        elif outcome == "wrong_word":
+            show_loading_animation("Vérification du mot", 0.5)
+            print(f"{BRIGHT_RED}✗ Mauvaise proposition de mot : \"{entry}\"{RESET}")
+
+    # Fin de partie : un seul enregistrement des stats, à partir de l'événement du moteur
+    game_time = state["game_time"]
+    won = game.status == WON
 
-    print(f"{RED}{draw_progress_bar(errors, max_errors, difficulty)}{RESET}")
-    end_time = time.time()
-    game_time = end_time - start_time
+    if won:
+        show_loading_animation("Victoire parfaite" if outcome == "word_found" else "Victoire", 1)
+        clear_screen()
+        whole = " entier" if outcome == "word_found" else ""
+        print(f"\n{BRIGHT_GREEN}🎉  BRAVO ! Tu as trouvé le mot{whole} : {state['secret_word']}{RESET}")
+    else:
+        show_loading_animation("Défaite", 1)
+        clear_screen()
+        print(f"{RED}{draw_progress_bar(state['errors'], state['max_errors'], state['difficulty'])}{RESET}")
+        print(f"\n{BRIGHT_RED}💀  PERDU ! Le mot était : {state['secret_word']}{RESET}")
 
-    print(f"\n{BRIGHT_RED}💀  PERDU ! Le mot était : {secret_word}{RESET}")
     print(f"⏱️  Temps de jeu: {game_time:.1f} secondes")
-    print(f"❌  Lettres fausses: {len(wrong_letters)}")
+    print(f"❌  Lettres fausses: {state['wrong_letters'].bit_count()}")
 
-    if hints_used > 0:
-        print(f"💡  Indices utilisés: {hints_used}")
+    if state["hints_used"] > 0:
+        print(f"💡  Indices utilisés: {state['hints_used']}")
 
     # Update stats
-    player_stats = update_player_stats(player_name, False, len(secret_word), len(wrong_letters), game_time, difficulty, hints_used, secret_word)
+    player_stats = update_player_stats(**game.finished)
+
+    if won:
+        # Check for achievements
+        difficulty_names = ["easy", "middle", "hard"]
+        new_achievements = check_achievements(player_stats, difficulty_names)
+        if new_achievements:
+            display_achievements(new_achievements)
 
     print(f"\n📊  Tes stats: {player_stats['games_won']} victoires sur {player_stats['games_played']} parties")
-    print(f"{RED}💔  Série interrompue{RESET}")
+    if won and "current_streak" in player_stats and player_stats['current_streak'] > 1:
+        print(f"🔥  Série actuelle: {player_stats['current_streak']}")
+    elif not won:
+        print(f"{RED}💔  Série interrompue{RESET}")
 
     input("\nAppuie sur Entrée pour continuer...")
-    return False
+    return won
 
 
 def main():
@@ -0,0 +1,47 @@
+"""Migration des anciennes données vers Redis (stats.json, players.json, blobs `pendu:stats` et `pendu:players`).
+
+Usage :
+    python migrate.py
+    python migrate.py --stats-file sauvegarde/stats.json --players-file sauvegarde/players.json
+
+À lancer une fois au déploiement ; les workers peuvent alors démarrer avec
+MIGRATE_ON_STARTUP=0. Le même verrou Redis que la migration au démarrage évite
+que les deux tournent en même temps.
+"""
+import argparse
+import os
+import sys
+
+import redis
+from dotenv import load_dotenv
+
+from storage import MIGRATION_LOCK_KEY, migrate_json_to_redis
+
+if __name__ == "__main__":
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--redis-url", default=os.getenv("REDIS_URL", "redis://localhost:6379"))
+    parser.add_argument("--stats-file", default="stats.json")
+    parser.add_argument("--players-file", default="players.json")
+    parser.add_argument("--lock-ttl", type=int, default=int(os.getenv("MIGRATION_LOCK_TTL", "300")))
+    args = parser.parse_args()
+
+    try:
+        client = redis.from_url(args.redis_url, decode_responses=True)
+        client.ping()
+        print("✅ Connexion Redis établie")
+    except Exception as e:
+        print(f"❌ Erreur de connexion Redis: {e}")
+        sys.exit(1)
+
+    lock_id = f"migrate.py:{os.getpid()}"
+    if not client.set(MIGRATION_LOCK_KEY, lock_id, nx=True, ex=args.lock_ttl):
+        print("⚠️ Une migration est déjà en cours (verrou Redis présent)")
+        sys.exit(1)
+
+    try:
+        migrate_json_to_redis(client, args.stats_file, args.players_file)
+    finally:
+        if client.get(MIGRATION_LOCK_KEY) == lock_id:
+            client.delete(MIGRATION_LOCK_KEY)
+        client.close()
@@ -0,0 +1,148 @@
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+
+class SamplingProfiler:
+    """Profileur par échantillonnage du thread de la boucle asyncio, activé à la demande.
+
+    Pendant une fenêtre (`start(duration, fraction, interval)`), une fraction des requêtes
+    HTTP est suivie ; un thread relève toutes les `interval` secondes la pile du thread de
+    la boucle tant qu'au moins une requête suivie est en cours. Les piles sont agrégées au
+    format « folded » (une pile `a;b;c <échantillons>` par ligne), lisible par flamegraph.pl
+    ou speedscope. La racine de chaque pile est la route de la requête suivie ; le temps
+    passé à attendre Redis apparaît sous la boucle asyncio (select).
+
+    Désactivé, le middleware ne coûte qu'un test d'attribut par requête. Chaque worker
+    uvicorn a son propre profileur.
+    """
+
+    def __init__(self):
+        self.active = False
+        self.fraction = 1.0
+        self.interval = 0.005
+        self.deadline = 0.0
+        self.in_flight = {}  # id(scope) -> scope des requêtes suivies
+        self.stacks = Counter()  # pile "a;b;c" -> échantillons
+        self.lock = threading.Lock()  # Piles écrites par le thread d'échantillonnage, lues par la boucle
+        self.samples = 0
+        self.profiled_requests = 0
+        self.started_at = None
+        self.loop_thread_id = None
+        self.thread = None
+        self.stopping = threading.Event()
+        self.switch_interval = sys.getswitchinterval()
+
+    def start(self, duration=30.0, fraction=1.0, interval=0.005):
+        """Démarre une fenêtre de profilage (remet les résultats à zéro)"""
+        self.stop()
+        self.fraction = fraction
+        self.interval = interval
+        self.deadline = time.monotonic() + duration
+        self.stacks = Counter()
+        self.samples = 0
+        self.profiled_requests = 0
+        self.started_at = time.time()
+        self.loop_thread_id = threading.get_ident()  # Appelé depuis la boucle asyncio
+        # Le thread d'échantillonnage n'obtient le GIL qu'au prochain changement de thread :
+        # sans réduire l'intervalle, les relevés tomberaient surtout pendant select()
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self.switch_interval, interval / 10))
+        self.active = True
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self.sample_loop, name="pendu-profiler", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.active = False
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.in_flight.clear()
+
+    def sample_loop(self):
+        while time.monotonic() < self.deadline and not self.stopping.wait(self.interval):
+            if self.in_flight:
+                self.sample()
+        self.active = False
+        sys.setswitchinterval(self.switch_interval)
+
+    def sample(self):
+        frame = sys._current_frames().get(self.loop_thread_id)
+        if frame is None:
+            return
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            if code.co_name == "_run_once":  # Inutile de remonter au-delà d'un tour de boucle asyncio
+                break
+            frame = frame.f_back
+        names.append(self.root_label())
+        with self.lock:
+            self.stacks[";".join(reversed(names))] += 1
+            self.samples += 1
+
+    def root_label(self):
+        scopes = list(self.in_flight.values())
+        if len(scopes) != 1:
+            return f"{len(scopes)} requêtes"
+        route = scopes[0].get("route")
+        return f"{scopes[0]['method']} {route.path if route is not None else scopes[0]['path']}"
+
+    def folded(self):
+        """Piles agrégées au format folded, les plus fréquentes d'abord"""
+        with self.lock:
+            stacks = self.stacks.most_common()
+        return "".join(f"{stack} {count}\n" for stack, count in stacks)
+
+    def top_functions(self, limit=20):
+        """Fonctions les plus souvent en haut de pile (temps propre)"""
+        own = Counter()
+        with self.lock:
+            stacks = list(self.stacks.items())
+        for stack, count in stacks:
+            own[stack.rsplit(";", 1)[-1]] += count
+        return [
+            {"function": function, "samples": count, "percent": round(100 * count / self.samples, 1)}
+            for function, count in own.most_common(limit)
+        ]
+
+    def stats(self):
+        return {
+            "active": self.active,
+            "fraction": self.fraction,
+            "interval_ms": self.interval * 1000,
+            "remaining_s": round(max(0.0, self.deadline - time.monotonic()), 1) if self.active else 0.0,
+            "started_at": self.started_at,
+            "profiled_requests": self.profiled_requests,
+            "samples": self.samples,
+            "top_functions": self.top_functions()
+        }
+
+
+class ProfilerMiddleware:
+    """Middleware ASGI : marque les requêtes HTTP suivies pendant une fenêtre de profilage"""
+
+    def __init__(self, app, profiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        profiler = self.profiler
+        if (not profiler.active or scope["type"] != "http" or scope["path"].startswith("/api/admin/")
+                or random.random() >= profiler.fraction):
+            await self.app(scope, receive, send)
+            return
+
+        key = id(scope)
+        profiler.in_flight[key] = scope
+        profiler.profiled_requests += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.in_flight.pop(key, None)
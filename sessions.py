@@ -0,0 +1,188 @@
+import json
+import time
+from collections import OrderedDict
+
+# Correspondance champ de partie -> clé courte utilisée dans Redis
+COMPACT_FIELDS = {
+    "player_name": "p",
+    "secret_word": "w",
+    "found_letters": "f",
+    "wrong_letters": "x",
+    "difficulty": "d",
+    "difficulty_name": "dn",
+    "language": "l",
+    "max_errors": "m",
+    "lives": "v",
+    "errors": "e",
+    "hints_used": "h",
+    "start_time": "t",
+    "status": "s",
+    "game_time": "gt",
+    # Session du mode infini (mots enchaînés dans la même partie)
+    "infinite": "i",
+    "words_found": "wf",
+    "max_lives_reached": "ml",
+    "session_start": "ss",
+    # Numéro de version, incrémenté à chaque sauvegarde (écritures concurrentes)
+    "version": "n"
+}
+EXPANDED_FIELDS = {short: field for field, short in COMPACT_FIELDS.items()}
+
+
+def encode_game(game):
+    """Encode une partie en JSON compact (clés courtes, lettres en masques de 26 bits)"""
+    compact = {COMPACT_FIELDS.get(field, field): value for field, value in game.items()}
+    return json.dumps(compact, ensure_ascii=False, separators=(",", ":"))
+
+
+def decode_game(data):
+    """Reconstruit une partie à partir de son encodage compact"""
+    return {EXPANDED_FIELDS.get(short, short): value for short, value in json.loads(data).items()}
+
+
+def game_ttl(game, ttl, finished_ttl):
+    """Durée de vie d'une partie : courte une fois terminée, sinon délai d'inactivité"""
+    return ttl if game.get("status") == "playing" else finished_ttl
+
+
+class InMemoryGameStore:
+    """Parties en mémoire du processus (un seul worker uvicorn).
+
+    Les parties inactives depuis `ttl` secondes (ou terminées depuis `finished_ttl`)
+    expirent, et au-delà de `max_games` les moins récemment utilisées sont évincées.
+    """
+
+    def __init__(self, ttl=3600, finished_ttl=300, max_games=10000):
+        self.games = OrderedDict()  # game_id -> (partie, expiration), ordre LRU
+        self.ttl = ttl
+        self.finished_ttl = finished_ttl
+        self.max_games = max_games
+        self.expired_count = 0
+        self.evicted_count = 0
+
+    async def get(self, game_id):
+        entry = self.games.get(game_id)
+        if entry is None:
+            return None
+
+        game, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self.games[game_id]
+            self.expired_count += 1
+            return None
+
+        self.games.move_to_end(game_id)
+        return game
+
+    async def save(self, game_id, game):
+        """Toujours accepté : les requêtes d'un même processus modifient la partie sans céder la main"""
+        expires_at = time.monotonic() + game_ttl(game, self.ttl, self.finished_ttl)
+        self.games[game_id] = (game, expires_at)
+        self.games.move_to_end(game_id)
+
+        while len(self.games) > self.max_games:
+            self.games.popitem(last=False)
+            self.evicted_count += 1
+        return True
+
+    async def delete(self, game_id):
+        self.games.pop(game_id, None)
+
+    async def sweep(self):
+        """Supprime les parties expirées, retourne le nombre de parties supprimées"""
+        now = time.monotonic()
+        expired = [game_id for game_id, (_, expires_at) in self.games.items() if expires_at <= now]
+        for game_id in expired:
+            del self.games[game_id]
+        self.expired_count += len(expired)
+        return len(expired)
+
+    def stats(self):
+        return {
+            "backend": "memory",
+            "games": len(self.games),
+            "max_games": self.max_games,
+            "expired": self.expired_count,
+            "evicted": self.evicted_count
+        }
+
+
+# Écriture conditionnelle : la version enregistrée doit être celle lue par la requête (0 = partie
+# nouvelle), sinon une autre requête a sauvegardé la partie entre-temps et l'écriture est refusée
+SAVE_IF_VERSION_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+local version = 0
+if current then
+    version = cjson.decode(current).n or 0
+end
+if version ~= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+
+class RedisGameStore:
+    """Parties partagées entre workers, une clé Redis par partie.
+
+    Chaque sauvegarde incrémente la version de la partie ; `save` retourne False si la
+    partie a été sauvegardée par une autre requête depuis sa lecture (rien n'est écrit).
+    """
+
+    def __init__(self, client, prefix="pendu:game:", ttl=3600, finished_ttl=300):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        self.finished_ttl = finished_ttl
+        self.conflict_count = 0
+
+    @property
+    def client(self):
+        return self._client
+
+    @client.setter
+    def client(self, client):
+        self._client = client
+        self.save_if_version = client.register_script(SAVE_IF_VERSION_SCRIPT) if client is not None else None
+
+    def key(self, game_id):
+        return f"{self.prefix}{game_id}"
+
+    async def get(self, game_id):
+        data = await self.client.get(self.key(game_id))
+        if data is None:
+            return None
+        return decode_game(data)
+
+    async def save(self, game_id, game):
+        version = game.get("version", 0)
+        game["version"] = version + 1
+        saved = await self.save_if_version(
+            keys=[self.key(game_id)],
+            args=[version, encode_game(game), game_ttl(game, self.ttl, self.finished_ttl)]
+        )
+        if not saved:
+            game["version"] = version
+            self.conflict_count += 1
+        return bool(saved)
+
+    async def delete(self, game_id):
+        await self.client.delete(self.key(game_id))
+
+    async def sweep(self):
+        # Redis gère l'expiration lui-même (EX sur chaque clé)
+        return 0
+
+    def stats(self):
+        return {"backend": "redis", "ttl": self.ttl, "finished_ttl": self.finished_ttl,
+                "conflicts": self.conflict_count}
+
+
+def create_game_store(backend, client=None, ttl=3600, finished_ttl=300, max_games=10000):
+    """Instancie le stockage des parties selon GAME_STORE ("memory" ou "redis")"""
+    if backend == "memory":
+        return InMemoryGameStore(ttl=ttl, finished_ttl=finished_ttl, max_games=max_games)
+    if backend == "redis":
+        return RedisGameStore(client, ttl=ttl, finished_ttl=finished_ttl)
+    raise ValueError(f"Stockage de parties inconnu: {backend}")
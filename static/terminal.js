@@ -4,13 +4,11 @@ class TerminalPendu {
         this.input = document.getElementById('terminal-input');
         this.currentGame = null;
         this.playerName = null;
-        this.playerPassword = null;
+        this.sessionToken = null;
         this.currentLanguage = "fr";  // Langue par défaut
         this.availableLanguages = [];  // Liste des langues disponibles
         this.isAuthenticated = false;
         this.gameStartTime = null;
-        this.sessionStartTime = null; // Pour le mode infini
-        this.maxLivesReached = 0; // Pour tracker le max de vies atteint
         this.timer = null;
         this.timeRemaining = 0;
         this.gameState = 'login'; // 'login', 'menu', 'playing', 'waiting_input'
@@ -335,7 +333,7 @@ class TerminalPendu {
 
             const result = await response.json();
             this.playerName = playerName;
-            this.playerPassword = password;
+            this.sessionToken = result.token;
             this.isAuthenticated = true;
 
             this.clearTerminal();
@@ -364,7 +362,8 @@ class TerminalPendu {
     logout() {
         this.cleanupMenuNavigation();
         this.playerName = null;
-        this.playerPassword = null;
+        this.closeGameSocket();
+        this.sessionToken = null;
         this.isAuthenticated = false;
         this.currentGame = null;
         this.clearTerminal();
@@ -453,9 +452,10 @@ class TerminalPendu {
                 },
                 body: JSON.stringify({
                     player_name: this.playerName,
-                    password: this.playerPassword,
+                    token: this.sessionToken,
                     difficulty: ['easy', 'middle', 'hard'][difficultyLevel],
-                    language: this.currentLanguage
+                    language: this.currentLanguage,
+                    infinite: infiniteMode
                 })
             });
 
@@ -471,6 +471,7 @@ class TerminalPendu {
 
             const gameData = await response.json();
             this.currentGame = gameData;
+            this.openGameSocket(gameData);
             this.currentGame.max_errors = maxErrors;
             this.currentGame.difficulty_level = difficultyLevel;
             this.currentGame.timer_delay = timerDelay;
@@ -483,12 +484,6 @@ class TerminalPendu {
             this.currentGame.wrong_letters = [];
             this.gameStartTime = Date.now();
 
-            // Initialiser le temps de session pour le mode infini
-            if (infiniteMode) {
-                this.sessionStartTime = Date.now();
-                this.maxLivesReached = this.currentGame.lives;
-            }
-
             this.printOutput(`Mot à deviner : ${gameData.word_display.replace(/_/g, '').length} lettres`);
             if (timerDelay) {
                 this.printOutput('<span class="cyan">💡 Attention : Timer activé !</span>');
@@ -521,16 +516,20 @@ class TerminalPendu {
                 input = await this.waitForInputWithTimer('Entre une lettre ou le mot entier : ', this.currentGame.timer_delay);
 
                 if (input === null) {
-                    // Timer expiré
-                    this.currentGame.lives--;  // Décrémenter les vies directement
-                    this.currentGame.errors++;  // Maintenir errors pour la cohérence
+                    // Timer expiré : le serveur retire la vie
+                    try {
+                        const result = await this.sendGuess('', false, true);
+                        this.updateGameState(result);
+                    } catch (error) {
+                        this.printOutput(`<span class="error">Erreur: ${error.message}</span>`);
+                    }
                     this.clearTerminal();
                     this.displayGameState();
                     this.printOutput('\n⏰  Temps écoulé ! Tu perds une vie.');
                     await this.waitForInput('Appuie sur Entrée pour continuer...');
 
                     // Vérifier la défaite avec les vies
-                    if (this.currentGame.lives <= 0) {
+                    if (this.currentGame.status === 'lost') {
                         await this.endGame(false);
                         return;
                     }
@@ -632,17 +631,7 @@ class TerminalPendu {
             }
 
             try {
-                const response = await fetch('/api/game/guess', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        game_id: this.currentGame.game_id,
-                        guess: entry,
-                        hint_requested: true
-                    })
-                });
-
-                const result = await response.json();
+                const result = await this.sendGuess(entry, true);
                 this.updateGameState(result);
 
                 this.printOutput(`\n<span class="bright-yellow">${result.message}</span>`);
@@ -656,17 +645,7 @@ class TerminalPendu {
 
         // Traiter la tentative normale
         try {
-            const response = await fetch('/api/game/guess', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({
-                    game_id: this.currentGame.game_id,
-                    guess: entry,
-                    hint_requested: false
-                })
-            });
-
-            const result = await response.json();
+            const result = await this.sendGuess(entry, false);
             this.updateGameState(result);
 
             // Afficher le résultat
@@ -698,29 +677,115 @@ class TerminalPendu {
         }
     }
 
+    openGameSocket(gameData) {
+        // Un WebSocket par partie : les propositions y passent sous forme de deltas
+        this.closeGameSocket();
+        this.currentGame.server_lives = gameData.lives;
+        if (!('WebSocket' in window) || !this.sessionToken) return;
+
+        const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+        const channel = {
+            socket: new WebSocket(`${protocol}//${window.location.host}/ws/game`),
+            ready: false,
+            pending: []
+        };
+
+        channel.socket.onopen = () => {
+            channel.socket.send(JSON.stringify({ type: 'auth', token: this.sessionToken }));
+            channel.socket.send(JSON.stringify({ type: 'join', game_id: gameData.game_id }));
+        };
+        channel.socket.onmessage = (event) => {
+            const message = JSON.parse(event.data);
+            if (!channel.ready) {
+                // Réponses à auth/join : le canal est prêt une fois la partie rejointe
+                if (message.type === 'state') channel.ready = true;
+                else if (message.type === 'error') channel.socket.close();
+                return;
+            }
+            const request = channel.pending.shift();
+            if (request) request.resolve(message);
+        };
+        channel.socket.onclose = () => {
+            channel.ready = false;
+            channel.pending.splice(0).forEach(request => request.reject(new Error('Connexion perdue')));
+        };
+
+        this.gameSocket = channel;
+    }
+
+    closeGameSocket() {
+        if (this.gameSocket) {
+            this.gameSocket.socket.close();
+            this.gameSocket = null;
+        }
+    }
+
+    async sendGuess(guess, hintRequested, timeout = false) {
+        const channel = this.gameSocket;
+        if (channel && channel.ready && channel.socket.readyState === WebSocket.OPEN) {
+            const message = await new Promise((resolve, reject) => {
+                channel.pending.push({ resolve, reject });
+                channel.socket.send(JSON.stringify({ type: 'guess', guess: guess, hint: hintRequested, timeout: timeout }));
+            });
+            if (message.type === 'error') throw new Error(message.detail);
+            return this.resultFromDelta(message);
+        }
+
+        // Repli HTTP si le WebSocket n'est pas disponible (réponse compacte également)
+        const response = await fetch('/api/game/guess', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                game_id: this.currentGame.game_id,
+                token: this.sessionToken,
+                guess: guess,
+                hint_requested: hintRequested,
+                timeout: timeout,
+                compact: true
+            })
+        });
+        if (!response.ok) {
+            throw new Error((await response.json()).detail);
+        }
+        return this.resultFromDelta(await response.json());
+    }
+
+    resultFromDelta(delta) {
+        // Reconstruit une réponse complète à partir du delta et de l'état courant
+        const display = this.currentGame.word_display.split('');
+        for (const [position, character] of Object.entries(delta.reveal || {})) {
+            display[position] = character;
+        }
+        this.currentGame.server_lives += delta.lives || 0;
+
+        return {
+            game_id: delta.game_id,
+            status: delta.status,
+            message: delta.message,
+            word_display: delta.status === 'won' ? delta.secret_word : display.join(''),
+            wrong_letters: delta.wrong ? [...this.currentGame.wrong_letters, delta.wrong] : this.currentGame.wrong_letters,
+            lives: this.currentGame.server_lives,
+            hints_used: delta.hints_used ?? this.currentGame.hints_used,
+            secret_word: delta.secret_word,
+            game_time: delta.game_time,
+            progress_art: delta.progress_art,
+            words_found: delta.words_found,
+            next_word_display: delta.next_word_display
+        };
+    }
+
     updateGameState(result) {
         this.currentGame.word_display = result.word_display;
         this.currentGame.wrong_letters = result.wrong_letters || [];
 
-        // En mode infini, conserver les vies accumulées (ne pas écraser par la réponse serveur)
-        if (!this.currentGame.infinite_mode) {
-            // Mode normal : utiliser directement les vies du serveur
-            this.currentGame.lives = result.lives;
-            this.currentGame.errors = this.currentGame.max_errors - result.lives;
-        } else {
-            // Mode infini : ajuster les vies selon la différence serveur/client
-            const serverLives = result.lives;
-            const expectedClientLives = this.currentGame.max_errors - (this.currentGame.max_errors - serverLives);
-
-            // Si le serveur indique moins de vies, le joueur en a perdu
-            if (serverLives < expectedClientLives) {
-                const livesLost = expectedClientLives - serverLives;
-                this.currentGame.lives -= livesLost;
-            }
-
-            // Synchroniser les erreurs
-            this.currentGame.errors = this.currentGame.max_errors - serverLives;
+        // Le serveur fait foi, y compris pour les vies reportées du mode infini
+        this.currentGame.lives = result.lives;
+        this.currentGame.errors = Math.max(0, this.currentGame.max_errors - result.lives);
+        if (result.words_found !== undefined && result.words_found !== null) {
+            this.currentGame.words_found = result.words_found;
+            this.currentGame.total_lives_gained = result.words_found;
         }
+        this.currentGame.next_word_display = result.next_word_display || null;
 
         this.currentGame.status = result.status;
         this.currentGame.hints_used = result.hints_used || 0;
@@ -738,15 +803,8 @@ class TerminalPendu {
             this.clearTerminal();
             this.printOutput(`\n<span class="bright-green">🎉  BRAVO ! Tu as trouvé le mot : ${secretWord}</span>`);
 
-            // Mode infini : gagner +1 vie
+            // Mode infini : +1 vie, déjà comptée par le serveur
             if (this.currentGame.infinite_mode) {
-                this.currentGame.lives++;
-                this.currentGame.words_found++;
-                this.currentGame.total_lives_gained++;
-
-                // Mettre à jour le max de vies atteint
-                this.maxLivesReached = Math.max(this.maxLivesReached, this.currentGame.lives);
-
                 const hearts = '<span class="error">♥ </span>'.repeat(this.currentGame.lives);
                 this.printOutput(`<span class="success">🔄 MODE INFINI : +1 vie ! (Vies restantes : ${hearts})</span>`);
                 this.printOutput(`<span class="info">📊 Mots trouvés : ${this.currentGame.words_found} | Vies gagnées : ${this.currentGame.total_lives_gained}</span>`);
@@ -761,9 +819,6 @@ class TerminalPendu {
                 this.printOutput(`<span class="info">📊 Performance finale :</span>`);
                 this.printOutput(`<span class="info">   • Mots trouvés : ${this.currentGame.words_found}</span>`);
                 this.printOutput(`<span class="info">   • Vies gagnées : ${this.currentGame.total_lives_gained}</span>`);
-
-                // Enregistrer les statistiques du mode infini
-                await this.saveInfiniteStats();
             }
         }
 
@@ -855,9 +910,10 @@ class TerminalPendu {
                 },
                 body: JSON.stringify({
                     player_name: this.playerName,
-                    password: this.playerPassword,
+                    token: this.sessionToken,
                     difficulty: ['easy', 'middle', 'hard'][savedDifficultyLevel],
-                    language: this.currentLanguage
+                    language: this.currentLanguage,
+                    infinite: savedInfiniteMode
                 })
             });
 
@@ -867,6 +923,7 @@ class TerminalPendu {
 
             const gameData = await response.json();
             this.currentGame = gameData;
+            this.openGameSocket(gameData);
 
             // Restaurer les paramètres
             this.currentGame.max_errors = savedMaxErrors;
@@ -882,8 +939,6 @@ class TerminalPendu {
                 this.currentGame.infinite_mode = true;
                 this.currentGame.words_found = 0;
                 this.currentGame.total_lives_gained = 0;
-                this.sessionStartTime = Date.now();
-                this.maxLivesReached = this.currentGame.lives;
             }
 
             this.gameStartTime = Date.now();
@@ -918,46 +973,18 @@ class TerminalPendu {
 
     async startNewWordInfinite() {
         try {
-            // Conserver les paramètres actuels (APRÈS avoir gagné +1 vie)
-            const savedLives = this.currentGame.lives; // Les vies incluent déjà le +1 de la victoire
-            const savedWordsFound = this.currentGame.words_found;
-            const savedTotalLivesGained = this.currentGame.total_lives_gained;
-            const savedMaxErrors = this.currentGame.max_errors;
-            const savedDifficultyLevel = this.currentGame.difficulty_level;
-            const savedTimerDelay = this.currentGame.timer_delay;
-
-            // Demander un nouveau mot
-            const response = await fetch('/api/game/start', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({
-                    player_name: this.playerName,
-                    password: this.playerPassword,
-                    difficulty: ['easy', 'middle', 'hard'][savedDifficultyLevel],
-                    language: this.currentLanguage
-                })
-            });
-
-            if (!response.ok) {
-                throw new Error('Erreur lors de la création du nouveau mot');
+            // Le serveur a déjà enchaîné le mot suivant dans la même partie
+            if (!this.currentGame.next_word_display) {
+                throw new Error('Mot suivant indisponible');
             }
 
-            const gameData = await response.json();
-            this.currentGame = gameData;
-
-            // Restaurer les paramètres sauvés (en conservant les vies correctes)
-            this.currentGame.lives = savedLives; // Garde les vies actuelles (avec le +1)
-            this.currentGame.words_found = savedWordsFound;
-            this.currentGame.total_lives_gained = savedTotalLivesGained;
-            this.currentGame.max_errors = savedMaxErrors;
-            this.currentGame.difficulty_level = savedDifficultyLevel;
-            this.currentGame.timer_delay = savedTimerDelay;
+            this.currentGame.word_display = this.currentGame.next_word_display;
+            this.currentGame.next_word_display = null;
+            this.currentGame.secret_word = null;
+            this.currentGame.status = 'playing';
             this.currentGame.errors = 0;
             this.currentGame.hints_used = 0;
             this.currentGame.found_letters = [];
-            this.currentGame.infinite_mode = true;
             this.currentGame.wrong_letters = [];
 
             // Redémarrer le chrono pour ce nouveau mot
@@ -968,7 +995,7 @@ class TerminalPendu {
             const hearts = '<span class="error">♥ </span>'.repeat(this.currentGame.lives);
             this.printOutput(`<span class="info">📊 Mots trouvés : ${this.currentGame.words_found} | Vies restantes : ${hearts}</span>\n`);
 
-            this.printOutput(`Mot à deviner : ${gameData.word_display.replace(/_/g, '').length} lettres`);
+            this.printOutput(`Mot à deviner : ${this.currentGame.word_display.length} lettres`);
 
             if (this.currentGame.timer_delay) {
                 this.printOutput('<span class="cyan">💡 Attention : Timer activé !</span>');
@@ -1327,35 +1354,6 @@ class TerminalPendu {
 
         this.showMenu();
     }
-
-    async saveInfiniteStats() {
-        if (!this.currentGame.infinite_mode || !this.sessionStartTime) return;
-
-        try {
-            const sessionTime = (Date.now() - this.sessionStartTime) / 1000;
-
-            const response = await fetch('/api/infinite/stats', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({
-                    player_name: this.playerName,
-                    password: this.playerPassword,
-                    words_found: this.currentGame.words_found || 0,
-                    lives_gained: this.currentGame.total_lives_gained || 0,
-                    max_lives: this.maxLivesReached || 0,
-                    session_time: sessionTime
-                })
-            });
-
-            if (!response.ok) {
-                console.warn('Erreur lors de la sauvegarde des stats du mode infini');
-            }
-        } catch (error) {
-            console.warn('Erreur lors de la sauvegarde des stats du mode infini:', error);
-        }
-    }
 }
 
 // Initialize terminal when page loads
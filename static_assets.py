@@ -0,0 +1,141 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+
+try:
+    import brotli  # Dans requirements.txt ; sans le module, les fichiers sont servis en gzip seulement
+except ImportError:
+    brotli = None
+BROTLI_AVAILABLE = brotli is not None
+
+# Les URL avec empreinte ne changent qu'avec le contenu : cache long, sans revalidation
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+MIN_COMPRESS_SIZE = 512
+
+
+class Asset:
+    """Un fichier servi depuis la mémoire, avec ses variantes compressées"""
+
+    def __init__(self, name, body, media_type):
+        self.name = name
+        self.media_type = media_type
+        self.digest = hashlib.sha256(body).hexdigest()[:12]
+        self.variants = {"identity": body}  # encodage -> contenu
+
+        if media_type.startswith(COMPRESSIBLE_TYPES) and len(body) >= MIN_COMPRESS_SIZE:
+            compressed = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(compressed) < len(body):
+                self.variants["gzip"] = compressed
+            if brotli is not None:
+                compressed = brotli.compress(body, quality=11)
+                if len(compressed) < len(body):
+                    self.variants["br"] = compressed
+
+    @property
+    def hashed_name(self):
+        stem, extension = os.path.splitext(self.name)
+        return f"{stem}.{self.digest}{extension}"
+
+    def etag(self, encoding):
+        suffix = "" if encoding == "identity" else f"-{encoding}"
+        return f'"{self.digest}{suffix}"'
+
+    def choose_encoding(self, accept_encoding):
+        """Meilleure variante acceptée par le client (br, puis gzip, sinon identity)"""
+        accepted = set()
+        for part in (accept_encoding or "").lower().split(","):
+            coding, _, params = part.partition(";")
+            try:
+                quality = float(params.strip().removeprefix("q=")) if params.strip() else 1.0
+            except ValueError:
+                quality = 1.0
+            if quality > 0:
+                accepted.add(coding.strip())
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and (encoding in accepted or "*" in accepted):
+                return encoding
+        return "identity"
+
+
+def etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+class StaticAssets:
+    """Fichiers de `static/` lus une seule fois et servis depuis la mémoire.
+
+    Chaque fichier est accessible sous son nom (`terminal.js`, revalidé par ETag) et
+    sous un nom avec empreinte du contenu (`terminal.<sha256>.js`, mis en cache un an).
+    L'index est réécrit pour pointer vers les noms avec empreinte : un déploiement
+    change les URL, les visiteurs réguliers ne retéléchargent que ce qui a changé.
+    """
+
+    def __init__(self, directory="static", url_prefix="/static", index="index.html"):
+        self.directory = directory
+        self.url_prefix = url_prefix
+        self.index_name = index
+        self.assets = {}  # nom servi (simple ou avec empreinte) -> Asset
+        self.index = None
+        self.loaded = False
+
+    def load(self):
+        assets = {}
+        for name in sorted(os.listdir(self.directory)):
+            path = os.path.join(self.directory, name)
+            if name == self.index_name or not os.path.isfile(path):
+                continue
+            with open(path, "rb") as f:
+                body = f.read()
+            media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+            if media_type.startswith("text/") or media_type == "application/javascript":
+                media_type += "; charset=utf-8"
+            asset = Asset(name, body, media_type)
+            assets[name] = asset
+            assets[asset.hashed_name] = asset
+
+        with open(os.path.join(self.directory, self.index_name), "r", encoding="utf-8") as f:
+            html = f.read()
+        # Remplacer /static/terminal.js par /static/terminal.<empreinte>.js
+        pattern = re.compile(re.escape(self.url_prefix) + r"/([\w.-]+)")
+        html = pattern.sub(
+            lambda match: f"{self.url_prefix}/{assets[match.group(1)].hashed_name}"
+            if match.group(1) in assets else match.group(0),
+            html
+        )
+
+        self.index = Asset(self.index_name, html.encode("utf-8"), "text/html; charset=utf-8")
+        self.assets = assets
+        self.loaded = True
+
+    def get(self, name):
+        """(Asset, est une URL avec empreinte) ou (None, False)"""
+        if not self.loaded:
+            self.load()
+        asset = self.assets.get(name)
+        return asset, asset is not None and name != asset.name
+
+    def get_index(self):
+        if not self.loaded:
+            self.load()
+        return self.index
+
+    def stats(self):
+        if not self.loaded:
+            self.load()
+        files = {}
+        for asset in [self.index, *self.assets.values()]:
+            files[asset.name] = {
+                "url": self.url_prefix + "/" + asset.hashed_name if asset is not self.index else "/",
+                "etag": asset.etag("identity"),
+                "sizes": {encoding: len(body) for encoding, body in asset.variants.items()}
+            }
+        return {"brotli": brotli is not None, "files": files}
@@ -0,0 +1,149 @@
+import asyncio
+import time
+from collections import Counter
+
+
+class StatsWriteBehind:
+    """File d'écriture différée des fins de partie.
+
+    Les événements sont mis en file par la requête, puis une tâche de fond les passe
+    à `flush(events)` par lots : dès que `batch_size` événements attendent, sinon
+    toutes les `interval` secondes. Tant que la tâche n'est pas démarrée (scripts,
+    benchmarks sans lifespan), `put()` écrit directement.
+
+    `flush` retire de la liste les événements écrits : si elle échoue en cours de
+    route, seuls les événements restants sont réessayés (pas de double comptage).
+    """
+
+    def __init__(self, flush, batch_size=100, interval=0.05, maxsize=10000):
+        self.flush = flush
+        self.batch_size = batch_size
+        self.interval = interval
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        self.batch_ready = asyncio.Event()
+        self.lock = asyncio.Lock()  # Jamais d'annulation au milieu d'une écriture
+        self.task = None
+        self.pending = []  # Sortis de la file mais pas encore écrits (dont un lot en échec)
+        self.queued_players = Counter()  # joueur -> fins de partie en file ou en attente
+
+        self.flushed_events = 0
+        self.flush_count = 0
+        self.failed_flushes = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self.total_flush_ms = 0.0
+        self.max_batch = 0
+
+    async def put(self, event):
+        if self.task is None:
+            await self.flush([event])
+            return
+        await self.queue.put(event)
+        self.queued_players[event["player_name"]] += 1
+        if self.queue.qsize() >= self.batch_size:
+            self.batch_ready.set()
+
+    def start(self):
+        self.task = asyncio.create_task(self.run())
+
+    async def close(self):
+        """Arrête la tâche de fond puis écrit tout ce qui reste en file"""
+        if self.task is not None:
+            async with self.lock:
+                self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+        while self.pending or not self.queue.empty():
+            if not await self.flush_batch():
+                remaining = len(self.pending) + self.queue.qsize()
+                print(f"❌ {remaining} fins de partie non enregistrées à l'arrêt")
+                return
+
+    async def run(self):
+        while True:
+            if not self.pending:
+                event = await self.queue.get()  # Attendre un premier événement
+                self.pending.append(event)  # Après l'attente : `pending` a pu être remplacé
+                if len(self.pending) + self.queue.qsize() < self.batch_size:
+                    try:
+                        await asyncio.wait_for(self.batch_ready.wait(), self.interval)
+                    except asyncio.TimeoutError:
+                        pass
+            self.batch_ready.clear()
+            if not await self.flush_batch():
+                await asyncio.sleep(self.interval)
+
+    async def flush_batch(self):
+        """Écrit un lot (en commençant par les événements en attente), retourne False en cas d'échec"""
+        async with self.lock:
+            # Lot détaché de `pending` : ce qui arrive pendant l'écriture attend le lot suivant
+            batch, self.pending = self.pending, []
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            if not batch:
+                return True
+
+            events = list(batch)
+            size = len(batch)
+            start = time.perf_counter()
+            try:
+                await self.flush(batch)  # Vide `batch` au fur et à mesure des écritures
+            except asyncio.CancelledError:  # Requête annulée pendant flush_player
+                self.pending = batch + self.pending
+                self.mark_written(events[:size - len(batch)])
+                raise
+            except Exception as e:
+                self.pending = batch + self.pending  # Seuls les événements non écrits sont réessayés
+                self.mark_written(events[:size - len(batch)])
+                self.failed_flushes += 1
+                print(f"Erreur lors de l'écriture des stats ({len(batch)} parties): {e}")
+                return False
+            self.mark_written(events)
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        self.flush_count += 1
+        self.last_flush_ms = duration_ms
+        self.max_flush_ms = max(self.max_flush_ms, duration_ms)
+        self.total_flush_ms += duration_ms
+        self.max_batch = max(self.max_batch, size)
+        return True
+
+    def mark_written(self, events):
+        self.flushed_events += len(events)
+        for event in events:
+            self.queued_players[event["player_name"]] -= 1
+            if not self.queued_players[event["player_name"]]:
+                del self.queued_players[event["player_name"]]
+
+    async def flush_player(self, player_name):
+        """Écrit tout de suite les fins de partie d'un joueur encore en file (et celles qui les précèdent).
+
+        Appelé avant de lire ses stats : la partie qu'il vient de finir y figure. Ne couvre
+        que la file de ce worker. Retourne False si une écriture échoue.
+        """
+        while self.queued_players[player_name]:
+            if not self.pending and self.queue.empty():
+                await asyncio.sleep(0)  # Événement sorti de la file par run(), pas encore dans pending
+                continue
+            if not await self.flush_batch():
+                return False
+        return True
+
+    def stats(self):
+        return {
+            "queue_depth": self.queue.qsize() + len(self.pending),
+            "running": self.task is not None,
+            "batch_size": self.batch_size,
+            "interval_ms": self.interval * 1000,
+            "flushed_events": self.flushed_events,
+            "flushes": self.flush_count,
+            "failed_flushes": self.failed_flushes,
+            "max_batch": self.max_batch,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+            "avg_flush_ms": round(self.total_flush_ms / self.flush_count, 3) if self.flush_count else 0.0,
+            "max_flush_ms": round(self.max_flush_ms, 3)
+        }
@@ -0,0 +1,460 @@
+import datetime
+import json
+import os
+
+# Redis keys
+ACCOUNT_PREFIX = "pendu:account:"  # Un hash par compte joueur
+LEGACY_PLAYERS_KEY = "pendu:players"  # Ancien blob JSON contenant tous les comptes
+MIGRATED_PLAYERS_KEY = "pendu:players:legacy"  # Blob conservé après migration
+MIGRATION_LOCK_KEY = "pendu:migration:lock"  # Verrou : un seul worker migre à la fois
+LEGACY_STATS_KEY = "pendu:stats"  # Ancien blob JSON contenant tous les joueurs
+MIGRATED_STATS_KEY = "pendu:stats:legacy"  # Blob conservé après migration
+STATS_INDEX_KEY = "pendu:stats:players"  # Set des joueurs ayant des stats
+PLAYER_STATS_PREFIX = "pendu:player_stats:"  # Un hash par joueur
+GAME_HISTORY_PREFIX = "pendu:game_history:"  # Une liste par joueur
+WORDS_HISTORY_PREFIX = "pendu:words_history:"  # Deux listes par joueur (won / lost)
+ROLLUPS_PREFIX = "pendu:player_rollups:"  # Agrégats par langue et difficulté, un hash par joueur
+ROLLUPS_BACKFILLED_KEY = "pendu:rollups:backfilled"
+
+# Classements, un sorted set chacun : (clé, tri décroissant ?)
+LEADERBOARDS = {
+    "wins": ("pendu:leaderboard:wins", True),
+    "winrate": ("pendu:leaderboard:winrate", True),
+    "speed": ("pendu:leaderboard:speed", False)
+}
+WINRATE_MIN_GAMES = 3
+
+# Champs qui ne vont pas dans le hash mais dans des listes dédiées, plafonnées
+HISTORY_FIELDS = ("game_history", "words_history")
+HISTORY_KINDS = ("games", "won", "lost")
+HISTORY_MAX_LENGTH = int(os.getenv("HISTORY_MAX_LENGTH", "1000"))  # Entrées conservées par liste
+
+DIFFICULTY_NAMES = ["easy", "middle", "hard"]
+
+
+def default_player_stats():
+    """Stats d'un joueur qui n'a encore jamais joué"""
+    return {
+        "games_played": 0,
+        "games_won": 0,
+        "total_words_found": 0,
+        "total_wrong_letters": 0,
+        "total_time": 0,
+        "best_time": None,
+        "longest_word": 0,
+        "difficulty_stats": {"easy": 0, "middle": 0, "hard": 0},
+        "last_played": None,
+        "current_streak": 0,
+        "best_streak": 0,
+        "difficulty_streaks": {"easy": 0, "middle": 0, "hard": 0},
+        "best_difficulty_streaks": {"easy": 0, "middle": 0, "hard": 0},
+        "achievements": [],
+        "hints_used": 0,
+        "total_hints": 0,
+        "infinite_mode_stats": {
+            "games_played": 0,
+            "best_words_found": 0,
+            "total_words_found": 0,
+            "average_words_found": 0.0,
+            "max_lives_reached": 0,
+            "total_lives_gained": 0,
+            "best_session_time": None,
+            "total_session_time": 0
+        }
+    }
+
+
+def account_key(player_name):
+    return f"{ACCOUNT_PREFIX}{player_name}"
+
+
+def player_stats_key(player_name):
+    return f"{PLAYER_STATS_PREFIX}{player_name}"
+
+
+def game_history_key(player_name):
+    return f"{GAME_HISTORY_PREFIX}{player_name}"
+
+
+def words_history_key(player_name, outcome):
+    return f"{WORDS_HISTORY_PREFIX}{player_name}:{outcome}"
+
+
+def history_key(player_name, kind):
+    """Liste d'historique : "games" (parties) ou "won"/"lost" (mots)"""
+    if kind == "games":
+        return game_history_key(player_name)
+    return words_history_key(player_name, kind)
+
+
+def append_history(pipe, player_name, kind, *entries):
+    """Ajoute des entrées en fin d'historique et ne garde que les HISTORY_MAX_LENGTH dernières"""
+    key = history_key(player_name, kind)
+    pipe.rpush(key, *[json.dumps(entry, ensure_ascii=False) for entry in entries])
+    pipe.ltrim(key, -HISTORY_MAX_LENGTH, -1)
+
+
+def rollups_key(player_name):
+    return f"{ROLLUPS_PREFIX}{player_name}"
+
+
+def rollup_field(language, difficulty, metric):
+    """Champ d'agrégat "<langue>.<difficulté>.<métrique>" (games, wins, wrong, time, hints, best_time, longest_word)"""
+    return f"{language}.{difficulty}.{metric}"
+
+
+def add_game_to_rollups(rollups, game_record):
+    """Ajoute une partie de l'historique aux agrégats (dictionnaire champ -> valeur)"""
+    language = game_record.get("language", "fr")
+    difficulty = game_record.get("difficulty", 0)
+
+    def add(metric, value):
+        field = rollup_field(language, difficulty, metric)
+        rollups[field] = rollups.get(field, 0) + value
+
+    game_time = game_record.get("game_time", 0)
+    add("games", 1)
+    add("wins", 1 if game_record.get("won") else 0)
+    add("wrong", game_record.get("wrong_letters_count", 0))
+    add("time", game_time)
+    add("hints", game_record.get("hints_used", 0))
+
+    best_time_field = rollup_field(language, difficulty, "best_time")
+    if game_record.get("won") and (best_time_field not in rollups or game_time < rollups[best_time_field]):
+        rollups[best_time_field] = game_time
+
+    longest_field = rollup_field(language, difficulty, "longest_word")
+    rollups[longest_field] = max(rollups.get(longest_field, 0), game_record.get("word_length", 0))
+
+
+def language_stats_from_rollups(rollups, language):
+    """Stats d'une langue (toutes difficultés confondues) à partir des agrégats"""
+    language_stats = {
+        "games_played": 0,
+        "games_won": 0,
+        "total_words_found": 0,
+        "total_wrong_letters": 0,
+        "total_time": 0,
+        "best_time": None,
+        "longest_word": 0,
+        "total_hints": 0,
+        "difficulty_stats": {}
+    }
+
+    for field, value in rollups.items():
+        field_language, difficulty, metric = field.split(".")
+        if field_language != language:
+            continue
+
+        if metric == "games":
+            language_stats["games_played"] += value
+            language_stats["difficulty_stats"][difficulty] = value
+        elif metric == "wins":
+            language_stats["games_won"] += value
+            language_stats["total_words_found"] += value
+        elif metric == "wrong":
+            language_stats["total_wrong_letters"] += value
+        elif metric == "time":
+            language_stats["total_time"] += value
+        elif metric == "hints":
+            language_stats["total_hints"] += value
+        elif metric == "best_time":
+            if language_stats["best_time"] is None or value < language_stats["best_time"]:
+                language_stats["best_time"] = value
+        elif metric == "longest_word":
+            language_stats["longest_word"] = max(language_stats["longest_word"], value)
+
+    return language_stats
+
+
+def encode_player_stats(player_stats):
+    """Aplatit les stats d'un joueur en champs de hash Redis.
+
+    Les dictionnaires imbriqués deviennent des champs "parent.enfant" et chaque
+    valeur est encodée en JSON, ce qui reste compatible avec HINCRBY/HINCRBYFLOAT
+    pour les compteurs numériques.
+    """
+    mapping = {}
+    for field, value in player_stats.items():
+        if field in HISTORY_FIELDS:
+            continue
+        if isinstance(value, dict):
+            for sub_field, sub_value in value.items():
+                mapping[f"{field}.{sub_field}"] = json.dumps(sub_value, ensure_ascii=False)
+        else:
+            mapping[field] = json.dumps(value, ensure_ascii=False)
+    return mapping
+
+
+def decode_player_stats(mapping):
+    """Reconstruit le dictionnaire de stats à partir d'un hash Redis"""
+    player_stats = default_player_stats()
+    for field, raw in mapping.items():
+        value = json.loads(raw)
+        if "." in field:
+            parent, sub_field = field.split(".", 1)
+            player_stats.setdefault(parent, {})[sub_field] = value
+        else:
+            player_stats[field] = value
+    return player_stats
+
+
+def leaderboard_scores(player_stats):
+    """Score du joueur dans chaque classement (None s'il n'y figure pas)"""
+    games_played = player_stats.get("games_played", 0)
+    games_won = player_stats.get("games_won", 0)
+    return {
+        "wins": games_won,
+        "winrate": games_won / games_played if games_played >= WINRATE_MIN_GAMES else None,
+        "speed": player_stats.get("best_time")
+    }
+
+
+def write_leaderboard_scores(pipe, player_name, player_stats):
+    """Ajoute au pipeline la mise à jour des classements d'un joueur"""
+    for board, score in leaderboard_scores(player_stats).items():
+        key, _ = LEADERBOARDS[board]
+        if score is None:
+            pipe.zrem(key, player_name)
+        else:
+            pipe.zadd(key, {player_name: score})
+
+
+# Records d'un hash (meilleur temps, plus long mot...) comparés et écrits côté Redis : la
+# comparaison porte sur la valeur courante, pas sur une lecture faite avant la transaction.
+# ARGV : triplets (champ, mode, opérande). "max" et "min" comparent l'opérande (nombre JSON),
+# "max_field" reprend un autre champ du hash, "ratio" écrit le quotient de deux champs "num,den".
+UPDATE_RECORDS_SCRIPT = """
+for i = 1, #ARGV, 3 do
+    local field, mode, operand = ARGV[i], ARGV[i + 1], ARGV[i + 2]
+    local current = tonumber(redis.call('HGET', KEYS[1], field))  -- nil si absent ou null
+    local value = operand
+    if mode == 'max_field' then
+        value = redis.call('HGET', KEYS[1], operand) or '0'
+    elseif mode == 'ratio' then
+        local numerator, denominator = string.match(operand, '([^,]+),([^,]+)')
+        value = string.format('%.17g', (tonumber(redis.call('HGET', KEYS[1], numerator)) or 0)
+            / math.max(tonumber(redis.call('HGET', KEYS[1], denominator)) or 1, 1))
+    end
+    local number = tonumber(value)
+    if current == nil or mode == 'ratio' or (mode == 'min' and number < current)
+            or (mode ~= 'min' and number > current) then
+        redis.call('HSET', KEYS[1], field, value)
+    end
+end
+return 1
+"""
+
+# Victoires et taux de victoire recalculés à partir des compteurs du hash, tels qu'écrits
+# KEYS : hash des stats, classement "wins", classement "winrate" ; ARGV : joueur, WINRATE_MIN_GAMES
+UPDATE_WIN_SCORES_SCRIPT = """
+local played = tonumber(redis.call('HGET', KEYS[1], 'games_played')) or 0
+local won = tonumber(redis.call('HGET', KEYS[1], 'games_won')) or 0
+redis.call('ZADD', KEYS[2], won, ARGV[1])
+if played >= tonumber(ARGV[2]) then
+    redis.call('ZADD', KEYS[3], string.format('%.17g', won / played), ARGV[1])
+else
+    redis.call('ZREM', KEYS[3], ARGV[1])
+end
+return 1
+"""
+
+
+def write_player_stats(pipe, player_name, player_stats):
+    """Ajoute au pipeline l'écriture complète des stats et de l'historique d'un joueur"""
+    key = player_stats_key(player_name)
+    pipe.delete(key, game_history_key(player_name), rollups_key(player_name),
+                words_history_key(player_name, "won"), words_history_key(player_name, "lost"))
+    pipe.hset(key, mapping=encode_player_stats(player_stats))
+    pipe.sadd(STATS_INDEX_KEY, player_name)
+    write_leaderboard_scores(pipe, player_name, player_stats)
+
+    game_history = player_stats.get("game_history") or []
+    if game_history:
+        append_history(pipe, player_name, "games", *game_history)
+
+        # Les agrégats couvrent tout l'historique importé, même la partie non conservée
+        rollups = {}
+        for game_record in game_history:
+            add_game_to_rollups(rollups, game_record)
+        pipe.hset(rollups_key(player_name), mapping={field: json.dumps(value) for field, value in rollups.items()})
+
+    words_history = player_stats.get("words_history") or {}
+    for outcome in ("won", "lost"):
+        entries = words_history.get(outcome) or []
+        if entries:
+            append_history(pipe, player_name, outcome, *entries)
+
+
+def import_stats(client, stats):
+    """Écrit un document de stats complet (format blob) sous forme de hashes par joueur.
+
+    Les agrégats sont construits à partir de tout l'historique importé : le backfill
+    (qui ne voit que l'historique plafonné) est marqué comme fait.
+    """
+    pipe = client.pipeline(transaction=False)
+    for player_name, player_stats in stats.items():
+        write_player_stats(pipe, player_name, player_stats)
+    pipe.set(ROLLUPS_BACKFILLED_KEY, datetime.datetime.now().isoformat())
+    pipe.execute()
+
+
+def rebuild_leaderboards(client):
+    """Reconstruit les classements à partir des hashes de tous les joueurs"""
+    player_names = list(client.smembers(STATS_INDEX_KEY))
+    pipe = client.pipeline(transaction=False)
+    for player_name in player_names:
+        pipe.hgetall(player_stats_key(player_name))
+    mappings = pipe.execute()
+
+    pipe = client.pipeline()
+    pipe.delete(*[key for key, _ in LEADERBOARDS.values()])
+    for player_name, mapping in zip(player_names, mappings):
+        if mapping:
+            write_leaderboard_scores(pipe, player_name, decode_player_stats(mapping))
+    pipe.execute()
+    return len(player_names)
+
+
+def backfill_rollups(client):
+    """Construit les agrégats par langue/difficulté à partir de l'historique des joueurs qui n'en ont pas.
+
+    Les agrégats existants ne sont jamais remplacés : ils couvrent tout l'historique,
+    alors que la liste ne garde que les HISTORY_MAX_LENGTH dernières parties.
+    """
+    player_names = list(client.smembers(STATS_INDEX_KEY))
+    pipe = client.pipeline(transaction=False)
+    for player_name in player_names:
+        pipe.exists(rollups_key(player_name))
+    player_names = [name for name, exists in zip(player_names, pipe.execute()) if not exists]
+
+    for player_name in player_names:
+        rollups = {}
+        for raw in client.lrange(game_history_key(player_name), 0, -1):
+            add_game_to_rollups(rollups, json.loads(raw))
+        if rollups:
+            client.hset(rollups_key(player_name), mapping={field: json.dumps(value) for field, value in rollups.items()})
+
+    client.set(ROLLUPS_BACKFILLED_KEY, datetime.datetime.now().isoformat())
+    return len(player_names)
+
+
+def import_players(client, players):
+    """Écrit les comptes `{nom: {password_hash, created_at, last_login}}`, un hash par compte.
+
+    HSETNX : un compte déjà présent dans Redis n'est jamais écrasé. Retourne le nombre
+    de comptes créés.
+    """
+    pipe = client.pipeline(transaction=False)
+    for player_name, account in players.items():
+        pipe.hsetnx(account_key(player_name), "password_hash", account["password_hash"])
+        for field in ("created_at", "last_login"):
+            if account.get(field):
+                pipe.hsetnx(account_key(player_name), field, account[field])
+    results = iter(pipe.execute())
+
+    created = 0
+    for account in players.values():
+        created += next(results)
+        for field in ("created_at", "last_login"):
+            if account.get(field):
+                next(results)
+    return created
+
+
+def migrate_players_blob(client):
+    """Migration unique de l'ancien blob `pendu:players` vers un hash par compte.
+
+    Retourne le nombre de comptes migrés (0 si rien à faire).
+    """
+    data = client.get(LEGACY_PLAYERS_KEY)
+    if not data:
+        return 0
+
+    players = json.loads(data)
+    import_players(client, players)
+    client.rename(LEGACY_PLAYERS_KEY, MIGRATED_PLAYERS_KEY)
+    return len(players)
+
+
+def migrate_stats_blob(client):
+    """Migration unique de l'ancien blob `pendu:stats` vers un hash par joueur.
+
+    Le blob est renommé après import pour que la migration ne soit jouée qu'une fois.
+    Retourne le nombre de joueurs migrés (0 si rien à faire).
+    """
+    data = client.get(LEGACY_STATS_KEY)
+    if not data:
+        return 0
+
+    stats = json.loads(data)
+    import_stats(client, stats)
+    client.rename(LEGACY_STATS_KEY, MIGRATED_STATS_KEY)
+    return len(stats)
+
+
+def migrate_json_to_redis(client, stats_file="stats.json", players_file="players.json"):
+    """Migre les données JSON existantes vers Redis si elles existent (client synchrone)"""
+    # Migrer les stats
+    if os.path.exists(stats_file):
+        try:
+            with open(stats_file, "r", encoding="utf-8") as f:
+                stats_data = json.load(f)
+
+            # Vérifier si les données n'existent pas déjà dans Redis
+            if not client.exists(STATS_INDEX_KEY) and not client.exists(LEGACY_STATS_KEY):
+                import_stats(client, stats_data)
+                print(f"✅ Migration des stats: {len(stats_data)} joueurs migrés vers Redis")
+            else:
+                print("⚠️ Stats déjà présentes dans Redis, migration ignorée")
+
+        except Exception as e:
+            print(f"❌ Erreur lors de la migration des stats: {e}")
+
+    # Migrer l'ancien blob `pendu:stats` vers un hash par joueur
+    try:
+        migrated = migrate_stats_blob(client)
+        if migrated:
+            print(f"✅ Migration du blob de stats: {migrated} joueurs migrés vers des hashes Redis")
+    except Exception as e:
+        print(f"❌ Erreur lors de la migration du blob de stats: {e}")
+
+    # Construire les classements si les stats viennent d'une version sans sorted sets
+    try:
+        if client.exists(STATS_INDEX_KEY) and not any(client.exists(key) for key, _ in LEADERBOARDS.values()):
+            count = rebuild_leaderboards(client)
+            print(f"✅ Classements reconstruits pour {count} joueurs")
+    except Exception as e:
+        print(f"❌ Erreur lors de la reconstruction des classements: {e}")
+
+    # Agrégats par langue/difficulté pour les joueurs migrés avant leur introduction
+    try:
+        if not client.exists(ROLLUPS_BACKFILLED_KEY):
+            count = backfill_rollups(client)
+            print(f"✅ Agrégats par langue construits pour {count} joueurs")
+    except Exception as e:
+        print(f"❌ Erreur lors de la construction des agrégats par langue: {e}")
+
+    # Migrer les joueurs
+    if os.path.exists(players_file):
+        try:
+            with open(players_file, "r", encoding="utf-8") as f:
+                players_data = json.load(f)
+
+            # Les comptes déjà présents dans Redis sont conservés
+            created = import_players(client, players_data)
+            if created:
+                print(f"✅ Migration des joueurs: {created} comptes migrés vers Redis")
+            else:
+                print("⚠️ Joueurs déjà présents dans Redis, migration ignorée")
+
+        except Exception as e:
+            print(f"❌ Erreur lors de la migration des joueurs: {e}")
+
+    # Migrer l'ancien blob `pendu:players` vers un hash par compte
+    try:
+        migrated = migrate_players_blob(client)
+        if migrated:
+            print(f"✅ Migration du blob de joueurs: {migrated} comptes migrés vers des hashes Redis")
+    except Exception as e:
+        print(f"❌ Erreur lors de la migration du blob de joueurs: {e}")
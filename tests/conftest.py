@@ -0,0 +1,38 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Avant l'import d'api/auth : pas de migration au démarrage, hash de mot de passe rapide
+os.environ.setdefault("MIGRATE_ON_STARTUP", "0")
+os.environ.setdefault("PASSWORD_ITERATIONS", "1000")
+os.environ.setdefault("SESSION_SECRET", "tests")
+
+import fakeredis
+
+
+@pytest.fixture
+def redis_server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def sync_redis(redis_server):
+    return fakeredis.FakeRedis(server=redis_server, decode_responses=True)
+
+
+@pytest.fixture
+def api(monkeypatch, redis_server):
+    """Module api branché sur fakeredis, parties dans Redis, file des stats neuve (non démarrée)"""
+    import api as api_module
+    from sessions import RedisGameStore
+    from stats_queue import StatsWriteBehind
+
+    client = fakeredis.FakeAsyncRedis(server=redis_server, decode_responses=True)
+    monkeypatch.setattr(api_module, "redis_client", client)
+    monkeypatch.setattr(api_module, "game_store", RedisGameStore(client))
+    monkeypatch.setattr(api_module, "stats_writer", StatsWriteBehind(api_module.write_stats_events))
+    return api_module
@@ -0,0 +1,261 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from list import normalize_word
+from storage import account_key, player_stats_key, rollup_field, rollups_key
+
+
+def run(api, scenario):
+    """Exécute `scenario(client)` avec un client HTTP asynchrone branché sur l'application"""
+    async def main():
+        transport = httpx.ASGITransport(app=api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://tests") as client:
+            return await scenario(client)
+    return asyncio.run(main())
+
+
+async def login(client, player_name, password="secret"):
+    return await client.post("/api/player/login", json={"player_name": player_name, "password": password})
+
+
+async def start(client, token, player_name="joueur", infinite=False):
+    response = await client.post("/api/game/start", json={
+        "player_name": player_name, "token": token, "difficulty": "easy", "language": "fr", "infinite": infinite
+    })
+    return response.json()["game_id"]
+
+
+def stats_event(game_time, player_name="joueur"):
+    return {
+        "player_name": player_name, "won": True, "word_length": 5, "wrong_letters_count": 0,
+        "game_time": game_time, "difficulty": 0, "hints_used": 0, "secret_word": "SUPER", "language": "fr"
+    }
+
+
+def test_concurrent_first_logins_keep_every_account(api):
+    async def scenario(client):
+        responses = await asyncio.gather(*(login(client, f"joueur {i}") for i in range(20)))
+        assert {response.status_code for response in responses} == {200}
+        return await api.redis_client.keys(account_key("*"))
+
+    assert len(run(api, scenario)) == 20
+
+
+def test_concurrent_registrations_of_one_name_create_one_account(api):
+    async def scenario(client):
+        responses = await asyncio.gather(*(login(client, "joueur", password) for password in ["aaa", "bbb", "ccc"]))
+        assert sorted(response.status_code for response in responses) == [200, 401, 401]
+        assert (await login(client, "joueur", "zzz")).status_code == 401
+
+    run(api, scenario)
+
+
+def test_login_updates_only_its_account(api):
+    async def scenario(client):
+        assert (await login(client, "alice")).json()["status"] == "registered"
+        await login(client, "bob")
+        bob_before = await api.redis_client.hgetall(account_key("bob"))
+        assert (await login(client, "alice")).json()["status"] == "logged_in"
+        assert await api.redis_client.hgetall(account_key("bob")) == bob_before
+
+    run(api, scenario)
+
+
+def test_player_with_stats_but_no_account_is_migrated(api):
+    async def scenario(client):
+        await api.redis_client.hset(player_stats_key("ancien"), "games_played", 3)
+        assert (await login(client, "ancien")).json()["status"] == "migrated"
+
+    run(api, scenario)
+
+
+def test_concurrent_winning_guesses_finish_the_game_once(api):
+    async def scenario(client):
+        token = (await login(client, "joueur")).json()["token"]
+        game_id = await start(client, token)
+        word = (await api.game_store.get(game_id))["secret_word"]
+
+        responses = await asyncio.gather(*(
+            client.post("/api/game/guess", json={"game_id": game_id, "guess": word, "token": token})
+            for _ in range(3)
+        ))
+        assert sorted(response.status_code for response in responses) == [200, 409, 409]
+
+        stats = (await client.get("/api/stats/joueur")).json()
+        assert stats["games_played"] == 1
+        assert stats["games_won"] == 1
+
+    run(api, scenario)
+
+
+def test_game_id_collision_retries_then_fails(api, monkeypatch):
+    save = api.game_store.save
+    rejected = []
+
+    async def reject(game_id, game, times):
+        if len(rejected) < times:
+            rejected.append(game_id)
+            return False
+        return await save(game_id, game)
+
+    async def scenario(client):
+        token = (await login(client, "joueur")).json()["token"]
+        monkeypatch.setattr(api.game_store, "save", lambda game_id, game: reject(game_id, game, 1))
+        game_id = await start(client, token)
+        assert len(rejected) == 1
+        assert await api.game_store.get(game_id) is not None
+
+        rejected.clear()
+        monkeypatch.setattr(api.game_store, "save", lambda game_id, game: reject(game_id, game, api.GAME_ID_ATTEMPTS))
+        response = await client.post("/api/game/start", json={
+            "player_name": "joueur", "token": token, "difficulty": "easy", "language": "fr"
+        })
+        assert response.status_code == 503
+
+    run(api, scenario)
+
+
+def test_infinite_loss_is_drawn_against_carried_lives(api):
+    async def scenario(client):
+        token = (await login(client, "joueur")).json()["token"]
+        game_id = await start(client, token, infinite=True)
+        word = (await api.game_store.get(game_id))["secret_word"]
+        response = await client.post("/api/game/guess", json={"game_id": game_id, "guess": word, "token": token})
+        assert response.json()["lives"] == response.json()["max_lives"] == 11
+
+        word = (await api.game_store.get(game_id))["secret_word"]
+        letters = [letter for letter in "abcdefghijklmnopqrstuvwxyz" if letter not in normalize_word(word.lower())]
+        for letter in letters[:11]:
+            response = await client.post("/api/game/guess", json={"game_id": game_id, "guess": letter, "token": token})
+        return response.json()
+
+    response = run(api, scenario)
+    assert response["status"] == "lost"
+    assert response["lives"] == 0
+    assert response["max_lives"] == 11
+    assert "0/11 tentatives restantes" in response["progress_art"]
+
+
+def test_stats_include_a_game_still_in_the_write_queue(api):
+    async def scenario(client):
+        api.stats_writer.start()
+        try:
+            token = (await login(client, "joueur")).json()["token"]
+            game_id = await start(client, token)
+            word = (await api.game_store.get(game_id))["secret_word"]
+            await client.post("/api/game/guess", json={"game_id": game_id, "guess": word, "token": token})
+
+            response = await client.get("/api/stats/joueur")
+            assert response.status_code == 200
+            assert response.json()["games_won"] == 1
+        finally:
+            await api.stats_writer.close()
+
+    run(api, scenario)
+
+
+def test_failed_flush_does_not_replay_written_games(api, monkeypatch):
+    write_stats_batch = api.write_stats_batch
+    calls = []
+
+    async def failing_once(events):
+        calls.append(len(events))
+        if len(calls) == 1:
+            raise ConnectionError("Redis indisponible")
+        return await write_stats_batch(events)
+
+    monkeypatch.setattr(api, "write_stats_batch", failing_once)
+
+    async def scenario():
+        writer = api.stats_writer
+        writer.pending = [stats_event(12.0), stats_event(7.0)]  # Même joueur, même transaction
+        assert not await writer.flush_batch()
+        assert await writer.flush_batch()
+        return await api.load_player_stats("joueur")
+
+    player_stats = asyncio.run(scenario())
+    assert calls == [2, 2]
+    assert player_stats["games_played"] == 2
+    assert player_stats["best_time"] == 7.0
+
+
+def test_leaderboards_written_with_counters(api):
+    async def scenario():
+        await api.write_stats_events([stats_event(12.0), stats_event(7.0), stats_event(9.0, "autre")])
+        return (await api.redis_client.zscore("pendu:leaderboard:wins", "joueur"),
+                await api.redis_client.zscore("pendu:leaderboard:speed", "joueur"))
+
+    assert asyncio.run(scenario()) == (2.0, 7.0)
+
+
+def test_concurrent_flushes_keep_the_best_records(api):
+    async def scenario():
+        await asyncio.gather(api.write_stats_batch([stats_event(7.0)]), api.write_stats_batch([stats_event(12.0)]))
+        return (await api.load_player_stats("joueur"),
+                await api.redis_client.zscore("pendu:leaderboard:speed", "joueur"),
+                await api.redis_client.hget(rollups_key("joueur"), rollup_field("fr", 0, "best_time")))
+
+    player_stats, speed, rollup_best_time = asyncio.run(scenario())
+    assert player_stats["games_played"] == 2
+    assert player_stats["best_time"] == 7.0
+    assert player_stats["best_streak"] == 2
+    assert speed == 7.0
+    assert rollup_best_time == "7.0"
+
+
+def test_winrate_computed_from_written_counters(api):
+    async def scenario():
+        await api.redis_client.hset(player_stats_key("joueur"), mapping={"games_played": 5, "games_won": 1})
+        await api.write_stats_events([stats_event(9.0)])
+        return await api.redis_client.zscore("pendu:leaderboard:winrate", "joueur")
+
+    assert asyncio.run(scenario()) == pytest.approx(2 / 6)
+
+
+def test_infinite_session_records(api):
+    def session_end(words_found, max_lives):
+        return {**stats_event(0), "won": False, "infinite_stats": {
+            "is_end_of_session": True, "words_found": words_found, "lives_gained": words_found,
+            "max_lives": max_lives, "session_time": 30.0
+        }}
+
+    async def scenario():
+        await api.write_stats_events([session_end(4, 14), session_end(2, 12)])
+        return (await api.load_player_stats("joueur"))["infinite_mode_stats"]
+
+    infinite_mode_stats = asyncio.run(scenario())
+    assert infinite_mode_stats["games_played"] == 2
+    assert infinite_mode_stats["best_words_found"] == 4
+    assert infinite_mode_stats["average_words_found"] == 3.0
+    assert infinite_mode_stats["max_lives_reached"] == 14
+    assert infinite_mode_stats["best_session_time"] == 30.0
+
+
+@pytest.mark.parametrize("message, detail", [
+    ({"type": "start", "difficulty": ["x"]}, "Invalid difficulty"),
+    ({"type": "start", "language": 3}, "Invalid language"),
+    ({"type": "guess", "guess": 5}, "Invalid guess"),
+    ({"type": "join", "game_id": 12}, "Invalid game_id"),
+    ({"type": "join", "game_id": {}}, "Invalid game_id"),
+    ({"type": "start", "infinite": "false"}, "Invalid infinite"),
+    ({"type": "guess", "guess": "e", "timeout": "no"}, "Invalid timeout"),
+    ({"type": "guess", "guess": "e", "hint": 1}, "Invalid hint"),
+    ({"type": "guess", "guess": "e", "art_id": []}, "Invalid art_id"),
+    ({"type": "guess", "guess": "e"}, "Game not found"),
+    ({"type": "inconnu"}, "Unknown message type"),
+])
+def test_websocket_rejects_malformed_messages(api, message, detail):
+    with TestClient(api.app) as client, client.websocket_connect("/ws/game") as websocket:
+        token = client.post("/api/player/login", json={"player_name": "joueur", "password": "secret"}).json()["token"]
+        websocket.send_json({"type": "auth", "token": token})
+        assert websocket.receive_json()["type"] == "auth"
+
+        websocket.send_json(message)
+        assert websocket.receive_json() == {"type": "error", "detail": detail}
+
+        # La connexion reste utilisable
+        websocket.send_json({"type": "start"})
+        assert websocket.receive_json()["type"] == "state"
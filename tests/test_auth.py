@@ -0,0 +1,68 @@
+import hashlib
+
+import auth
+from auth import (create_session_token, hash_password, verify_admin_token, verify_password,
+                  verify_session_token)
+
+
+def test_password_round_trip():
+    stored = hash_password("secret")
+    assert stored.startswith("pbkdf2_sha256$")
+    assert verify_password("secret", stored) == (True, False)
+    assert verify_password("autre", stored) == (False, False)
+
+
+def test_salt_differs_between_hashes():
+    assert hash_password("secret") != hash_password("secret")
+
+
+def test_legacy_sha256_hash_needs_rehash():
+    legacy = hashlib.sha256(b"secret").hexdigest()
+    assert verify_password("secret", legacy) == (True, True)
+    assert verify_password("autre", legacy) == (False, True)
+
+
+def test_fewer_iterations_need_rehash(monkeypatch):
+    monkeypatch.setattr(auth, "PASSWORD_ITERATIONS", 500)
+    stored = hash_password("secret")
+    monkeypatch.setattr(auth, "PASSWORD_ITERATIONS", 1000)
+    assert verify_password("secret", stored) == (True, True)
+
+
+def test_session_token_round_trip():
+    token = create_session_token("Zoé 42")
+    assert verify_session_token(token) == "Zoé 42"
+
+
+def test_tampered_token_is_rejected():
+    encoded_name, expires_at, signature = create_session_token("joueur").split(".")
+    other_name = create_session_token("autre").split(".")[0]
+    assert verify_session_token(f"{other_name}.{expires_at}.{signature}") is None
+    assert verify_session_token(f"{encoded_name}.{int(expires_at) + 1}.{signature}") is None
+
+
+def test_token_signed_with_another_secret_is_rejected(monkeypatch):
+    token = create_session_token("joueur")
+    monkeypatch.setattr(auth, "SESSION_SECRET", "autre secret")
+    assert verify_session_token(token) is None
+
+
+def test_expired_token_is_rejected(monkeypatch):
+    monkeypatch.setattr(auth, "SESSION_TTL", -1)
+    assert verify_session_token(create_session_token("joueur")) is None
+
+
+def test_malformed_tokens_are_rejected():
+    for token in ["", "abc", "a.b", "a.b.c.d", None, 5]:
+        assert verify_session_token(token) is None
+
+
+def test_admin_token(monkeypatch):
+    monkeypatch.setattr(auth, "ADMIN_TOKEN", "")
+    assert not verify_admin_token("")
+    assert not verify_admin_token("x")
+
+    monkeypatch.setattr(auth, "ADMIN_TOKEN", "admin")
+    assert verify_admin_token("admin")
+    assert not verify_admin_token("Admin")
+    assert not verify_admin_token(None)
@@ -0,0 +1,140 @@
+import pytest
+
+from engine import HangmanGame, LOST, MAX_ERRORS, PLAYING, WON
+from list import get_word_record
+
+
+def new_game(word="CHAT", difficulty="easy", infinite=False):
+    return HangmanGame.new("joueur", difficulty, "fr", get_word_record(word), infinite)
+
+
+def test_good_and_wrong_letters():
+    game = new_game()
+    assert game.play("c") == ("good_letter", "c")
+    assert game.play("z") == ("wrong_letter", "z")
+    assert game.state["lives"] == MAX_ERRORS["easy"] - 1
+    assert game.word_display() == "C___"
+    assert game.status == PLAYING
+
+
+@pytest.mark.parametrize("guess", ["1", "?", "ß"])
+def test_invalid_letter_costs_no_life(guess):
+    game = new_game()
+    outcome, _ = game.play(guess)
+    assert outcome == "invalid"
+    assert game.state["lives"] == MAX_ERRORS["easy"]
+    assert game.state["wrong_letters"] == 0
+
+
+def test_empty_and_repeated_guesses_cost_no_life():
+    game = new_game()
+    game.play("z")
+    assert game.play("  ")[0] == "empty"
+    assert game.play("z")[0] == "repeated"
+    assert game.state["lives"] == MAX_ERRORS["easy"] - 1
+
+
+def test_accented_letter_matches_normalized_word():
+    game = new_game("ÉTÉ")
+    assert game.play("e")[0] == "good_letter"
+    assert game.word_display() == "É_É"
+
+
+def test_finding_every_letter_wins():
+    game = new_game()
+    for letter in "cha":
+        game.play(letter)
+    assert game.play("t") == ("good_letter", "t")
+    assert game.status == WON
+    assert game.finished["won"] is True
+    assert game.finished["word_length"] == 4
+
+
+def test_hint_revealing_last_letter_wins():
+    game = new_game()
+    for letter in "cha":
+        game.play(letter)
+    outcome, detail = game.play("", hint_requested=True)
+    assert (outcome, detail) == ("hint", "T")
+    assert game.status == WON
+    assert game.finished["hints_used"] == 1
+    assert game.state["lives"] == MAX_ERRORS["easy"] - 1
+
+
+def test_hint_needs_a_spare_life():
+    game = new_game(difficulty="hard")
+    game.play("x")
+    game.play("y")
+    assert game.play("", hint_requested=True) == ("no_lives_for_hint", None)
+    assert game.state["found_letters"] == 0
+
+
+def test_losing_last_life_ends_game():
+    game = new_game(difficulty="hard")
+    for letter in "xyz":
+        game.play(letter)
+    assert game.status == LOST
+    assert game.finished["won"] is False
+    assert game.finished["wrong_letters_count"] == 3
+    with pytest.raises(ValueError):
+        game.play("c")
+
+
+def test_timeout_costs_a_life():
+    game = new_game()
+    assert game.play("", timeout=True) == ("timeout", None)
+    assert game.state["lives"] == MAX_ERRORS["easy"] - 1
+
+
+def test_whole_word_guess():
+    game = new_game()
+    assert game.play("chien") == ("wrong_word", "chien")
+    assert game.play("chat") == ("word_found", "chat")
+    assert game.status == WON
+
+
+def test_finished_event_only_once():
+    game = new_game()
+    game.play("chat")
+    event = game.finished
+    with pytest.raises(ValueError):
+        game.play("chat")
+    assert game.finished is event
+
+
+def test_infinite_mode_chains_words():
+    game = new_game(infinite=True)
+    game.play("chat")
+    assert game.status == WON
+    assert "infinite_stats" not in game.finished
+
+    game.next_word(get_word_record("CHIEN"))
+    assert game.status == PLAYING
+    assert game.state["lives"] == MAX_ERRORS["easy"] + 1
+    assert game.state["words_found"] == 1
+    assert game.state["max_lives_reached"] == MAX_ERRORS["easy"] + 1
+    assert game.state["max_errors"] == MAX_ERRORS["easy"] + 1
+    assert game.state["found_letters"] == game.state["wrong_letters"] == 0
+    assert game.word_display() == "_____"
+
+
+def test_infinite_session_ends_on_loss():
+    game = new_game(difficulty="hard", infinite=True)
+    game.play("chat")
+    game.next_word(get_word_record("CHIEN"))
+    for letter in "xyzw":
+        game.play(letter)
+    assert game.status == LOST
+    infinite_stats = game.finished["infinite_stats"]
+    assert infinite_stats["is_end_of_session"] is True
+    assert infinite_stats["words_found"] == 1
+    assert infinite_stats["max_lives"] == MAX_ERRORS["hard"] + 1
+    assert game.state["errors"] == game.state["max_errors"] == MAX_ERRORS["hard"] + 1
+
+
+def test_next_word_requires_won_infinite_game():
+    game = new_game()
+    game.play("chat")
+    with pytest.raises(ValueError):
+        game.next_word(get_word_record("CHIEN"))
+
@@ -0,0 +1,13 @@
+from list import letter_bit, letters_from_mask
+
+
+def test_letter_bit():
+    assert letter_bit("a") == 1
+    assert letter_bit("z") == 1 << 25
+    assert letter_bit("é") == 0
+    assert letter_bit("ab") == 0
+
+
+def test_letters_from_mask():
+    assert letters_from_mask(letter_bit("c") | letter_bit("a")) == ["a", "c"]
+    assert letters_from_mask(0) == []
@@ -0,0 +1,102 @@
+import asyncio
+
+import fakeredis
+import pytest
+
+from list import letter_bit
+from sessions import InMemoryGameStore, RedisGameStore, create_game_store, decode_game, encode_game
+
+
+def new_state():
+    return {
+        "player_name": "joueur", "secret_word": "CHAT",
+        "found_letters": letter_bit("c") | letter_bit("a"), "wrong_letters": letter_bit("z"), "difficulty": 0, "difficulty_name": "easy",
+        "language": "fr", "max_errors": 10, "lives": 9, "errors": 1, "hints_used": 0, "start_time": 1.5,
+        "status": "playing"
+    }
+
+
+def test_compact_encoding_round_trip():
+    state = new_state()
+    data = encode_game(state)
+    assert '"player_name"' not in data
+    assert decode_game(data) == state
+
+
+def test_memory_store_expires_and_evicts():
+    async def scenario():
+        store = InMemoryGameStore(ttl=0, max_games=2)
+        await store.save("a", new_state())
+        assert await store.get("a") is None
+
+        store = InMemoryGameStore(max_games=2)
+        for game_id in "abc":
+            await store.save(game_id, new_state())
+        assert await store.get("a") is None
+        assert await store.get("c") is not None
+        assert store.stats()["evicted"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_finished_game_expires_sooner():
+    async def scenario():
+        store = InMemoryGameStore(finished_ttl=0)
+        game = new_state()
+        await store.save("g", game)
+        game["status"] = "won"
+        await store.save("g", game)
+        assert await store.get("g") is None
+        assert store.stats()["expired"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_redis_store_round_trip(redis_server):
+    async def scenario():
+        store = RedisGameStore(fakeredis.FakeAsyncRedis(server=redis_server, decode_responses=True))
+        state = new_state()
+        assert await store.save("g", state)
+        assert await store.get("g") == state
+        await store.delete("g")
+        assert await store.get("g") is None
+
+    asyncio.run(scenario())
+
+
+def test_redis_store_rejects_stale_save(redis_server):
+    async def scenario():
+        store = RedisGameStore(fakeredis.FakeAsyncRedis(server=redis_server, decode_responses=True))
+        assert await store.save("g", new_state())
+
+        first, second = await store.get("g"), await store.get("g")
+        first["lives"] -= 1
+        assert await store.save("g", first)
+        second["lives"] -= 2
+        assert not await store.save("g", second)
+        assert second["version"] == 1  # Version inchangée : la requête peut relire et rejouer
+
+        saved = await store.get("g")
+        assert saved["lives"] == first["lives"]
+        assert saved["version"] == 2
+        assert store.stats()["conflicts"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_redis_store_does_not_recreate_expired_game(redis_server):
+    async def scenario():
+        client = fakeredis.FakeAsyncRedis(server=redis_server, decode_responses=True)
+        store = RedisGameStore(client)
+        await store.save("g", new_state())
+        game = await store.get("g")
+        await client.delete(store.key("g"))
+        assert not await store.save("g", game)
+        assert await store.get("g") is None
+
+    asyncio.run(scenario())
+
+
+def test_unknown_store_backend():
+    with pytest.raises(ValueError):
+        create_game_store("fichier")
@@ -0,0 +1,62 @@
+import asyncio
+
+from stats_queue import StatsWriteBehind
+
+
+def game_ends(*player_names):
+    return [{"player_name": player_name} for player_name in player_names]
+
+
+def test_put_writes_directly_until_started():
+    written = []
+
+    async def flush(events):
+        written.append(list(events))
+
+    asyncio.run(StatsWriteBehind(flush).put(*game_ends("a")))
+    assert written == [game_ends("a")]
+
+
+def test_events_are_written_in_batches():
+    written = []
+
+    async def flush(events):
+        written.append(list(events))
+
+    async def scenario():
+        writer = StatsWriteBehind(flush, batch_size=2, interval=0.01)
+        writer.start()
+        for event in game_ends(*"abcde"):
+            await writer.put(event)
+        await writer.close()
+        return writer.stats()
+
+    stats = asyncio.run(scenario())
+    assert [event for batch in written for event in batch] == game_ends(*"abcde")
+    assert all(len(batch) <= 2 for batch in written)
+    assert stats["flushed_events"] == 5
+    assert stats["queue_depth"] == 0
+
+
+def test_failed_batch_is_retried():
+    written = []
+    failures = []
+
+    async def flush(events):
+        if not failures:
+            failures.append(len(events))
+            raise ConnectionError("Redis indisponible")
+        written.extend(events)
+
+    async def scenario():
+        writer = StatsWriteBehind(flush, interval=0.01)
+        writer.start()
+        for event in game_ends("a", "b"):
+            await writer.put(event)
+        await asyncio.sleep(0.1)  # Échec, puis nouvel essai par la tâche de fond
+        await writer.close()
+        return writer.stats()
+
+    stats = asyncio.run(scenario())
+    assert written == game_ends("a", "b")
+    assert stats["failed_flushes"] == 1
@@ -0,0 +1,192 @@
+import json
+
+import pytest
+
+import storage
+from storage import (LEADERBOARDS, LEGACY_PLAYERS_KEY, LEGACY_STATS_KEY, MIGRATED_PLAYERS_KEY, MIGRATED_STATS_KEY,
+                     ROLLUPS_BACKFILLED_KEY, STATS_INDEX_KEY, account_key, add_game_to_rollups, append_history,
+                     backfill_rollups, decode_player_stats, default_player_stats, encode_player_stats,
+                     game_history_key, import_stats, language_stats_from_rollups, leaderboard_scores,
+                     migrate_json_to_redis, player_stats_key, rebuild_leaderboards, rollup_field, rollups_key)
+
+
+def game_record(game_time, won=True, language="fr", difficulty=0):
+    return {
+        "won": won, "word_length": 5, "wrong_letters_count": 1, "game_time": game_time, "difficulty": difficulty,
+        "hints_used": 0, "language": language, "secret_word": "SUPER", "date": "2024-01-01T00:00:00"
+    }
+
+
+def player_with_games(times):
+    player_stats = default_player_stats()
+    player_stats.update({
+        "games_played": len(times),
+        "games_won": len(times),
+        "best_time": min(times),
+        "game_history": [game_record(game_time) for game_time in times],
+        "words_history": {"won": [{"word": "SUPER"}], "lost": []}
+    })
+    return player_stats
+
+
+def test_encode_decode_round_trip():
+    player_stats = default_player_stats()
+    player_stats.update({"games_played": 3, "best_time": 12.5, "last_game_perfect": True})
+    player_stats["difficulty_stats"]["hard"] = 2
+    player_stats["infinite_mode_stats"]["best_session_time"] = 99.0
+
+    mapping = encode_player_stats(player_stats)
+    assert mapping["difficulty_stats.hard"] == "2"
+    assert all(field not in mapping for field in storage.HISTORY_FIELDS)
+
+    decoded = decode_player_stats(mapping)
+    for field, value in player_stats.items():
+        if field not in storage.HISTORY_FIELDS:
+            assert decoded[field] == value
+
+
+def test_decode_fills_missing_fields_with_defaults():
+    decoded = decode_player_stats({"games_played": "4"})
+    assert decoded["games_played"] == 4
+    assert decoded["games_won"] == 0
+    assert decoded["infinite_mode_stats"] == default_player_stats()["infinite_mode_stats"]
+
+
+def test_encoded_counters_accept_hincrby(sync_redis):
+    sync_redis.hset("k", mapping=encode_player_stats(default_player_stats()))
+    sync_redis.hincrby("k", "games_played", 2)
+    sync_redis.hincrbyfloat("k", "total_time", 1.5)
+    decoded = decode_player_stats(sync_redis.hgetall("k"))
+    assert decoded["games_played"] == 2
+    assert decoded["total_time"] == 1.5
+
+
+def test_winrate_needs_minimum_games():
+    assert leaderboard_scores({"games_played": 2, "games_won": 2})["winrate"] is None
+    assert leaderboard_scores({"games_played": 4, "games_won": 3})["winrate"] == 0.75
+
+
+def test_rebuild_leaderboards(sync_redis):
+    sync_redis.sadd(STATS_INDEX_KEY, "alice", "bob")
+    sync_redis.hset(player_stats_key("alice"), mapping=encode_player_stats(player_with_games([9.0, 11.0, 12.0])))
+    sync_redis.hset(player_stats_key("bob"), mapping=encode_player_stats(default_player_stats()))
+    sync_redis.zadd(LEADERBOARDS["wins"][0], {"ancien": 5})
+
+    assert rebuild_leaderboards(sync_redis) == 2
+    assert sync_redis.zrange(LEADERBOARDS["wins"][0], 0, -1, withscores=True) == [("bob", 0.0), ("alice", 3.0)]
+    assert sync_redis.zscore(LEADERBOARDS["winrate"][0], "alice") == 1.0
+    assert sync_redis.zscore(LEADERBOARDS["speed"][0], "alice") == 9.0
+    assert sync_redis.zscore(LEADERBOARDS["speed"][0], "bob") is None
+
+
+def test_language_stats_from_rollups():
+    rollups = {}
+    for record in [game_record(20.0), game_record(15.0, difficulty=2), game_record(30.0, won=False),
+                   game_record(5.0, language="en")]:
+        add_game_to_rollups(rollups, record)
+
+    language_stats = language_stats_from_rollups(rollups, "fr")
+    assert language_stats["games_played"] == 3
+    assert language_stats["games_won"] == 2
+    assert language_stats["total_wrong_letters"] == 3
+    assert language_stats["best_time"] == 15.0
+    assert language_stats["difficulty_stats"] == {"0": 2, "2": 1}
+    assert language_stats_from_rollups(rollups, "en")["games_played"] == 1
+
+
+def test_backfill_rollups_from_history(sync_redis):
+    sync_redis.sadd(STATS_INDEX_KEY, "ancien")
+    sync_redis.rpush(game_history_key("ancien"), json.dumps(game_record(20.0)), json.dumps(game_record(12.0)))
+
+    assert backfill_rollups(sync_redis) == 1
+    rollups = sync_redis.hgetall(rollups_key("ancien"))
+    assert rollups[rollup_field("fr", 0, "games")] == "2"
+    assert rollups[rollup_field("fr", 0, "best_time")] == "12.0"
+    assert sync_redis.exists(ROLLUPS_BACKFILLED_KEY)
+
+
+@pytest.fixture
+def capped_history(monkeypatch):
+    monkeypatch.setattr(storage, "HISTORY_MAX_LENGTH", 3)
+
+
+def test_history_keeps_latest_entries(sync_redis, capped_history):
+    pipe = sync_redis.pipeline()
+    append_history(pipe, "alice", "won", *[{"word": word} for word in ["UN", "DEUX", "TROIS", "QUATRE"]])
+    pipe.execute()
+    assert [json.loads(raw)["word"] for raw in sync_redis.lrange(storage.words_history_key("alice", "won"), 0, -1)] \
+        == ["DEUX", "TROIS", "QUATRE"]
+
+
+def test_stats_import_caps_history(sync_redis, capped_history):
+    import_stats(sync_redis, {"alice": player_with_games([13.0, 10.0, 20.0, 30.0, 40.0, 50.0])})
+
+    assert decode_player_stats(sync_redis.hgetall(player_stats_key("alice")))["games_played"] == 6
+    assert sync_redis.llen(game_history_key("alice")) == 3
+
+    # Agrégats calculés sur tout l'historique importé, pas sur la liste plafonnée
+    rollups = sync_redis.hgetall(rollups_key("alice"))
+    assert json.loads(rollups[rollup_field("fr", 0, "games")]) == 6
+    assert json.loads(rollups[rollup_field("fr", 0, "best_time")]) == 10.0
+
+
+def test_stats_file_import(tmp_path, sync_redis, capped_history):
+    stats_file = tmp_path / "stats.json"
+    stats_file.write_text(json.dumps({"alice": player_with_games([13.0, 10.0, 20.0, 30.0, 40.0, 50.0])}))
+
+    migrate_json_to_redis(sync_redis, str(stats_file), str(tmp_path / "absent.json"))
+    assert sync_redis.smembers(STATS_INDEX_KEY) == {"alice"}
+    assert sync_redis.zscore(LEADERBOARDS["speed"][0], "alice") == 10.0
+
+    # Le rattrapage des agrégats ne remplace pas ceux de l'import, calculés sur tout l'historique
+    rollups = sync_redis.hgetall(rollups_key("alice"))
+    assert json.loads(rollups[rollup_field("fr", 0, "games")]) == 6
+    assert json.loads(rollups[rollup_field("fr", 0, "best_time")]) == 10.0
+    assert sync_redis.exists(ROLLUPS_BACKFILLED_KEY)
+
+    # Deuxième démarrage : le fichier n'est pas réimporté
+    sync_redis.hincrby(player_stats_key("alice"), "games_played", 1)
+    migrate_json_to_redis(sync_redis, str(stats_file), str(tmp_path / "absent.json"))
+    assert decode_player_stats(sync_redis.hgetall(player_stats_key("alice")))["games_played"] == 7
+
+
+def test_stats_blob_migration(sync_redis):
+    sync_redis.set(LEGACY_STATS_KEY, json.dumps({"bob": player_with_games([8.0])}))
+
+    assert storage.migrate_stats_blob(sync_redis) == 1
+    assert not sync_redis.exists(LEGACY_STATS_KEY)
+    assert sync_redis.exists(MIGRATED_STATS_KEY)
+    assert decode_player_stats(sync_redis.hgetall(player_stats_key("bob")))["best_time"] == 8.0
+    assert storage.migrate_stats_blob(sync_redis) == 0
+
+
+def test_backfill_only_players_without_rollups(sync_redis):
+    sync_redis.sadd(STATS_INDEX_KEY, "ancien", "recent")
+    for player_name in ("ancien", "recent"):
+        sync_redis.rpush(game_history_key(player_name), json.dumps(game_record(20.0)))
+    sync_redis.hset(rollups_key("recent"), rollup_field("fr", 0, "games"), 7)
+
+    assert backfill_rollups(sync_redis) == 1
+    assert sync_redis.hget(rollups_key("ancien"), rollup_field("fr", 0, "games")) == "1"
+    assert sync_redis.hget(rollups_key("recent"), rollup_field("fr", 0, "games")) == "7"
+    assert sync_redis.exists(ROLLUPS_BACKFILLED_KEY)
+
+
+def test_players_file_and_blob_migration(tmp_path, sync_redis):
+    account = {"password_hash": "h", "created_at": "2024-01-01", "last_login": "2024-01-02"}
+    players_file = tmp_path / "players.json"
+    players_file.write_text(json.dumps({"alice": account, "bob": account}))
+    sync_redis.hset(account_key("bob"), "password_hash", "nouveau")
+    sync_redis.set(LEGACY_PLAYERS_KEY, json.dumps({"carol": account}))
+
+    migrate_json_to_redis(sync_redis, str(tmp_path / "absent.json"), str(players_file))
+
+    assert sync_redis.hgetall(account_key("alice")) == account
+    assert sync_redis.hget(account_key("bob"), "password_hash") == "nouveau"  # Jamais écrasé
+    assert sync_redis.hgetall(account_key("carol")) == account
+    assert not sync_redis.exists(LEGACY_PLAYERS_KEY)
+    assert sync_redis.exists(MIGRATED_PLAYERS_KEY)
+
+    # Deuxième démarrage : rien ne change
+    migrate_json_to_redis(sync_redis, str(tmp_path / "absent.json"), str(players_file))
+    assert sync_redis.hget(account_key("bob"), "password_hash") == "nouveau"